@@ -1,7 +1,10 @@
 """Developer activity analyzer for computing developer metrics."""
 
+import sys
 from collections import defaultdict
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 
 from github_tools.models.contribution import Contribution
 from github_tools.models.developer import Developer
@@ -11,6 +14,26 @@ from github_tools.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class RepositoryBreakdown:
+    """Per-repository contribution counts for one developer."""
+    commits: int = 0
+    pull_requests_created: int = 0
+    pull_requests_reviewed: int = 0
+    issues_created: int = 0
+    issues_resolved: int = 0
+    
+    def to_dict(self) -> Dict[str, int]:
+        """Convert counts to dictionary for serialization."""
+        return {
+            "commits": self.commits,
+            "pull_requests_created": self.pull_requests_created,
+            "pull_requests_reviewed": self.pull_requests_reviewed,
+            "issues_created": self.issues_created,
+            "issues_resolved": self.issues_resolved,
+        }
+
+
 class DeveloperMetrics:
     """
     Aggregated metrics for a developer over a time period.
@@ -40,16 +63,15 @@ class DeveloperMetrics:
         self.issues_resolved = 0
         self.code_review_participation = 0
         self.repositories_contributed: List[str] = []
-        self.per_repository_breakdown: Dict[str, Dict[str, int]] = defaultdict(
-            lambda: {
-                "commits": 0,
-                "pull_requests_created": 0,
-                "pull_requests_reviewed": 0,
-                "issues_created": 0,
-                "issues_resolved": 0,
-            }
+        self.per_repository_breakdown: Dict[str, RepositoryBreakdown] = defaultdict(
+            RepositoryBreakdown
         )
     
+    @cached_property
+    def sorted_repositories(self) -> Tuple[str, ...]:
+        """Unique repositories, sorted (computed once, after analysis)."""
+        return tuple(sorted(set(self.repositories_contributed)))
+    
     @property
     def total_contributions(self) -> int:
         """Calculate total contributions."""
@@ -84,8 +106,11 @@ class DeveloperMetrics:
             "issues_created": self.issues_created,
             "issues_resolved": self.issues_resolved,
             "code_review_participation": self.code_review_participation,
-            "repositories_contributed": sorted(set(self.repositories_contributed)),
-            "per_repository_breakdown": dict(self.per_repository_breakdown),
+            "repositories_contributed": list(self.sorted_repositories),
+            "per_repository_breakdown": {
+                repo: breakdown.to_dict()
+                for repo, breakdown in self.per_repository_breakdown.items()
+            },
             "total_contributions": self.total_contributions,
             "average_contributions_per_day": round(self.average_contributions_per_day, 2),
         }
@@ -117,9 +142,12 @@ class DeveloperAnalyzer:
             List of DeveloperMetrics instances
         """
         # Group contributions by developer
+        # Usernames and repository names repeat across many contributions and
+        # metrics; intern them so each name is stored and hashed once
+        intern = sys.intern
         dev_contributions: Dict[str, List[Contribution]] = defaultdict(list)
         for contribution in contributions:
-            dev_contributions[contribution.developer].append(contribution)
+            dev_contributions[intern(contribution.developer)].append(contribution)
         
         # If time period not provided, infer from contributions
         if not time_period and contributions:
@@ -139,37 +167,36 @@ class DeveloperAnalyzer:
         for username, dev_contribs in dev_contributions.items():
             metrics = DeveloperMetrics(username, time_period)
             
+            # Track repositories (unique, in first-seen order)
+            metrics.repositories_contributed = list(
+                dict.fromkeys(intern(c.repository) for c in dev_contribs)
+            )
+            
             for contrib in dev_contribs:
-                repo = contrib.repository
-                
-                # Track repositories
-                if repo not in metrics.repositories_contributed:
-                    metrics.repositories_contributed.append(repo)
+                repo = intern(contrib.repository)
                 
                 # Aggregate by type
                 if contrib.type == "commit":
                     metrics.total_commits += 1
-                    metrics.per_repository_breakdown[repo]["commits"] += 1
+                    metrics.per_repository_breakdown[repo].commits += 1
                 
                 elif contrib.type == "pull_request":
                     metrics.pull_requests_created += 1
-                    metrics.per_repository_breakdown[repo]["pull_requests_created"] += 1
+                    metrics.per_repository_breakdown[repo].pull_requests_created += 1
                     if contrib.state == "merged":
                         metrics.pull_requests_merged += 1
                 
                 elif contrib.type == "review":
                     metrics.pull_requests_reviewed += 1
                     metrics.code_review_participation += 1
-                    metrics.per_repository_breakdown[repo]["pull_requests_reviewed"] += 1
+                    metrics.per_repository_breakdown[repo].pull_requests_reviewed += 1
                 
                 elif contrib.type == "issue":
                     metrics.issues_created += 1
-                    metrics.per_repository_breakdown[repo]["issues_created"] += 1
+                    metrics.per_repository_breakdown[repo].issues_created += 1
                     if contrib.state == "closed":
                         metrics.issues_resolved += 1
-                        metrics.per_repository_breakdown[repo]["issues_resolved"] = (
-                            metrics.per_repository_breakdown[repo].get("issues_resolved", 0) + 1
-                        )
+                        metrics.per_repository_breakdown[repo].issues_resolved += 1
             
             metrics_list.append(metrics)
         
@@ -1,7 +1,9 @@
 """Repository-level contribution pattern analysis."""
 
+import sys
 from collections import Counter, defaultdict
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 
 from github_tools.models.contribution import Contribution
 from github_tools.models.time_period import TimePeriod
@@ -41,6 +43,11 @@ class RepositoryMetrics:
         self.trend: Optional[str] = None
         self.contribution_distribution: Dict[str, int] = {}
     
+    @cached_property
+    def sorted_contributors(self) -> Tuple[str, ...]:
+        """Contributors, sorted (computed once, after analysis)."""
+        return tuple(sorted(self.contributor_list))
+    
     @property
     def average_contributions_per_contributor(self) -> float:
         """Calculate average contributions per contributor."""
@@ -80,7 +87,7 @@ class RepositoryMetrics:
             },
             "total_contributions": self.total_contributions,
             "active_contributors": self.active_contributors,
-            "contributor_list": sorted(self.contributor_list),
+            "contributor_list": list(self.sorted_contributors),
             "commits": self.commits,
             "pull_requests": self.pull_requests,
             "issues": self.issues,
@@ -133,9 +140,12 @@ class RepositoryAnalyzer:
             raise ValueError("Time period required for analysis")
         
         # Group contributions by repository
+        # Repository names and usernames repeat across many contributions and
+        # metrics; intern them so each name is stored and hashed once
+        intern = sys.intern
         repo_contributions: Dict[str, List[Contribution]] = defaultdict(list)
         for contribution in contributions:
-            repo_contributions[contribution.repository].append(contribution)
+            repo_contributions[intern(contribution.repository)].append(contribution)
         
         # Compute metrics for each repository
         metrics_list = []
@@ -156,12 +166,13 @@ class RepositoryAnalyzer:
                     metrics.reviews += 1
             
             # Get unique contributors
-            contributors = {c.developer for c in repo_contribs}
+            contributor_names = [intern(c.developer) for c in repo_contribs]
+            contributors = set(contributor_names)
             metrics.active_contributors = len(contributors)
             metrics.contributor_list = list(contributors)
             
             # Calculate contribution distribution
-            distribution = Counter(c.developer for c in repo_contribs)
+            distribution = Counter(contributor_names)
             metrics.contribution_distribution = dict(distribution)
             
             # Calculate trend if previous period data available
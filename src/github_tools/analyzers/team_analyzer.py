@@ -1,7 +1,9 @@
 """Team and department-level contribution analysis."""
 
+import sys
 from collections import defaultdict
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 
 from github_tools.models.contribution import Contribution
 from github_tools.models.developer import Developer
@@ -42,6 +44,16 @@ class TeamMetrics:
         self.reviews = 0
         self.repositories_contributed: List[str] = []
     
+    @cached_property
+    def sorted_members(self) -> Tuple[str, ...]:
+        """Team members, sorted (computed once, after analysis)."""
+        return tuple(sorted(self.member_list))
+    
+    @cached_property
+    def sorted_repositories(self) -> Tuple[str, ...]:
+        """Unique repositories, sorted (computed once, after analysis)."""
+        return tuple(sorted(set(self.repositories_contributed)))
+    
     @property
     def average_contributions_per_member(self) -> float:
         """Calculate average contributions per team member."""
@@ -60,12 +72,12 @@ class TeamMetrics:
             },
             "total_contributions": self.total_contributions,
             "active_members": self.active_members,
-            "member_list": sorted(self.member_list),
+            "member_list": list(self.sorted_members),
             "commits": self.commits,
             "pull_requests": self.pull_requests,
             "issues": self.issues,
             "reviews": self.reviews,
-            "repositories_contributed": sorted(set(self.repositories_contributed)),
+            "repositories_contributed": list(self.sorted_repositories),
             "average_contributions_per_member": round(
                 self.average_contributions_per_member, 2
             ),
@@ -99,6 +111,16 @@ class DepartmentMetrics:
         self.teams: List[str] = []
         self.team_metrics: Dict[str, TeamMetrics] = {}
     
+    @cached_property
+    def sorted_members(self) -> Tuple[str, ...]:
+        """Department members, sorted (computed once, after analysis)."""
+        return tuple(sorted(self.member_list))
+    
+    @cached_property
+    def sorted_teams(self) -> Tuple[str, ...]:
+        """Department teams, sorted (computed once, after analysis)."""
+        return tuple(sorted(self.teams))
+    
     @property
     def average_contributions_per_member(self) -> float:
         """Calculate average contributions per department member."""
@@ -117,8 +139,8 @@ class DepartmentMetrics:
             },
             "total_contributions": self.total_contributions,
             "active_members": self.active_members,
-            "member_list": sorted(self.member_list),
-            "teams": sorted(self.teams),
+            "member_list": list(self.sorted_members),
+            "teams": list(self.sorted_teams),
             "average_contributions_per_member": round(
                 self.average_contributions_per_member, 2
             ),
@@ -168,6 +190,10 @@ class TeamAnalyzer:
         # Create developer lookup
         dev_lookup = {d.username: d for d in developers}
         
+        # Repository names and usernames repeat across many contributions and
+        # metrics; intern them so each name is stored and hashed once
+        intern = sys.intern
+        
         # Group contributions by team
         team_contributions: Dict[str, List[Contribution]] = defaultdict(list)
         for contribution in contributions:
@@ -193,17 +219,18 @@ class TeamAnalyzer:
                     metrics.issues += 1
                 elif contrib.type == "review":
                     metrics.reviews += 1
-                
-                # Track repositories
-                if contrib.repository not in metrics.repositories_contributed:
-                    metrics.repositories_contributed.append(contrib.repository)
+            
+            # Track repositories (unique, in first-seen order)
+            metrics.repositories_contributed = list(
+                dict.fromkeys(intern(c.repository) for c in team_contribs)
+            )
             
             # Get unique team members
             team_members = set()
             for contrib in team_contribs:
                 dev = dev_lookup.get(contrib.developer)
                 if dev and team_name in dev.team_affiliations:
-                    team_members.add(dev.username)
+                    team_members.add(intern(dev.username))
             
             metrics.active_members = len(team_members)
             metrics.member_list = list(team_members)
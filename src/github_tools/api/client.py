@@ -4,7 +4,6 @@ from typing import List, Optional
 from github import Github, GithubException
 from github.Organization import Organization
 from github.Repository import Repository as GHRepository
-from github.User import User as GHUser
 from github.NamedUser import NamedUser
 
 from github_tools.models.repository import Repository
@@ -2,10 +2,12 @@
 
 import json
 import random
+import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, TypeVar
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
 
 from github import GithubException
 from github_tools.utils.logging import get_logger
@@ -21,6 +23,10 @@ class RateLimiter:
     
     Handles GitHub API rate limits (5000 requests/hour for authenticated users)
     with automatic retry and checkpoint-based resumption for long-running operations.
+    
+    Also throttles request starts (``min_time``) and caps in-flight requests
+    (``max_concurrent``) via :meth:`slot`, which keeps bursts of calls below
+    GitHub's secondary (abuse) rate limits.
     """
     
     def __init__(
@@ -29,6 +35,8 @@ class RateLimiter:
         max_delay: float = 300.0,
         max_retries: int = 10,
         checkpoint_dir: Optional[Path] = None,
+        min_time: float = 0.15,
+        max_concurrent: int = 2,
     ):
         """
         Initialize rate limiter.
@@ -38,12 +46,44 @@ class RateLimiter:
             max_delay: Maximum delay in seconds
             max_retries: Maximum number of retries
             checkpoint_dir: Directory for storing checkpoints (optional)
+            min_time: Minimum delay in seconds between request starts
+            max_concurrent: Maximum number of requests in flight at once
         """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        if min_time < 0:
+            raise ValueError("min_time must be non-negative")
+        
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.max_retries = max_retries
+        self.min_time = min_time
+        self.max_concurrent = max_concurrent
         self.checkpoint_dir = checkpoint_dir or Path.home() / ".github-tools" / "checkpoints"
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+        self._start_lock = threading.Lock()
+        self._last_start = 0.0
+    
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Acquire a request slot, honouring ``max_concurrent`` and ``min_time``.
+        
+        Blocks until fewer than ``max_concurrent`` requests are in flight and at
+        least ``min_time`` seconds have passed since the previous request started.
+        
+        Yields:
+            None while the slot is held
+        """
+        with self._semaphore:
+            with self._start_lock:
+                wait_time = self._last_start + self.min_time - time.monotonic()
+                if wait_time > 0:
+                    time.sleep(wait_time)
+                self._last_start = time.monotonic()
+            yield
     
     def execute_with_retry(
         self,
@@ -249,16 +249,15 @@ def developer_report(
         logger.info("Analyzing contributions...")
         metrics = analyzer.analyze(all_contributions, developers, time_period)
         
-        # Generate report
+        # Generate and output report; files are written row by row
         logger.info("Generating report...")
-        report = report_generator.generate_developer_report(metrics, time_period, format)
-        
-        # Output report
         if output:
-            output.write_text(report)
+            with output.open("w") as fp:
+                report_generator.write_developer_report(metrics, time_period, fp, format)
             logger.info(f"Report written to {output}")
             click.echo(f"Report written to {output}", err=True)
         else:
+            report = report_generator.generate_developer_report(metrics, time_period, format)
             click.echo(report)
         
         sys.exit(0)
@@ -97,6 +97,13 @@ logger = get_logger(__name__)
     type=click.Path(path_type=Path),
     help="Output file path (default: stdout)",
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=LLMSummarizer.DEFAULT_MAX_CONCURRENCY,
+    show_default=True,
+    help="Maximum LLM requests in flight at once (1 summarizes PRs one at a time)",
+)
 @click.option(
     "--no-cache",
     is_flag=True,
@@ -118,6 +125,7 @@ def pr_summary_report(
     dimensional_analysis: bool,
     format: str,
     output: Optional[Path],
+    concurrency: int,
     no_cache: bool,
 ) -> None:
     """
@@ -180,6 +188,7 @@ def pr_summary_report(
                 provider_name=provider_name,
                 provider_config=provider_config,
                 auto_detect=(llm_provider == "auto"),
+                cache=cache,
             )
         except Exception as e:
             logger.error(f"Failed to initialize LLM provider: {e}")
@@ -187,9 +196,9 @@ def pr_summary_report(
             sys.exit(1)
         
         collector = ContributionCollector(github_client, rate_limiter, cache)
-        pr_file_collector = PRFileCollector(github_client, rate_limiter)
-        context_analyzer = ContextAnalyzer(github_client)
-        pr_collector = PRSummaryCollector(summarizer, auto_retry=True)
+        pr_file_collector = PRFileCollector(github_client, rate_limiter, cache)
+        context_analyzer = ContextAnalyzer(github_client, rate_limiter)
+        pr_collector = PRSummaryCollector(summarizer, auto_retry=True, max_concurrency=concurrency)
         report_generator = ReportGenerator()
         
         # Get organization repositories (or use specified ones)
@@ -251,6 +260,12 @@ def pr_summary_report(
         logger.info(f"Generating summaries for {len(all_contributions)} PRs...")
         summaries = []
         
+        # Fetch repository contexts concurrently up front
+        pr_repositories = {c.repository for c in all_contributions}
+        context_analyzer.prefetch_contexts(
+            repo for repo in repositories if repo in pr_repositories
+        )
+        
         for repo in repositories:
             repo_prs = [c for c in all_contributions if c.repository == repo]
             if not repo_prs:
@@ -262,24 +277,33 @@ def pr_summary_report(
             if dimensional_analysis:
                 # Generate multi-dimensional summaries
                 logger.info(f"Generating multi-dimensional analysis for {len(repo_prs)} PRs...")
+                
+                # Collect PR files first; a PR whose files can't be fetched
+                # falls back to a regular summary
+                pr_files = {}
+                file_errors = {}
                 for pr in repo_prs:
                     try:
-                        # Collect PR files
                         pr_number = pr.metadata.get("number") if pr.metadata else None
                         if pr_number:
-                            files = pr_file_collector.collect_pr_files(repo, pr_number)
+                            pr_files[pr.id] = pr_file_collector.collect_pr_files(repo, pr_number)
                         else:
                             logger.warning(f"PR {pr.id} missing number in metadata, skipping file collection")
-                            files = []
-                        
-                        # Generate dimensional analysis
-                        dimensional_result = summarizer.summarize_dimensional(
-                            pr,
-                            files,
-                            repository_context=context,
-                            use_llm=True,
-                        )
-                        
+                            pr_files[pr.id] = []
+                    except Exception as e:
+                        file_errors[pr.id] = e
+                
+                # Generate dimensional analyses with concurrent provider requests
+                dimensional_results = summarizer.summarize_dimensional_many(
+                    [(pr, pr_files[pr.id]) for pr in repo_prs if pr.id in pr_files],
+                    repository_context=context,
+                    use_llm=True,
+                    max_concurrency=concurrency,
+                )
+                
+                for pr in repo_prs:
+                    dimensional_result = file_errors.get(pr.id) or next(dimensional_results)
+                    if not isinstance(dimensional_result, Exception):
                         summary_dict = {
                             "id": pr.id,
                             "title": pr.title,
@@ -300,45 +324,47 @@ def pr_summary_report(
                                 summary_dict["merged"] = pr.metadata["merged"]
                         
                         summaries.append(summary_dict)
-                    except Exception as e:
-                        logger.warning(f"Failed to generate dimensional analysis for PR {pr.id}: {e}")
-                        # Fallback to regular summary
-                        try:
-                            regular_summary = summarizer.summarize(pr, context)
-                            summary_dict = {
-                                "id": pr.id,
-                                "title": pr.title,
-                                "repository": pr.repository,
-                                "author": pr.developer,
-                                "created_at": pr.timestamp.isoformat(),
-                                "state": pr.state,
-                                "summary": regular_summary,
-                                "provider": summarizer.provider.get_metadata().get("name"),
-                            }
-                            if pr.metadata:
-                                if "number" in pr.metadata:
-                                    summary_dict["number"] = pr.metadata["number"]
-                            summaries.append(summary_dict)
-                        except Exception as e2:
-                            logger.error(f"Failed to generate any summary for PR {pr.id}: {e2}")
-                            summaries.append({
-                                "id": pr.id,
-                                "title": pr.title,
-                                "repository": pr.repository,
-                                "author": pr.developer,
-                                "created_at": pr.timestamp.isoformat(),
-                                "state": pr.state,
-                                "summary": f"Summary unavailable: {str(e2)}",
-                                "error": True,
-                            })
+                        continue
+                    
+                    logger.warning(f"Failed to generate dimensional analysis for PR {pr.id}: {dimensional_result}")
+                    # Fallback to regular summary
+                    try:
+                        regular_summary = summarizer.summarize(pr, context)
+                        summary_dict = {
+                            "id": pr.id,
+                            "title": pr.title,
+                            "repository": pr.repository,
+                            "author": pr.developer,
+                            "created_at": pr.timestamp.isoformat(),
+                            "state": pr.state,
+                            "summary": regular_summary,
+                            "provider": summarizer.provider.get_metadata().get("name"),
+                        }
+                        if pr.metadata:
+                            if "number" in pr.metadata:
+                                summary_dict["number"] = pr.metadata["number"]
+                        summaries.append(summary_dict)
+                    except Exception as e2:
+                        logger.error(f"Failed to generate any summary for PR {pr.id}: {e2}")
+                        summaries.append({
+                            "id": pr.id,
+                            "title": pr.title,
+                            "repository": pr.repository,
+                            "author": pr.developer,
+                            "created_at": pr.timestamp.isoformat(),
+                            "state": pr.state,
+                            "summary": f"Summary unavailable: {str(e2)}",
+                            "error": True,
+                        })
             else:
                 # Generate standard summaries
-                repo_summaries = pr_collector.collect_summaries(
-                    repo_prs,
-                    time_period,
-                    repository_context=context,
+                summaries.extend(
+                    pr_collector.iter_summaries(
+                        repo_prs,
+                        time_period,
+                        repository_context=context,
+                    )
                 )
-                summaries.extend(repo_summaries)
         
         # Generate report
         logger.info("Generating report...")
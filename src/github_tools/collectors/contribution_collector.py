@@ -70,7 +70,7 @@ class ContributionCollector:
             cached = self.cache.get(cache_key)
             if cached:
                 logger.debug(f"Using cached contributions for {repository}")
-                return [Contribution(**c) for c in cached]
+                return [Contribution.from_cache(c) for c in cached]
         
         # Collect from API
         contributions = []
@@ -1,17 +1,24 @@
 """Collector for PR file changes and diffs."""
 
-from typing import List, Optional
+from dataclasses import asdict
+from itertools import islice
+from typing import Dict, List, Optional
 
 from github import GithubException
 from github.PullRequest import PullRequest
+from github.Repository import Repository as GHRepository
 
 from github_tools.summarizers.file_pattern_detector import PRFile
 from github_tools.api.client import GitHubClient
 from github_tools.api.rate_limiter import RateLimiter
+from github_tools.utils.cache import FileCache
 from github_tools.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# PR file lists are immutable for a given head SHA, so cached entries can live long
+PR_FILES_CACHE_TTL_HOURS = 24 * 30
+
 
 class PRFileCollector:
     """
@@ -28,6 +35,7 @@ class PRFileCollector:
         self,
         github_client: GitHubClient,
         rate_limiter: RateLimiter,
+        cache: Optional[FileCache] = None,
         max_files: int = 200,
     ):
         """
@@ -36,11 +44,30 @@ class PRFileCollector:
         Args:
             github_client: GitHub API client
             rate_limiter: Rate limiter for API calls
+            cache: Optional cache for PR file lists, keyed by head SHA
             max_files: Maximum number of files to process per PR (summarize if exceeded)
         """
         self.github_client = github_client
         self.rate_limiter = rate_limiter
+        self.cache = cache
         self.max_files = max_files
+        self._repos: Dict[str, GHRepository] = {}
+    
+    def _get_repo(self, repository: str) -> GHRepository:
+        """
+        Get a repository handle, reusing it across PRs of the same repository.
+        
+        Args:
+            repository: Repository full name (owner/repo)
+        
+        Returns:
+            PyGithub repository instance
+        """
+        repo = self._repos.get(repository)
+        if repo is None:
+            repo = self.github_client.github.get_repo(repository)
+            self._repos[repository] = repo
+        return repo
     
     def collect_pr_files(
         self,
@@ -60,13 +87,36 @@ class PRFileCollector:
         Raises:
             GithubException: If API call fails
         """
-        def _fetch_files():
-            repo = self.github_client.github.get_repo(repository)
-            pr = repo.get_pull(pr_number)
-            files = pr.get_files()
-            return list(files)
+        def _fetch_pull():
+            with self.rate_limiter.slot():
+                return self._get_repo(repository).get_pull(pr_number)
         
         try:
+            pr = self.rate_limiter.execute_with_retry(
+                _fetch_pull,
+                f"get_pull_{repository}_{pr_number}",
+            )
+            
+            cache = self.cache
+            if cache is not None:
+                cache_key = cache._get_cache_key(
+                    "pr_files",
+                    repository=repository,
+                    pr=pr_number,
+                    sha=pr.head.sha,
+                    max_files=self.max_files,
+                )
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    logger.debug(f"Using cached files for PR #{pr_number}")
+                    return [PRFile(**f) for f in cached]
+            
+            def _fetch_files():
+                with self.rate_limiter.slot():
+                    # Fetch one file past the limit so truncation can be detected
+                    # without paginating through the remaining pages
+                    return list(islice(pr.get_files(), self.max_files + 1))
+            
             files = self.rate_limiter.execute_with_retry(
                 _fetch_files,
                 f"collect_pr_files_{repository}_{pr_number}",
@@ -80,19 +130,26 @@ class PRFileCollector:
                     status=file.status,  # "added", "modified", "removed"
                     additions=file.additions,
                     deletions=file.deletions,
-                    patch=file.patch if hasattr(file, 'patch') else None,
-                    sha=file.sha if hasattr(file, 'sha') else None,
+                    patch=getattr(file, "patch", None),
+                    sha=getattr(file, "sha", None),
                 )
                 pr_files.append(pr_file)
             
             if len(files) > self.max_files:
                 logger.warning(
-                    f"PR #{pr_number} has {len(files)} files, "
+                    f"PR #{pr_number} has more than {self.max_files} files, "
                     f"processing first {self.max_files} files"
                 )
             
             logger.debug(f"Collected {len(pr_files)} files for PR #{pr_number}")
             
+            if cache is not None:
+                cache.set(
+                    cache_key,
+                    [asdict(f) for f in pr_files],
+                    ttl_hours=PR_FILES_CACHE_TTL_HOURS,
+                )
+            
             return pr_files
         
         except GithubException as e:
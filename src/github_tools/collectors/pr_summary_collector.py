@@ -1,6 +1,8 @@
 """Collector for PR summaries."""
 
-from typing import List, Optional
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from github_tools.models.contribution import Contribution
 from github_tools.models.time_period import TimePeriod
@@ -23,6 +25,8 @@ class PRSummaryCollector:
         self,
         summarizer: LLMSummarizer,
         auto_retry: bool = True,
+        presorted: bool = False,
+        max_concurrency: int = 1,
     ):
         """
         Initialize PR summary collector.
@@ -30,9 +34,15 @@ class PRSummaryCollector:
         Args:
             summarizer: LLM summarizer instance
             auto_retry: If True, automatically retry failed PRs with next available provider
+            presorted: If True, contributions passed in are sorted by timestamp, so the
+                time-period window is located by binary search instead of a full scan
+            max_concurrency: Maximum provider requests in flight during the first pass;
+                1 (the default) summarizes PRs one at a time
         """
         self.summarizer = summarizer
         self.auto_retry = auto_retry
+        self.presorted = presorted
+        self.max_concurrency = max_concurrency
     
     def collect_summaries(
         self,
@@ -51,57 +61,68 @@ class PRSummaryCollector:
         Returns:
             List of PR summary dictionaries
         """
-        # Filter PRs
-        prs = [
-            c for c in contributions
-            if c.type == "pull_request"
-            and time_period.start_date <= c.timestamp <= time_period.end_date
-        ]
-        
-        summaries = []
+        return list(self.iter_summaries(contributions, time_period, repository_context))
+    
+    def iter_summaries(
+        self,
+        contributions: List[Contribution],
+        time_period: TimePeriod,
+        repository_context: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """
+        Yield PR summaries for contributions in time period as they are produced.
+        
+        Successful summaries from the primary provider are yielded immediately;
+        failed PRs are retried with the next available provider after the first
+        pass, so callers can stream results without holding the full list.
+        
+        Args:
+            contributions: List of contributions
+            time_period: Time period filter
+            repository_context: Optional repository context for summarization
+        
+        Yields:
+            PR summary dictionaries
+        """
+        # Filter PRs (bounds hoisted to locals, attributes read via C-level getters)
+        start, end = time_period.start_date, time_period.end_date
+        get_type = attrgetter("type")
+        get_timestamp = attrgetter("timestamp")
+        if self.presorted:
+            lo = bisect_left(contributions, start, key=get_timestamp)
+            hi = bisect_right(contributions, end, key=get_timestamp, lo=lo)
+            prs = [c for c in contributions[lo:hi] if get_type(c) == "pull_request"]
+        else:
+            prs = [
+                c for c in contributions
+                if get_type(c) == "pull_request"
+                and start <= get_timestamp(c) <= end
+            ]
+        
         failed_prs = []  # Track failed PRs for retry
         
         # First pass: try with primary provider
-        for pr in prs:
-            try:
-                summary = self.summarizer.summarize(pr, repository_context)
-                
-                summary_dict = {
-                    "id": pr.id,
-                    "title": pr.title,
-                    "repository": pr.repository,
-                    "author": pr.developer,
-                    "created_at": pr.timestamp.isoformat(),
-                    "state": pr.state,
-                    "summary": summary,
-                    "provider": self.summarizer.provider.get_metadata().get("name"),
-                }
-                
-                # Add metadata if available
-                if pr.metadata:
-                    if "number" in pr.metadata:
-                        summary_dict["number"] = pr.metadata["number"]
-                    if "merged" in pr.metadata:
-                        summary_dict["merged"] = pr.metadata["merged"]
-                
-                summaries.append(summary_dict)
-            
-            except Exception as e:
-                logger.warning(f"Failed to summarize PR {pr.id}: {e}")
+        if self.max_concurrency > 1:
+            results = self.summarizer.summarize_many(
+                prs, repository_context, max_concurrency=self.max_concurrency
+            )
+        else:
+            results = self._summarize_each(prs, repository_context)
+        for pr, summary in zip(prs, results, strict=True):
+            if isinstance(summary, Exception):
+                logger.warning(f"Failed to summarize PR {pr.id}: {summary}")
                 if self.auto_retry:
-                    failed_prs.append((pr, e))
+                    failed_prs.append((pr, summary))
                 else:
                     # Add PR without summary immediately
-                    summaries.append({
-                        "id": pr.id,
-                        "title": pr.title,
-                        "repository": pr.repository,
-                        "author": pr.developer,
-                        "created_at": pr.timestamp.isoformat(),
-                        "state": pr.state,
-                        "summary": f"Summary unavailable: {str(e)}",
-                        "error": True,
-                    })
+                    yield self._build_error_summary(pr, summary)
+                continue
+            
+            yield self._build_summary(
+                pr,
+                summary,
+                self.summarizer.provider.get_metadata().get("name"),
+            )
         
         # Second pass: retry failed PRs with next available provider
         if failed_prs and self.auto_retry:
@@ -124,52 +145,99 @@ class PRSummaryCollector:
                             repository_context,
                             fallback_providers=next_providers,
                         )
-                        
-                        summary_dict = {
-                            "id": pr.id,
-                            "title": pr.title,
-                            "repository": pr.repository,
-                            "author": pr.developer,
-                            "created_at": pr.timestamp.isoformat(),
-                            "state": pr.state,
-                            "summary": summary,
-                            "provider": next_providers[0],
-                            "retried": True,
-                        }
-                        
-                        if pr.metadata:
-                            if "number" in pr.metadata:
-                                summary_dict["number"] = pr.metadata["number"]
-                            if "merged" in pr.metadata:
-                                summary_dict["merged"] = pr.metadata["merged"]
-                        
-                        summaries.append(summary_dict)
                     except Exception as e:
                         logger.warning(f"Failed to summarize PR {pr.id} with fallback provider: {e}")
-                        summaries.append({
-                            "id": pr.id,
-                            "title": pr.title,
-                            "repository": pr.repository,
-                            "author": pr.developer,
-                            "created_at": pr.timestamp.isoformat(),
-                            "state": pr.state,
-                            "summary": f"Summary unavailable: {str(e)}",
-                            "error": True,
-                        })
+                        yield self._build_error_summary(pr, e)
+                        continue
+                    
+                    yield self._build_summary(pr, summary, next_providers[0], retried=True)
             else:
                 # No fallback providers available - mark all as failed
                 logger.error("No fallback providers available for failed PRs")
                 for pr, original_error in failed_prs:
-                    summaries.append({
-                        "id": pr.id,
-                        "title": pr.title,
-                        "repository": pr.repository,
-                        "author": pr.developer,
-                        "created_at": pr.timestamp.isoformat(),
-                        "state": pr.state,
-                        "summary": f"Summary unavailable: {str(original_error)}",
-                        "error": True,
-                    })
-        
-        return summaries
-
+                    yield self._build_error_summary(pr, original_error)
+    
+    @staticmethod
+    def _build_summary(
+        pr: Contribution,
+        summary: str,
+        provider: Optional[str],
+        retried: bool = False,
+    ) -> dict:
+        """
+        Build a summary dictionary for a successfully summarized PR.
+        
+        Args:
+            pr: Pull request contribution
+            summary: Generated summary text
+            provider: Name of the provider that produced the summary
+            retried: Whether the summary came from a fallback retry
+        
+        Returns:
+            PR summary dictionary
+        """
+        summary_dict: Dict[str, Any] = {
+            "id": pr.id,
+            "title": pr.title,
+            "repository": pr.repository,
+            "author": pr.developer,
+            "created_at": pr.timestamp.isoformat(),
+            "state": pr.state,
+            "summary": summary,
+            "provider": provider,
+        }
+        if retried:
+            summary_dict["retried"] = True
+        
+        # Add metadata if available
+        if pr.metadata:
+            if "number" in pr.metadata:
+                summary_dict["number"] = pr.metadata["number"]
+            if "merged" in pr.metadata:
+                summary_dict["merged"] = pr.metadata["merged"]
+        
+        return summary_dict
+    
+    def _summarize_each(
+        self,
+        prs: List[Contribution],
+        repository_context: Optional[str],
+    ) -> Iterator[Union[str, Exception]]:
+        """
+        Summarize PRs one at a time with the primary provider.
+        
+        Args:
+            prs: PR contributions to summarize
+            repository_context: Optional repository context for summarization
+        
+        Yields:
+            Summary string per PR, or the exception raised while summarizing it
+        """
+        for pr in prs:
+            try:
+                yield self.summarizer.summarize(pr, repository_context)
+            except Exception as e:
+                yield e
+    
+    @staticmethod
+    def _build_error_summary(pr: Contribution, error: Exception) -> dict:
+        """
+        Build a summary dictionary for a PR that could not be summarized.
+        
+        Args:
+            pr: Pull request contribution
+            error: Error raised while summarizing
+        
+        Returns:
+            PR summary dictionary flagged with ``error``
+        """
+        return {
+            "id": pr.id,
+            "title": pr.title,
+            "repository": pr.repository,
+            "author": pr.developer,
+            "created_at": pr.timestamp.isoformat(),
+            "state": pr.state,
+            "summary": f"Summary unavailable: {str(error)}",
+            "error": True,
+        }
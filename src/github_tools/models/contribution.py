@@ -1,12 +1,19 @@
 """Contribution model for GitHub contribution analytics."""
 
 from datetime import datetime
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 ContributionType = Literal["commit", "pull_request", "review", "issue", "comment"]
 
+# Allowed states per contribution type: (label used in errors, allowed states)
+_ALLOWED_STATES: Dict[str, Tuple[str, List[str]]] = {
+    "pull_request": ("PR", ["open", "closed", "merged"]),
+    "review": ("Review", ["approved", "changes_requested", "commented"]),
+    "issue": ("Issue", ["open", "closed"]),
+}
+
 
 class Contribution(BaseModel):
     """
@@ -44,20 +51,31 @@ class Contribution(BaseModel):
     @model_validator(mode="after")
     def validate_state(self) -> "Contribution":
         """Validate state based on contribution type."""
-        if self.type == "pull_request" and self.state:
-            allowed_states = ["open", "closed", "merged"]
-            if self.state not in allowed_states:
-                raise ValueError(f"PR state must be one of {allowed_states}")
-        elif self.type == "review" and self.state:
-            allowed_states = ["approved", "changes_requested", "commented"]
-            if self.state not in allowed_states:
-                raise ValueError(f"Review state must be one of {allowed_states}")
-        elif self.type == "issue" and self.state:
-            allowed_states = ["open", "closed"]
-            if self.state not in allowed_states:
-                raise ValueError(f"Issue state must be one of {allowed_states}")
+        if self.state:
+            allowed = _ALLOWED_STATES.get(self.type)
+            if allowed and self.state not in allowed[1]:
+                raise ValueError(f"{allowed[0]} state must be one of {allowed[1]}")
         return self
     
+    @classmethod
+    def from_cache(cls, data: Dict[str, Any]) -> "Contribution":
+        """
+        Rebuild a contribution from previously validated, cached data.
+        
+        Skips validation via ``model_construct``; only use this for data that
+        was produced by ``model_dump`` of a validated instance.
+        
+        Args:
+            data: Dumped contribution fields (timestamp may be a string)
+        
+        Returns:
+            Contribution instance
+        """
+        timestamp = data["timestamp"]
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        return cls.model_construct(**{**data, "timestamp": timestamp})
+    
     class Config:
         """Pydantic configuration."""
         frozen = True  # Immutable model
@@ -1,6 +1,7 @@
 """TimePeriod model for GitHub contribution analytics."""
 
 from datetime import datetime
+from functools import cached_property
 from typing import Literal, Optional
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -31,6 +32,16 @@ class TimePeriod(BaseModel):
             raise ValueError("start_date must be <= end_date")
         return self
     
+    @cached_property
+    def iso_start(self) -> str:
+        """Start date in ISO 8601 format."""
+        return self.start_date.isoformat()
+    
+    @cached_property
+    def iso_end(self) -> str:
+        """End date in ISO 8601 format."""
+        return self.end_date.isoformat()
+    
     class Config:
         """Pydantic configuration."""
         frozen = True  # Immutable model
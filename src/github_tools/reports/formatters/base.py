@@ -0,0 +1,79 @@
+"""Base class for report formatters."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+__all__ = ["ReportFormatter", "REPORT_TYPES"]
+
+# Report types every formatter implements as format_<type>_report
+REPORT_TYPES = (
+    "developer",
+    "repository",
+    "team",
+    "department",
+    "pr_summary",
+    "anomaly",
+)
+
+
+class ReportFormatter:
+    """Base class for report formatters."""
+    
+    MAX_FORMAT_WORKERS = len(REPORT_TYPES)
+    
+    def __init__(self):
+        """Initialize formatter and bind the per-report-type dispatch table."""
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], str]] = {
+            report_type: getattr(self, f"format_{report_type}_report")
+            for report_type in REPORT_TYPES
+        }
+    
+    def format(self, report_type: str, report_data: Dict[str, Any]) -> str:
+        """
+        Format a report of the given type.
+        
+        Args:
+            report_type: Report type (e.g. "developer", "pr_summary")
+            report_data: Report data dictionary
+        
+        Returns:
+            Formatted report string
+        
+        Raises:
+            ValueError: If the report type is not supported
+        """
+        try:
+            formatter = self._dispatch[report_type]
+        except KeyError:
+            raise ValueError(f"Unsupported report type: {report_type}") from None
+        return formatter(report_data)
+    
+    def format_all(self, reports: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Format several reports concurrently.
+        
+        Each report is formatted on its own worker thread, which pays off for
+        large report bundles and for encoders that release the GIL (orjson).
+        
+        Args:
+            reports: Mapping of report type (e.g. "developer") to report data
+        
+        Returns:
+            Mapping of report type to formatted output
+        
+        Raises:
+            ValueError: If a report type is not supported
+        """
+        unknown = set(reports) - set(REPORT_TYPES)
+        if unknown:
+            raise ValueError(f"Unsupported report types: {', '.join(sorted(unknown))}")
+        if not reports:
+            return {}
+        
+        workers = min(self.MAX_FORMAT_WORKERS, len(reports))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                report_type: executor.submit(self._dispatch[report_type], report_data)
+                for report_type, report_data in reports.items()
+            }
+            return {report_type: future.result() for report_type, future in futures.items()}
@@ -1,11 +1,195 @@
 """CSV formatter for reports."""
 
-import csv
 import io
-from typing import Any, Dict, List
+import re
+from operator import itemgetter, methodcaller
+from typing import Any, Dict, Iterable, Iterator, List
 
+from github_tools.reports.formatters.base import ReportFormatter
 
-class CSVFormatter:
+# Characters that force a field to be quoted (csv.QUOTE_MINIMAL, excel dialect)
+_NEEDS_QUOTE = re.compile(r'[",\r\n]')
+
+_LINE_TERMINATOR = "\r\n"
+
+
+def _fmt_field(value: Any) -> str:
+    """
+    Format a single CSV field, quoting only when required.
+    
+    Args:
+        value: Field value
+    
+    Returns:
+        Field text as csv.writer would emit it
+    """
+    if value is None:
+        return ""
+    text = value if isinstance(value, str) else str(value)
+    if _NEEDS_QUOTE.search(text):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _format_row(fields: Iterable[Any]) -> str:
+    """
+    Format a CSV row including the line terminator.
+    
+    Args:
+        fields: Row field values
+    
+    Returns:
+        CSV line
+    """
+    return ",".join(map(_fmt_field, fields)) + _LINE_TERMINATOR
+
+
+def _encode_lines(lines: Iterable[str]) -> bytes:
+    """
+    Encode CSV lines to UTF-8 bytes without building the full string first.
+    
+    Args:
+        lines: CSV lines, including line terminators
+    
+    Returns:
+        UTF-8 encoded CSV
+    """
+    buffer = io.BytesIO()
+    wrapper = io.TextIOWrapper(buffer, encoding="utf-8", newline="", write_through=True)
+    wrapper.writelines(lines)
+    wrapper.detach()
+    return buffer.getvalue()
+
+
+def _format_rows(rows: Iterable[Iterable[Any]]) -> Iterator[str]:
+    """
+    Format many CSV rows in one call, like csv.writer.writerows.
+    
+    Args:
+        rows: Iterable of row field values
+    
+    Returns:
+        Iterator of CSV lines
+    """
+    return map(_format_row, rows)
+
+
+# Header lines are identical for every report, so format them once
+_DEVELOPER_HEADER = _format_row((
+    "username",
+    "total_commits",
+    "pull_requests_created",
+    "pull_requests_reviewed",
+    "pull_requests_merged",
+    "issues_created",
+    "issues_resolved",
+    "code_review_participation",
+    "repositories_contributed",
+))
+
+_REPOSITORY_HEADER = _format_row((
+    "repository",
+    "total_contributions",
+    "active_contributors",
+    "commits",
+    "pull_requests",
+    "issues",
+    "reviews",
+    "trend",
+))
+
+_TEAM_HEADER = _format_row((
+    "team_name",
+    "total_contributions",
+    "active_members",
+    "commits",
+    "pull_requests",
+    "issues",
+    "reviews",
+    "repositories_contributed",
+))
+
+_DEPARTMENT_HEADER = _format_row((
+    "department_name",
+    "total_contributions",
+    "active_members",
+    "teams",
+))
+
+_PR_SUMMARY_HEADER = _format_row((
+    "id",
+    "title",
+    "repository",
+    "author",
+    "created_at",
+    "state",
+    "summary",
+))
+
+_ANOMALY_HEADER = _format_row((
+    "type",
+    "entity",
+    "entity_type",
+    "severity",
+    "description",
+    "detected_at",
+    "previous_value",
+    "current_value",
+    "change_percent",
+))
+
+# Row field extractors: one C-level call per row instead of a subscript per field
+_get_developer_fields = itemgetter(
+    "username",
+    "total_commits",
+    "pull_requests_created",
+    "pull_requests_reviewed",
+    "pull_requests_merged",
+    "issues_created",
+    "issues_resolved",
+    "code_review_participation",
+)
+_get_repository_fields = itemgetter(
+    "repository",
+    "total_contributions",
+    "active_contributors",
+    "commits",
+    "pull_requests",
+    "issues",
+    "reviews",
+)
+_get_team_fields = itemgetter(
+    "team_name",
+    "total_contributions",
+    "active_members",
+    "commits",
+    "pull_requests",
+    "issues",
+    "reviews",
+)
+_get_department_fields = itemgetter(
+    "department_name",
+    "total_contributions",
+    "active_members",
+)
+_get_pr_fields = itemgetter("id", "title", "repository", "author", "created_at")
+# Optional fields, defaulting to an empty cell
+_get_trend = methodcaller("get", "trend", "")
+_get_state = methodcaller("get", "state", "")
+_get_anomaly_fields = itemgetter(
+    "type",
+    "entity",
+    "entity_type",
+    "severity",
+    "description",
+    "detected_at",
+    "previous_value",
+    "current_value",
+    "change_percent",
+)
+
+
+class CSVFormatter(ReportFormatter):
     """Formatter for CSV output format."""
     
     def format_developer_report(self, report_data: Dict[str, Any]) -> str:
@@ -18,40 +202,40 @@ class CSVFormatter:
         Returns:
             CSV string
         """
-        developers = report_data["developers"]
+        return "".join(self.stream_developer_report(report_data))
+    
+    def format_developer_report_bytes(self, report_data: Dict[str, Any]) -> bytes:
+        """
+        Format developer report as UTF-8 encoded CSV.
+        
+        Args:
+            report_data: Report data dictionary
+        
+        Returns:
+            CSV bytes
+        """
+        return _encode_lines(self.stream_developer_report(report_data))
+    
+    def stream_developer_report(self, report_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Stream developer report as CSV lines.
+        
+        Args:
+            report_data: Report data dictionary
         
-        output = io.StringIO()
-        writer = csv.writer(output)
+        Yields:
+            CSV lines, including line terminators
+        """
+        developers = report_data["developers"]
         
         # Header
-        writer.writerow([
-            "username",
-            "total_commits",
-            "pull_requests_created",
-            "pull_requests_reviewed",
-            "pull_requests_merged",
-            "issues_created",
-            "issues_resolved",
-            "code_review_participation",
-            "repositories_contributed",
-        ])
+        yield _DEVELOPER_HEADER
         
         # Data rows
-        for dev in developers:
-            repos = ",".join(dev["repositories_contributed"])
-            writer.writerow([
-                dev["username"],
-                dev["total_commits"],
-                dev["pull_requests_created"],
-                dev["pull_requests_reviewed"],
-                dev["pull_requests_merged"],
-                dev["issues_created"],
-                dev["issues_resolved"],
-                dev["code_review_participation"],
-                repos,
-            ])
-        
-        return output.getvalue()
+        yield from _format_rows(
+            (*_get_developer_fields(dev), ",".join(dev["repositories_contributed"]))
+            for dev in developers
+        )
     
     def format_repository_report(self, report_data: Dict[str, Any]) -> str:
         """
@@ -63,37 +247,40 @@ class CSVFormatter:
         Returns:
             CSV string
         """
-        repositories = report_data["repositories"]
+        return "".join(self.stream_repository_report(report_data))
+    
+    def format_repository_report_bytes(self, report_data: Dict[str, Any]) -> bytes:
+        """
+        Format repository report as UTF-8 encoded CSV.
         
-        output = io.StringIO()
-        writer = csv.writer(output)
+        Args:
+            report_data: Report data dictionary
+        
+        Returns:
+            CSV bytes
+        """
+        return _encode_lines(self.stream_repository_report(report_data))
+    
+    def stream_repository_report(self, report_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Stream repository report as CSV lines.
+        
+        Args:
+            report_data: Report data dictionary
+        
+        Yields:
+            CSV lines, including line terminators
+        """
+        repositories = report_data["repositories"]
         
         # Header
-        writer.writerow([
-            "repository",
-            "total_contributions",
-            "active_contributors",
-            "commits",
-            "pull_requests",
-            "issues",
-            "reviews",
-            "trend",
-        ])
+        yield _REPOSITORY_HEADER
         
         # Data rows
-        for repo in repositories:
-            writer.writerow([
-                repo["repository"],
-                repo["total_contributions"],
-                repo["active_contributors"],
-                repo["commits"],
-                repo["pull_requests"],
-                repo["issues"],
-                repo["reviews"],
-                repo.get("trend", ""),
-            ])
-        
-        return output.getvalue()
+        yield from _format_rows(
+            (*_get_repository_fields(repo), _get_trend(repo))
+            for repo in repositories
+        )
     
     def format_team_report(self, report_data: Dict[str, Any]) -> str:
         """
@@ -105,38 +292,40 @@ class CSVFormatter:
         Returns:
             CSV string
         """
-        teams = report_data["teams"]
+        return "".join(self.stream_team_report(report_data))
+    
+    def format_team_report_bytes(self, report_data: Dict[str, Any]) -> bytes:
+        """
+        Format team report as UTF-8 encoded CSV.
         
-        output = io.StringIO()
-        writer = csv.writer(output)
+        Args:
+            report_data: Report data dictionary
+        
+        Returns:
+            CSV bytes
+        """
+        return _encode_lines(self.stream_team_report(report_data))
+    
+    def stream_team_report(self, report_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Stream team report as CSV lines.
+        
+        Args:
+            report_data: Report data dictionary
+        
+        Yields:
+            CSV lines, including line terminators
+        """
+        teams = report_data["teams"]
         
         # Header
-        writer.writerow([
-            "team_name",
-            "total_contributions",
-            "active_members",
-            "commits",
-            "pull_requests",
-            "issues",
-            "reviews",
-            "repositories_contributed",
-        ])
+        yield _TEAM_HEADER
         
         # Data rows
-        for team in teams:
-            repos = ",".join(team["repositories_contributed"])
-            writer.writerow([
-                team["team_name"],
-                team["total_contributions"],
-                team["active_members"],
-                team["commits"],
-                team["pull_requests"],
-                team["issues"],
-                team["reviews"],
-                repos,
-            ])
-        
-        return output.getvalue()
+        yield from _format_rows(
+            (*_get_team_fields(team), ",".join(team["repositories_contributed"]))
+            for team in teams
+        )
     
     def format_department_report(self, report_data: Dict[str, Any]) -> str:
         """
@@ -148,30 +337,40 @@ class CSVFormatter:
         Returns:
             CSV string
         """
-        departments = report_data["departments"]
+        return "".join(self.stream_department_report(report_data))
+    
+    def format_department_report_bytes(self, report_data: Dict[str, Any]) -> bytes:
+        """
+        Format department report as UTF-8 encoded CSV.
         
-        output = io.StringIO()
-        writer = csv.writer(output)
+        Args:
+            report_data: Report data dictionary
+        
+        Returns:
+            CSV bytes
+        """
+        return _encode_lines(self.stream_department_report(report_data))
+    
+    def stream_department_report(self, report_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Stream department report as CSV lines.
+        
+        Args:
+            report_data: Report data dictionary
+        
+        Yields:
+            CSV lines, including line terminators
+        """
+        departments = report_data["departments"]
         
         # Header
-        writer.writerow([
-            "department_name",
-            "total_contributions",
-            "active_members",
-            "teams",
-        ])
+        yield _DEPARTMENT_HEADER
         
         # Data rows
-        for dept in departments:
-            teams_str = ",".join(dept["teams"])
-            writer.writerow([
-                dept["department_name"],
-                dept["total_contributions"],
-                dept["active_members"],
-                teams_str,
-            ])
-        
-        return output.getvalue()
+        yield from _format_rows(
+            (*_get_department_fields(dept), ",".join(dept["teams"]))
+            for dept in departments
+        )
     
     def format_pr_summary_report(self, report_data: Dict[str, Any]) -> str:
         """
@@ -183,35 +382,40 @@ class CSVFormatter:
         Returns:
             CSV string
         """
-        prs = report_data["pull_requests"]
+        return "".join(self.stream_pr_summary_report(report_data))
+    
+    def format_pr_summary_report_bytes(self, report_data: Dict[str, Any]) -> bytes:
+        """
+        Format PR summary report as UTF-8 encoded CSV.
+        
+        Args:
+            report_data: Report data dictionary
         
-        output = io.StringIO()
-        writer = csv.writer(output)
+        Returns:
+            CSV bytes
+        """
+        return _encode_lines(self.stream_pr_summary_report(report_data))
+    
+    def stream_pr_summary_report(self, report_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Stream PR summary report as CSV lines.
+        
+        Args:
+            report_data: Report data dictionary
+        
+        Yields:
+            CSV lines, including line terminators
+        """
+        prs = report_data["pull_requests"]
         
         # Header
-        writer.writerow([
-            "id",
-            "title",
-            "repository",
-            "author",
-            "created_at",
-            "state",
-            "summary",
-        ])
+        yield _PR_SUMMARY_HEADER
         
         # Data rows
-        for pr in prs:
-            writer.writerow([
-                pr["id"],
-                pr["title"],
-                pr["repository"],
-                pr["author"],
-                pr["created_at"],
-                pr.get("state", ""),
-                pr["summary"],
-            ])
-        
-        return output.getvalue()
+        yield from _format_rows(
+            (*_get_pr_fields(pr), _get_state(pr), pr["summary"])
+            for pr in prs
+        )
     
     def format_anomaly_report(self, report_data: Dict[str, Any]) -> str:
         """
@@ -223,37 +427,35 @@ class CSVFormatter:
         Returns:
             CSV string
         """
-        anomalies = report_data["anomalies"]
+        return "".join(self.stream_anomaly_report(report_data))
+    
+    def format_anomaly_report_bytes(self, report_data: Dict[str, Any]) -> bytes:
+        """
+        Format anomaly report as UTF-8 encoded CSV.
+        
+        Args:
+            report_data: Report data dictionary
         
-        output = io.StringIO()
-        writer = csv.writer(output)
+        Returns:
+            CSV bytes
+        """
+        return _encode_lines(self.stream_anomaly_report(report_data))
+    
+    def stream_anomaly_report(self, report_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Stream anomaly report as CSV lines.
+        
+        Args:
+            report_data: Report data dictionary
+        
+        Yields:
+            CSV lines, including line terminators
+        """
+        anomalies = report_data["anomalies"]
         
         # Header
-        writer.writerow([
-            "type",
-            "entity",
-            "entity_type",
-            "severity",
-            "description",
-            "detected_at",
-            "previous_value",
-            "current_value",
-            "change_percent",
-        ])
+        yield _ANOMALY_HEADER
         
         # Data rows
-        for anomaly in anomalies:
-            writer.writerow([
-                anomaly["type"],
-                anomaly["entity"],
-                anomaly["entity_type"],
-                anomaly["severity"],
-                anomaly["description"],
-                anomaly["detected_at"],
-                anomaly["previous_value"],
-                anomaly["current_value"],
-                anomaly["change_percent"],
-            ])
-        
-        return output.getvalue()
+        yield from _format_rows(map(_get_anomaly_fields, anomalies))
 
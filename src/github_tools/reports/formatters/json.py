@@ -1,27 +1,69 @@
 """JSON formatter for reports."""
 
 import json
-from typing import Any, Dict
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, TextIO
 
+from github_tools.reports.formatters.base import ReportFormatter
 
-class JSONFormatter:
+# orjson support - optional, much faster and serializes datetimes natively
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def _default(value: Any) -> Any:
+    """Serialize datetimes for the stdlib encoder, matching orjson's native output."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(data: Any, pretty: bool = False) -> str:
+    """
+    Serialize data to a JSON string.
+    
+    Uses orjson when installed and falls back to the stdlib encoder.
+    Datetimes are emitted in ISO 8601 format either way; report builders
+    already store them as ISO strings, so no per-value fallback is needed.
+    
+    Args:
+        data: JSON-compatible data (datetimes allowed)
+        pretty: Indent the output by two spaces instead of emitting compact JSON
+    
+    Returns:
+        JSON string
+    
+    Raises:
+        TypeError: If data contains a value that is not JSON serializable
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option).decode("utf-8")
+    if pretty:
+        return json.dumps(data, indent=2, default=_default)
+    return json.dumps(data, separators=(",", ":"), default=_default)
+
+
+class JSONFormatter(ReportFormatter):
     """Formatter for JSON output format."""
     
-    def format_developer_report(self, report_data: Dict[str, Any]) -> str:
+    def __init__(self, pretty: bool = False):
         """
-        Format developer report as JSON.
+        Initialize JSON formatter.
         
         Args:
-            report_data: Report data dictionary
-        
-        Returns:
-            JSON string
+            pretty: Indent output for human readers (compact by default)
         """
-        return json.dumps(report_data, indent=2, default=str)
+        super().__init__()
+        self.pretty = pretty
     
-    def format_repository_report(self, report_data: Dict[str, Any]) -> str:
+    def _dump(self, report_data: Dict[str, Any]) -> str:
         """
-        Format repository report as JSON.
+        Format a report as JSON.
         
         Args:
             report_data: Report data dictionary
@@ -29,53 +71,74 @@ class JSONFormatter:
         Returns:
             JSON string
         """
-        return json.dumps(report_data, indent=2, default=str)
+        return dumps(report_data, pretty=self.pretty)
     
-    def format_team_report(self, report_data: Dict[str, Any]) -> str:
+    def write(self, report_data: Dict[str, Any], fp: TextIO) -> None:
         """
-        Format team report as JSON.
+        Write a report as JSON to a text file.
         
-        Args:
-            report_data: Report data dictionary
-        
-        Returns:
-            JSON string
-        """
-        return json.dumps(report_data, indent=2, default=str)
-    
-    def format_department_report(self, report_data: Dict[str, Any]) -> str:
-        """
-        Format department report as JSON.
+        Top-level values that are iterators (such as the developer rows from
+        ReportGenerator.write_developer_report) are written one element at a
+        time, so the full array is never held in memory. The text written is
+        identical to format_*_report on the same data with lists in place of
+        the iterators.
         
         Args:
-            report_data: Report data dictionary
+            report_data: Report data dictionary; top-level values may be iterators
+            fp: Text file to write to
         
-        Returns:
-            JSON string
+        Raises:
+            TypeError: If the report contains a value that is not JSON serializable
         """
-        return json.dumps(report_data, indent=2, default=str)
+        pretty = self.pretty
+        fp.write("{")
+        for index, (key, value) in enumerate(report_data.items()):
+            if index:
+                fp.write(",")
+            if pretty:
+                fp.write("\n  ")
+            fp.write(dumps(key))
+            fp.write(": " if pretty else ":")
+            if isinstance(value, Iterator):
+                self._write_array(value, fp)
+            elif pretty:
+                # Nest the pretty-printed value one level; JSON strings never
+                # contain raw newlines, so only layout newlines are indented
+                fp.write(dumps(value, pretty=True).replace("\n", "\n  "))
+            else:
+                fp.write(dumps(value))
+        if pretty and report_data:
+            fp.write("\n")
+        fp.write("}")
     
-    def format_pr_summary_report(self, report_data: Dict[str, Any]) -> str:
+    def _write_array(self, items: Iterable[Any], fp: TextIO) -> None:
         """
-        Format PR summary report as JSON.
+        Write items as a JSON array nested one level inside the report object.
         
         Args:
-            report_data: Report data dictionary
-        
-        Returns:
-            JSON string
+            items: Array elements, consumed once
+            fp: Text file to write to
         """
-        return json.dumps(report_data, indent=2, default=str)
+        pretty = self.pretty
+        fp.write("[")
+        empty = True
+        for item in items:
+            if not empty:
+                fp.write(",")
+            empty = False
+            if pretty:
+                fp.write("\n    ")
+                fp.write(dumps(item, pretty=True).replace("\n", "\n    "))
+            else:
+                fp.write(dumps(item))
+        if pretty and not empty:
+            fp.write("\n  ")
+        fp.write("]")
     
-    def format_anomaly_report(self, report_data: Dict[str, Any]) -> str:
-        """
-        Format anomaly report as JSON.
-        
-        Args:
-            report_data: Report data dictionary
-        
-        Returns:
-            JSON string
-        """
-        return json.dumps(report_data, indent=2, default=str)
-
+    # Every report type serializes the same way
+    format_developer_report = _dump
+    format_repository_report = _dump
+    format_team_report = _dump
+    format_department_report = _dump
+    format_pr_summary_report = _dump
+    format_anomaly_report = _dump
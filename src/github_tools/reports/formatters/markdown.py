@@ -1,9 +1,75 @@
 """Markdown formatter for reports."""
 
-from typing import Any, Dict
+import heapq
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Tuple
 
+from github_tools.reports.formatters.base import ReportFormatter
 
-class MarkdownFormatter:
+# Table header and separator rows, shared by every report of a kind
+_DEVELOPER_TABLE_HEADER: Tuple[str, str] = (
+    "| Username | Commits | PRs Created | PRs Reviewed | "
+    "PRs Merged | Issues Created | Issues Resolved | Repositories |",
+    "|----------|---------|-------------|--------------|"
+    "------------|----------------|-----------------|--------------|",
+)
+_REPOSITORY_TABLE_HEADER: Tuple[str, str] = (
+    "| Repository | Contributions | Contributors | Commits | "
+    "PRs | Issues | Reviews | Trend |",
+    "|-----------|---------------|--------------|---------|"
+    "-----|--------|---------|-------|",
+)
+_TEAM_TABLE_HEADER: Tuple[str, str] = (
+    "| Team | Contributions | Members | Commits | "
+    "PRs | Issues | Reviews | Repositories |",
+    "|------|---------------|---------|---------|"
+    "-----|--------|---------|--------------|",
+)
+_DEPARTMENT_TABLE_HEADER: Tuple[str, str] = (
+    "| Department | Contributions | Members | Teams |",
+    "|------------|---------------|---------|-------|",
+)
+
+# Table row templates and the fields that fill them (the trailing list column is
+# joined separately)
+_DEVELOPER_ROW = "| %s | %s | %s | %s | %s | %s | %s | %s |"
+_get_developer_fields = itemgetter(
+    "username",
+    "total_commits",
+    "pull_requests_created",
+    "pull_requests_reviewed",
+    "pull_requests_merged",
+    "issues_created",
+    "issues_resolved",
+)
+_REPOSITORY_ROW = "| %s | %s | %s | %s | %s | %s | %s | %s |"
+_get_repository_fields = itemgetter(
+    "repository",
+    "total_contributions",
+    "active_contributors",
+    "commits",
+    "pull_requests",
+    "issues",
+    "reviews",
+)
+_TEAM_ROW = "| %s | %s | %s | %s | %s | %s | %s | %s |"
+_get_team_fields = itemgetter(
+    "team_name",
+    "total_contributions",
+    "active_members",
+    "commits",
+    "pull_requests",
+    "issues",
+    "reviews",
+)
+_DEPARTMENT_ROW = "| %s | %s | %s | %s |"
+_get_department_fields = itemgetter(
+    "department_name",
+    "total_contributions",
+    "active_members",
+)
+
+class MarkdownFormatter(ReportFormatter):
     """Formatter for Markdown output format."""
     
     @staticmethod
@@ -23,9 +89,7 @@ class MarkdownFormatter:
         if 'dimensions' in pr or 'formatted' in pr:
             # Use formatted multi-dimensional summary if available
             if 'formatted' in pr and pr['formatted']:
-                formatted_lines = pr['formatted'].split('\n')
-                for line in formatted_lines:
-                    lines.append(line)
+                lines.extend(pr['formatted'].split('\n'))
             elif 'dimensions' in pr:
                 # Format dimensions manually
                 lines.append(f"* Summary: {pr.get('summary', pr['title'])}")
@@ -78,216 +142,78 @@ class MarkdownFormatter:
         Returns:
             Markdown string
         """
-        metadata = report_data["metadata"]
-        summary = report_data["summary"]
-        developers = report_data["developers"]
-        
-        lines = []
-        
-        # Header
-        lines.append("# Developer Activity Report")
-        lines.append("")
-        
-        # Metadata
-        period = metadata["period"]
-        lines.append(f"**Period**: {period['start_date']} to {period['end_date']}")
-        lines.append(f"**Generated**: {metadata['generated_at']}")
-        lines.append(f"**Tool Version**: {metadata['tool_version']}")
-        lines.append("")
-        
-        # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- Total Developers: {summary['total_developers']}")
-        lines.append(f"- Total Contributions: {summary['total_contributions']}")
-        lines.append("")
-        
-        # Developers table
-        lines.append("## Developers")
-        lines.append("")
-        lines.append(
-            "| Username | Commits | PRs Created | PRs Reviewed | "
-            "PRs Merged | Issues Created | Issues Resolved | Repositories |"
-        )
-        lines.append(
-            "|----------|---------|-------------|--------------|"
-            "------------|----------------|-----------------|--------------|"
-        )
-        
-        for dev in developers:
-            repos = ", ".join(dev["repositories_contributed"])
-            lines.append(
-                f"| {dev['username']} | "
-                f"{dev['total_commits']} | "
-                f"{dev['pull_requests_created']} | "
-                f"{dev['pull_requests_reviewed']} | "
-                f"{dev['pull_requests_merged']} | "
-                f"{dev['issues_created']} | "
-                f"{dev['issues_resolved']} | "
-                f"{repos} |"
-            )
-        
-        lines.append("")
-        
-        # Per-repository breakdown (if available)
-        has_breakdown = any("per_repository_breakdown" in dev for dev in developers)
-        if has_breakdown:
-            lines.append("## Per-Repository Breakdown")
-            lines.append("")
-            for dev in developers:
-                if "per_repository_breakdown" in dev:
-                    lines.append(f"### {dev['username']}")
-                    lines.append("")
-                    for repo, breakdown in dev["per_repository_breakdown"].items():
-                        lines.append(f"**{repo}**:")
-                        lines.append(f"- Commits: {breakdown.get('commits', 0)}")
-                        lines.append(
-                            f"- PRs Created: {breakdown.get('pull_requests_created', 0)}"
-                        )
-                        lines.append(
-                            f"- PRs Reviewed: {breakdown.get('pull_requests_reviewed', 0)}"
-                        )
-                        lines.append("")
-        
-        return "\n".join(lines)
+        return "\n".join(self.stream_developer_report(report_data))
     
-    def format_anomaly_report(self, report_data: Dict[str, Any]) -> str:
+    def stream_developer_report(self, report_data: Dict[str, Any]) -> Iterator[str]:
         """
-        Format anomaly report as Markdown.
+        Stream developer report as Markdown lines.
         
         Args:
             report_data: Report data dictionary
         
-        Returns:
-            Markdown string
+        Yields:
+            Markdown lines, without line terminators
         """
         metadata = report_data["metadata"]
         summary = report_data["summary"]
-        anomalies = report_data["anomalies"]
-        by_severity = report_data.get("by_severity", {})
-        
-        lines = []
-        
-        # Header
-        lines.append("# Anomaly Detection Report")
-        lines.append("")
-        
-        # Metadata
-        period = metadata["period"]
-        lines.append(f"**Period**: {period['start_date']} to {period['end_date']}")
-        lines.append(f"**Generated**: {metadata['generated_at']}")
-        lines.append(f"**Tool Version**: {metadata['tool_version']}")
-        lines.append("")
-        
-        # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- Total Anomalies: {summary['total_anomalies']}")
-        if "by_severity" in summary:
-            lines.append("")
-            lines.append("**By Severity:**")
-            for severity, count in sorted(summary["by_severity"].items()):
-                lines.append(f"- {severity.capitalize()}: {count}")
-        lines.append("")
-        
-        # Group by severity
-        if by_severity:
-            for severity in ["critical", "high", "medium", "low"]:
-                if severity in by_severity and by_severity[severity]:
-                    lines.append(f"## {severity.capitalize()} Severity Anomalies")
-                    lines.append("")
-                    
-                    for anomaly in by_severity[severity]:
-                        lines.append(f"### {anomaly['entity']} ({anomaly['entity_type']})")
-                        lines.append("")
-                        lines.append(f"**Type**: {anomaly['type']}")
-                        lines.append(f"**Description**: {anomaly['description']}")
-                        lines.append(f"**Change**: {anomaly['change_percent']:.1f}% ({anomaly['previous_value']} -> {anomaly['current_value']})")
-                        lines.append(f"**Detected**: {anomaly['detected_at']}")
-                        lines.append("")
-        else:
-            # List all anomalies
-            lines.append("## Anomalies")
-            lines.append("")
-            for anomaly in anomalies:
-                lines.append(f"### {anomaly['entity']} ({anomaly['entity_type']})")
-                lines.append("")
-                lines.append(f"**Type**: {anomaly['type']} | **Severity**: {anomaly['severity']}")
-                lines.append(f"**Description**: {anomaly['description']}")
-                lines.append(f"**Change**: {anomaly['change_percent']:.1f}% ({anomaly['previous_value']} -> {anomaly['current_value']})")
-                lines.append("")
-        
-        return "\n".join(lines)
-    
-    def format_pr_summary_report(self, report_data: Dict[str, Any]) -> str:
-        """
-        Format PR summary report as Markdown.
-        
-        Args:
-            report_data: Report data dictionary
-        
-        Returns:
-            Markdown string
-        """
-        metadata = report_data["metadata"]
-        summary = report_data["summary"]
-        prs = report_data["pull_requests"]
-        by_repo = report_data.get("by_repository", {})
-        
-        lines = []
+        developers = report_data["developers"]
         
         # Header
-        lines.append("# Pull Request Summary Report")
-        lines.append("")
+        yield "# Developer Activity Report"
+        yield ""
         
         # Metadata
         period = metadata["period"]
-        lines.append(f"**Period**: {period['start_date']} to {period['end_date']}")
-        lines.append(f"**Generated**: {metadata['generated_at']}")
-        lines.append(f"**Tool Version**: {metadata['tool_version']}")
-        lines.append("")
+        yield f"**Period**: {period['start_date']} to {period['end_date']}"
+        yield f"**Generated**: {metadata['generated_at']}"
+        yield f"**Tool Version**: {metadata['tool_version']}"
+        yield ""
         
         # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- Total PRs: {summary['total_prs']}")
-        lines.append(f"- Repositories: {summary['repositories']}")
-        lines.append("")
+        yield "## Summary"
+        yield ""
+        yield f"- Total Developers: {summary['total_developers']}"
+        yield f"- Total Contributions: {summary['total_contributions']}"
+        yield ""
         
-        # Group by repository
-        if by_repo:
-            for repo_name, repo_prs in sorted(by_repo.items()):
-                lines.append(f"## {repo_name}")
-                lines.append("")
-                
-                for pr in repo_prs:
-                    pr_id = pr.get('id', pr.get('number', ''))
-                    title_suffix = f" (#{pr_id})" if pr_id else ""
-                    lines.append(f"### {pr['title']}{title_suffix}")
-                    lines.append("")
-                    lines.append(f"**Author**: {pr['author']} | **Created**: {pr['created_at']} | **State**: {pr.get('state', 'unknown')}")
-                    lines.append("")
-                    lines.extend(self._format_pr_with_dimensions(pr))
-                    lines.append("")
-        else:
-            # List all PRs
-            lines.append("## Pull Requests")
-            lines.append("")
-            for pr in prs:
-                pr_id = pr.get('id', pr.get('number', ''))
-                title_suffix = f" (#{pr_id})" if pr_id else ""
-                lines.append(f"### {pr['title']}{title_suffix} ({pr['repository']})")
-                lines.append("")
-                lines.append(f"**Author**: {pr['author']} | **Created**: {pr['created_at']} | **State**: {pr.get('state', 'unknown')}")
-                lines.append("")
-                lines.extend(self._format_pr_with_dimensions(pr))
-                lines.append("")
+        # Developers table
+        yield "## Developers"
+        yield ""
+        yield from _DEVELOPER_TABLE_HEADER
+        
+        # Report data from ReportGenerator says up front whether any developer
+        # has a breakdown; without the flag every row is probed
+        check_breakdown = metadata.get("has_per_repository_breakdown", True)
+        breakdown_lines: List[str] = []
+        add_breakdown = breakdown_lines.append
+        for dev in developers:
+            repos = ", ".join(dev["repositories_contributed"])
+            yield _DEVELOPER_ROW % (*_get_developer_fields(dev), repos)
+            if check_breakdown and "per_repository_breakdown" in dev:
+                add_breakdown(f"### {dev['username']}")
+                add_breakdown("")
+                for repo, breakdown in dev["per_repository_breakdown"].items():
+                    add_breakdown(f"**{repo}**:")
+                    add_breakdown(f"- Commits: {breakdown.get('commits', 0)}")
+                    add_breakdown(
+                        f"- PRs Created: {breakdown.get('pull_requests_created', 0)}"
+                    )
+                    add_breakdown(
+                        f"- PRs Reviewed: {breakdown.get('pull_requests_reviewed', 0)}"
+                    )
+                    add_breakdown("")
+        
+        yield ""
         
-        return "\n".join(lines)
+        # Per-repository breakdown (if available)
+        if breakdown_lines:
+            yield "## Per-Repository Breakdown"
+            yield ""
+            yield from breakdown_lines
     
-    def format_anomaly_report(self, report_data: Dict[str, Any]) -> str:
+    def format_repository_report(self, report_data: Dict[str, Any]) -> str:
         """
-        Format anomaly report as Markdown.
+        Format repository report as Markdown.
         
         Args:
             report_data: Report data dictionary
@@ -295,282 +221,73 @@ class MarkdownFormatter:
         Returns:
             Markdown string
         """
-        metadata = report_data["metadata"]
-        summary = report_data["summary"]
-        anomalies = report_data["anomalies"]
-        by_severity = report_data.get("by_severity", {})
-        
-        lines = []
-        
-        # Header
-        lines.append("# Anomaly Detection Report")
-        lines.append("")
-        
-        # Metadata
-        period = metadata["period"]
-        lines.append(f"**Period**: {period['start_date']} to {period['end_date']}")
-        lines.append(f"**Generated**: {metadata['generated_at']}")
-        lines.append(f"**Tool Version**: {metadata['tool_version']}")
-        lines.append("")
-        
-        # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- Total Anomalies: {summary['total_anomalies']}")
-        if "by_severity" in summary:
-            lines.append("")
-            lines.append("**By Severity:**")
-            for severity, count in sorted(summary["by_severity"].items()):
-                lines.append(f"- {severity.capitalize()}: {count}")
-        lines.append("")
-        
-        # Group by severity
-        if by_severity:
-            for severity in ["critical", "high", "medium", "low"]:
-                if severity in by_severity and by_severity[severity]:
-                    lines.append(f"## {severity.capitalize()} Severity Anomalies")
-                    lines.append("")
-                    
-                    for anomaly in by_severity[severity]:
-                        lines.append(f"### {anomaly['entity']} ({anomaly['entity_type']})")
-                        lines.append("")
-                        lines.append(f"**Type**: {anomaly['type']}")
-                        lines.append(f"**Description**: {anomaly['description']}")
-                        lines.append(f"**Change**: {anomaly['change_percent']:.1f}% ({anomaly['previous_value']} -> {anomaly['current_value']})")
-                        lines.append(f"**Detected**: {anomaly['detected_at']}")
-                        lines.append("")
-        else:
-            # List all anomalies
-            lines.append("## Anomalies")
-            lines.append("")
-            for anomaly in anomalies:
-                lines.append(f"### {anomaly['entity']} ({anomaly['entity_type']})")
-                lines.append("")
-                lines.append(f"**Type**: {anomaly['type']} | **Severity**: {anomaly['severity']}")
-                lines.append(f"**Description**: {anomaly['description']}")
-                lines.append(f"**Change**: {anomaly['change_percent']:.1f}% ({anomaly['previous_value']} -> {anomaly['current_value']})")
-                lines.append("")
-        
-        return "\n".join(lines)
+        return "\n".join(self.stream_repository_report(report_data))
     
-    def format_repository_report(self, report_data: Dict[str, Any]) -> str:
+    def stream_repository_report(self, report_data: Dict[str, Any]) -> Iterator[str]:
         """
-        Format repository report as Markdown.
+        Stream repository report as Markdown lines.
         
         Args:
             report_data: Report data dictionary
         
-        Returns:
-            Markdown string
+        Yields:
+            Markdown lines, without line terminators
         """
         metadata = report_data["metadata"]
         summary = report_data["summary"]
         repositories = report_data["repositories"]
         
-        lines = []
-        
         # Header
-        lines.append("# Repository Contribution Report")
-        lines.append("")
+        yield "# Repository Contribution Report"
+        yield ""
         
         # Metadata
         period = metadata["period"]
-        lines.append(f"**Period**: {period['start_date']} to {period['end_date']}")
-        lines.append(f"**Generated**: {metadata['generated_at']}")
-        lines.append(f"**Tool Version**: {metadata['tool_version']}")
-        lines.append("")
+        yield f"**Period**: {period['start_date']} to {period['end_date']}"
+        yield f"**Generated**: {metadata['generated_at']}"
+        yield f"**Tool Version**: {metadata['tool_version']}"
+        yield ""
         
         # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- Total Repositories: {summary['total_repositories']}")
-        lines.append("")
+        yield "## Summary"
+        yield ""
+        yield f"- Total Repositories: {summary['total_repositories']}"
+        yield ""
         
         # Repositories table
-        lines.append("## Repositories")
-        lines.append("")
-        lines.append(
-            "| Repository | Contributions | Contributors | Commits | "
-            "PRs | Issues | Reviews | Trend |"
-        )
-        lines.append(
-            "|-----------|---------------|--------------|---------|"
-            "-----|--------|---------|-------|"
-        )
-        
+        yield "## Repositories"
+        yield ""
+        yield from _REPOSITORY_TABLE_HEADER
+        
+        # As for developer breakdowns, skip the per-row probe when flagged absent
+        check_distribution = metadata.get("has_contribution_distribution", True)
+        distribution_lines: List[str] = []
+        add_distribution = distribution_lines.append
         for repo in repositories:
             trend = repo.get("trend", "N/A")
-            lines.append(
-                f"| {repo['repository']} | "
-                f"{repo['total_contributions']} | "
-                f"{repo['active_contributors']} | "
-                f"{repo['commits']} | "
-                f"{repo['pull_requests']} | "
-                f"{repo['issues']} | "
-                f"{repo['reviews']} | "
-                f"{trend} |"
-            )
-        
-        lines.append("")
+            yield _REPOSITORY_ROW % (*_get_repository_fields(repo), trend)
+            if check_distribution and "contribution_distribution" in repo:
+                add_distribution(f"### {repo['repository']}")
+                add_distribution("")
+                for dev, count in heapq.nlargest(
+                    10,  # Top 10 contributors
+                    repo["contribution_distribution"].items(),
+                    key=itemgetter(1),
+                ):
+                    add_distribution(f"- {dev}: {count} contributions")
+                add_distribution("")
+        
+        yield ""
         
         # Contribution distribution (if available)
-        has_distribution = any(
-            "contribution_distribution" in repo for repo in repositories
-        )
-        if has_distribution:
-            lines.append("## Contribution Distribution")
-            lines.append("")
-            for repo in repositories:
-                if "contribution_distribution" in repo:
-                    lines.append(f"### {repo['repository']}")
-                    lines.append("")
-                    for dev, count in sorted(
-                        repo["contribution_distribution"].items(),
-                        key=lambda x: x[1],
-                        reverse=True,
-                    )[:10]:  # Top 10 contributors
-                        lines.append(f"- {dev}: {count} contributions")
-                    lines.append("")
-        
-        return "\n".join(lines)
-    
-    def format_anomaly_report(self, report_data: Dict[str, Any]) -> str:
-        """
-        Format anomaly report as Markdown.
-        
-        Args:
-            report_data: Report data dictionary
-        
-        Returns:
-            Markdown string
-        """
-        metadata = report_data["metadata"]
-        summary = report_data["summary"]
-        anomalies = report_data["anomalies"]
-        by_severity = report_data.get("by_severity", {})
-        
-        lines = []
-        
-        # Header
-        lines.append("# Anomaly Detection Report")
-        lines.append("")
-        
-        # Metadata
-        period = metadata["period"]
-        lines.append(f"**Period**: {period['start_date']} to {period['end_date']}")
-        lines.append(f"**Generated**: {metadata['generated_at']}")
-        lines.append(f"**Tool Version**: {metadata['tool_version']}")
-        lines.append("")
-        
-        # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- Total Anomalies: {summary['total_anomalies']}")
-        if "by_severity" in summary:
-            lines.append("")
-            lines.append("**By Severity:**")
-            for severity, count in sorted(summary["by_severity"].items()):
-                lines.append(f"- {severity.capitalize()}: {count}")
-        lines.append("")
-        
-        # Group by severity
-        if by_severity:
-            for severity in ["critical", "high", "medium", "low"]:
-                if severity in by_severity and by_severity[severity]:
-                    lines.append(f"## {severity.capitalize()} Severity Anomalies")
-                    lines.append("")
-                    
-                    for anomaly in by_severity[severity]:
-                        lines.append(f"### {anomaly['entity']} ({anomaly['entity_type']})")
-                        lines.append("")
-                        lines.append(f"**Type**: {anomaly['type']}")
-                        lines.append(f"**Description**: {anomaly['description']}")
-                        lines.append(f"**Change**: {anomaly['change_percent']:.1f}% ({anomaly['previous_value']} -> {anomaly['current_value']})")
-                        lines.append(f"**Detected**: {anomaly['detected_at']}")
-                        lines.append("")
-        else:
-            # List all anomalies
-            lines.append("## Anomalies")
-            lines.append("")
-            for anomaly in anomalies:
-                lines.append(f"### {anomaly['entity']} ({anomaly['entity_type']})")
-                lines.append("")
-                lines.append(f"**Type**: {anomaly['type']} | **Severity**: {anomaly['severity']}")
-                lines.append(f"**Description**: {anomaly['description']}")
-                lines.append(f"**Change**: {anomaly['change_percent']:.1f}% ({anomaly['previous_value']} -> {anomaly['current_value']})")
-                lines.append("")
-        
-        return "\n".join(lines)
-    
-    def format_pr_summary_report(self, report_data: Dict[str, Any]) -> str:
-        """
-        Format PR summary report as Markdown.
-        
-        Args:
-            report_data: Report data dictionary
-        
-        Returns:
-            Markdown string
-        """
-        metadata = report_data["metadata"]
-        summary = report_data["summary"]
-        prs = report_data["pull_requests"]
-        by_repo = report_data.get("by_repository", {})
-        
-        lines = []
-        
-        # Header
-        lines.append("# Pull Request Summary Report")
-        lines.append("")
-        
-        # Metadata
-        period = metadata["period"]
-        lines.append(f"**Period**: {period['start_date']} to {period['end_date']}")
-        lines.append(f"**Generated**: {metadata['generated_at']}")
-        lines.append(f"**Tool Version**: {metadata['tool_version']}")
-        lines.append("")
-        
-        # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- Total PRs: {summary['total_prs']}")
-        lines.append(f"- Repositories: {summary['repositories']}")
-        lines.append("")
-        
-        # Group by repository
-        if by_repo:
-            for repo_name, repo_prs in sorted(by_repo.items()):
-                lines.append(f"## {repo_name}")
-                lines.append("")
-                
-                for pr in repo_prs:
-                    pr_id = pr.get('id', pr.get('number', ''))
-                    title_suffix = f" (#{pr_id})" if pr_id else ""
-                    lines.append(f"### {pr['title']}{title_suffix}")
-                    lines.append("")
-                    lines.append(f"**Author**: {pr['author']} | **Created**: {pr['created_at']} | **State**: {pr.get('state', 'unknown')}")
-                    lines.append("")
-                    lines.extend(self._format_pr_with_dimensions(pr))
-                    lines.append("")
-        else:
-            # List all PRs
-            lines.append("## Pull Requests")
-            lines.append("")
-            for pr in prs:
-                pr_id = pr.get('id', pr.get('number', ''))
-                title_suffix = f" (#{pr_id})" if pr_id else ""
-                lines.append(f"### {pr['title']}{title_suffix} ({pr['repository']})")
-                lines.append("")
-                lines.append(f"**Author**: {pr['author']} | **Created**: {pr['created_at']} | **State**: {pr.get('state', 'unknown')}")
-                lines.append("")
-                lines.extend(self._format_pr_with_dimensions(pr))
-                lines.append("")
-        
-        return "\n".join(lines)
+        if distribution_lines:
+            yield "## Contribution Distribution"
+            yield ""
+            yield from distribution_lines
     
-    def format_anomaly_report(self, report_data: Dict[str, Any]) -> str:
+    def format_team_report(self, report_data: Dict[str, Any]) -> str:
         """
-        Format anomaly report as Markdown.
+        Format team report as Markdown.
         
         Args:
             report_data: Report data dictionary
@@ -578,195 +295,53 @@ class MarkdownFormatter:
         Returns:
             Markdown string
         """
-        metadata = report_data["metadata"]
-        summary = report_data["summary"]
-        anomalies = report_data["anomalies"]
-        by_severity = report_data.get("by_severity", {})
-        
-        lines = []
-        
-        # Header
-        lines.append("# Anomaly Detection Report")
-        lines.append("")
-        
-        # Metadata
-        period = metadata["period"]
-        lines.append(f"**Period**: {period['start_date']} to {period['end_date']}")
-        lines.append(f"**Generated**: {metadata['generated_at']}")
-        lines.append(f"**Tool Version**: {metadata['tool_version']}")
-        lines.append("")
-        
-        # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- Total Anomalies: {summary['total_anomalies']}")
-        if "by_severity" in summary:
-            lines.append("")
-            lines.append("**By Severity:**")
-            for severity, count in sorted(summary["by_severity"].items()):
-                lines.append(f"- {severity.capitalize()}: {count}")
-        lines.append("")
-        
-        # Group by severity
-        if by_severity:
-            for severity in ["critical", "high", "medium", "low"]:
-                if severity in by_severity and by_severity[severity]:
-                    lines.append(f"## {severity.capitalize()} Severity Anomalies")
-                    lines.append("")
-                    
-                    for anomaly in by_severity[severity]:
-                        lines.append(f"### {anomaly['entity']} ({anomaly['entity_type']})")
-                        lines.append("")
-                        lines.append(f"**Type**: {anomaly['type']}")
-                        lines.append(f"**Description**: {anomaly['description']}")
-                        lines.append(f"**Change**: {anomaly['change_percent']:.1f}% ({anomaly['previous_value']} -> {anomaly['current_value']})")
-                        lines.append(f"**Detected**: {anomaly['detected_at']}")
-                        lines.append("")
-        else:
-            # List all anomalies
-            lines.append("## Anomalies")
-            lines.append("")
-            for anomaly in anomalies:
-                lines.append(f"### {anomaly['entity']} ({anomaly['entity_type']})")
-                lines.append("")
-                lines.append(f"**Type**: {anomaly['type']} | **Severity**: {anomaly['severity']}")
-                lines.append(f"**Description**: {anomaly['description']}")
-                lines.append(f"**Change**: {anomaly['change_percent']:.1f}% ({anomaly['previous_value']} -> {anomaly['current_value']})")
-                lines.append("")
-        
-        return "\n".join(lines)
+        return "\n".join(self.stream_team_report(report_data))
     
-    def format_team_report(self, report_data: Dict[str, Any]) -> str:
+    def stream_team_report(self, report_data: Dict[str, Any]) -> Iterator[str]:
         """
-        Format team report as Markdown.
+        Stream team report as Markdown lines.
         
         Args:
             report_data: Report data dictionary
         
-        Returns:
-            Markdown string
+        Yields:
+            Markdown lines, without line terminators
         """
         metadata = report_data["metadata"]
         summary = report_data["summary"]
         teams = report_data["teams"]
         
-        lines = []
-        
         # Header
-        lines.append("# Team Contribution Report")
-        lines.append("")
+        yield "# Team Contribution Report"
+        yield ""
         
         # Metadata
         period = metadata["period"]
-        lines.append(f"**Period**: {period['start_date']} to {period['end_date']}")
-        lines.append(f"**Generated**: {metadata['generated_at']}")
-        lines.append(f"**Tool Version**: {metadata['tool_version']}")
-        lines.append("")
+        yield f"**Period**: {period['start_date']} to {period['end_date']}"
+        yield f"**Generated**: {metadata['generated_at']}"
+        yield f"**Tool Version**: {metadata['tool_version']}"
+        yield ""
         
         # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- Total Teams: {summary['total_teams']}")
-        lines.append("")
+        yield "## Summary"
+        yield ""
+        yield f"- Total Teams: {summary['total_teams']}"
+        yield ""
         
         # Teams table
-        lines.append("## Teams")
-        lines.append("")
-        lines.append(
-            "| Team | Contributions | Members | Commits | "
-            "PRs | Issues | Reviews | Repositories |"
-        )
-        lines.append(
-            "|------|---------------|---------|---------|"
-            "-----|--------|---------|--------------|"
-        )
+        yield "## Teams"
+        yield ""
+        yield from _TEAM_TABLE_HEADER
         
         for team in teams:
             repos = ", ".join(team["repositories_contributed"])
-            lines.append(
-                f"| {team['team_name']} | "
-                f"{team['total_contributions']} | "
-                f"{team['active_members']} | "
-                f"{team['commits']} | "
-                f"{team['pull_requests']} | "
-                f"{team['issues']} | "
-                f"{team['reviews']} | "
-                f"{repos} |"
-            )
-        
-        lines.append("")
-        
-        return "\n".join(lines)
-    
-    def format_pr_summary_report(self, report_data: Dict[str, Any]) -> str:
-        """
-        Format PR summary report as Markdown.
-        
-        Args:
-            report_data: Report data dictionary
-        
-        Returns:
-            Markdown string
-        """
-        metadata = report_data["metadata"]
-        summary = report_data["summary"]
-        prs = report_data["pull_requests"]
-        by_repo = report_data.get("by_repository", {})
-        
-        lines = []
-        
-        # Header
-        lines.append("# Pull Request Summary Report")
-        lines.append("")
-        
-        # Metadata
-        period = metadata["period"]
-        lines.append(f"**Period**: {period['start_date']} to {period['end_date']}")
-        lines.append(f"**Generated**: {metadata['generated_at']}")
-        lines.append(f"**Tool Version**: {metadata['tool_version']}")
-        lines.append("")
-        
-        # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- Total PRs: {summary['total_prs']}")
-        lines.append(f"- Repositories: {summary['repositories']}")
-        lines.append("")
-        
-        # Group by repository
-        if by_repo:
-            for repo_name, repo_prs in sorted(by_repo.items()):
-                lines.append(f"## {repo_name}")
-                lines.append("")
-                
-                for pr in repo_prs:
-                    pr_id = pr.get('id', pr.get('number', ''))
-                    title_suffix = f" (#{pr_id})" if pr_id else ""
-                    lines.append(f"### {pr['title']}{title_suffix}")
-                    lines.append("")
-                    lines.append(f"**Author**: {pr['author']} | **Created**: {pr['created_at']} | **State**: {pr.get('state', 'unknown')}")
-                    lines.append("")
-                    lines.extend(self._format_pr_with_dimensions(pr))
-                    lines.append("")
-        else:
-            # List all PRs
-            lines.append("## Pull Requests")
-            lines.append("")
-            for pr in prs:
-                pr_id = pr.get('id', pr.get('number', ''))
-                title_suffix = f" (#{pr_id})" if pr_id else ""
-                lines.append(f"### {pr['title']}{title_suffix} ({pr['repository']})")
-                lines.append("")
-                lines.append(f"**Author**: {pr['author']} | **Created**: {pr['created_at']} | **State**: {pr.get('state', 'unknown')}")
-                lines.append("")
-                lines.extend(self._format_pr_with_dimensions(pr))
-                lines.append("")
+            yield _TEAM_ROW % (*_get_team_fields(team), repos)
         
-        return "\n".join(lines)
+        yield ""
     
-    def format_anomaly_report(self, report_data: Dict[str, Any]) -> str:
+    def format_department_report(self, report_data: Dict[str, Any]) -> str:
         """
-        Format anomaly report as Markdown.
+        Format department report as Markdown.
         
         Args:
             report_data: Report data dictionary
@@ -774,119 +349,49 @@ class MarkdownFormatter:
         Returns:
             Markdown string
         """
-        metadata = report_data["metadata"]
-        summary = report_data["summary"]
-        anomalies = report_data["anomalies"]
-        by_severity = report_data.get("by_severity", {})
-        
-        lines = []
-        
-        # Header
-        lines.append("# Anomaly Detection Report")
-        lines.append("")
-        
-        # Metadata
-        period = metadata["period"]
-        lines.append(f"**Period**: {period['start_date']} to {period['end_date']}")
-        lines.append(f"**Generated**: {metadata['generated_at']}")
-        lines.append(f"**Tool Version**: {metadata['tool_version']}")
-        lines.append("")
-        
-        # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- Total Anomalies: {summary['total_anomalies']}")
-        if "by_severity" in summary:
-            lines.append("")
-            lines.append("**By Severity:**")
-            for severity, count in sorted(summary["by_severity"].items()):
-                lines.append(f"- {severity.capitalize()}: {count}")
-        lines.append("")
-        
-        # Group by severity
-        if by_severity:
-            for severity in ["critical", "high", "medium", "low"]:
-                if severity in by_severity and by_severity[severity]:
-                    lines.append(f"## {severity.capitalize()} Severity Anomalies")
-                    lines.append("")
-                    
-                    for anomaly in by_severity[severity]:
-                        lines.append(f"### {anomaly['entity']} ({anomaly['entity_type']})")
-                        lines.append("")
-                        lines.append(f"**Type**: {anomaly['type']}")
-                        lines.append(f"**Description**: {anomaly['description']}")
-                        lines.append(f"**Change**: {anomaly['change_percent']:.1f}% ({anomaly['previous_value']} -> {anomaly['current_value']})")
-                        lines.append(f"**Detected**: {anomaly['detected_at']}")
-                        lines.append("")
-        else:
-            # List all anomalies
-            lines.append("## Anomalies")
-            lines.append("")
-            for anomaly in anomalies:
-                lines.append(f"### {anomaly['entity']} ({anomaly['entity_type']})")
-                lines.append("")
-                lines.append(f"**Type**: {anomaly['type']} | **Severity**: {anomaly['severity']}")
-                lines.append(f"**Description**: {anomaly['description']}")
-                lines.append(f"**Change**: {anomaly['change_percent']:.1f}% ({anomaly['previous_value']} -> {anomaly['current_value']})")
-                lines.append("")
-        
-        return "\n".join(lines)
+        return "\n".join(self.stream_department_report(report_data))
     
-    def format_department_report(self, report_data: Dict[str, Any]) -> str:
+    def stream_department_report(self, report_data: Dict[str, Any]) -> Iterator[str]:
         """
-        Format department report as Markdown.
+        Stream department report as Markdown lines.
         
         Args:
             report_data: Report data dictionary
         
-        Returns:
-            Markdown string
+        Yields:
+            Markdown lines, without line terminators
         """
         metadata = report_data["metadata"]
         summary = report_data["summary"]
         departments = report_data["departments"]
         
-        lines = []
-        
         # Header
-        lines.append("# Department Contribution Report")
-        lines.append("")
+        yield "# Department Contribution Report"
+        yield ""
         
         # Metadata
         period = metadata["period"]
-        lines.append(f"**Period**: {period['start_date']} to {period['end_date']}")
-        lines.append(f"**Generated**: {metadata['generated_at']}")
-        lines.append(f"**Tool Version**: {metadata['tool_version']}")
-        lines.append("")
+        yield f"**Period**: {period['start_date']} to {period['end_date']}"
+        yield f"**Generated**: {metadata['generated_at']}"
+        yield f"**Tool Version**: {metadata['tool_version']}"
+        yield ""
         
         # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- Total Departments: {summary['total_departments']}")
-        lines.append("")
+        yield "## Summary"
+        yield ""
+        yield f"- Total Departments: {summary['total_departments']}"
+        yield ""
         
         # Departments table
-        lines.append("## Departments")
-        lines.append("")
-        lines.append(
-            "| Department | Contributions | Members | Teams |"
-        )
-        lines.append(
-            "|------------|---------------|---------|-------|"
-        )
+        yield "## Departments"
+        yield ""
+        yield from _DEPARTMENT_TABLE_HEADER
         
         for dept in departments:
             teams_str = ", ".join(dept["teams"])
-            lines.append(
-                f"| {dept['department_name']} | "
-                f"{dept['total_contributions']} | "
-                f"{dept['active_members']} | "
-                f"{teams_str} |"
-            )
+            yield _DEPARTMENT_ROW % (*_get_department_fields(dept), teams_str)
         
-        lines.append("")
-        
-        return "\n".join(lines)
+        yield ""
     
     def format_pr_summary_report(self, report_data: Dict[str, Any]) -> str:
         """
@@ -898,61 +403,69 @@ class MarkdownFormatter:
         Returns:
             Markdown string
         """
+        return "\n".join(self.stream_pr_summary_report(report_data))
+    
+    def stream_pr_summary_report(self, report_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Stream PR summary report as Markdown lines.
+        
+        Args:
+            report_data: Report data dictionary
+        
+        Yields:
+            Markdown lines, without line terminators
+        """
         metadata = report_data["metadata"]
         summary = report_data["summary"]
         prs = report_data["pull_requests"]
         by_repo = report_data.get("by_repository", {})
         
-        lines = []
-        
         # Header
-        lines.append("# Pull Request Summary Report")
-        lines.append("")
+        yield "# Pull Request Summary Report"
+        yield ""
         
         # Metadata
         period = metadata["period"]
-        lines.append(f"**Period**: {period['start_date']} to {period['end_date']}")
-        lines.append(f"**Generated**: {metadata['generated_at']}")
-        lines.append(f"**Tool Version**: {metadata['tool_version']}")
-        lines.append("")
+        yield f"**Period**: {period['start_date']} to {period['end_date']}"
+        yield f"**Generated**: {metadata['generated_at']}"
+        yield f"**Tool Version**: {metadata['tool_version']}"
+        yield ""
         
         # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- Total PRs: {summary['total_prs']}")
-        lines.append(f"- Repositories: {summary['repositories']}")
-        lines.append("")
+        yield "## Summary"
+        yield ""
+        yield f"- Total PRs: {summary['total_prs']}"
+        yield f"- Repositories: {summary['repositories']}"
+        yield ""
         
         # Group by repository
         if by_repo:
             for repo_name, repo_prs in sorted(by_repo.items()):
-                lines.append(f"## {repo_name}")
-                lines.append("")
+                yield f"## {repo_name}"
+                yield ""
                 
                 for pr in repo_prs:
                     pr_id = pr.get('id', pr.get('number', ''))
                     title_suffix = f" (#{pr_id})" if pr_id else ""
-                    lines.append(f"### {pr['title']}{title_suffix}")
-                    lines.append("")
-                    lines.append(f"**Author**: {pr['author']} | **Created**: {pr['created_at']} | **State**: {pr.get('state', 'unknown')}")
-                    lines.append("")
-                    lines.extend(self._format_pr_with_dimensions(pr))
-                    lines.append("")
+                    yield f"### {pr['title']}{title_suffix}"
+                    yield ""
+                    yield f"**Author**: {pr['author']} | **Created**: {pr['created_at']} | **State**: {pr.get('state', 'unknown')}"
+                    yield ""
+                    yield from self._format_pr_with_dimensions(pr)
+                    yield ""
         else:
             # List all PRs
-            lines.append("## Pull Requests")
-            lines.append("")
+            yield "## Pull Requests"
+            yield ""
             for pr in prs:
                 pr_id = pr.get('id', pr.get('number', ''))
                 title_suffix = f" (#{pr_id})" if pr_id else ""
-                lines.append(f"### {pr['title']}{title_suffix} ({pr['repository']})")
-                lines.append("")
-                lines.append(f"**Author**: {pr['author']} | **Created**: {pr['created_at']} | **State**: {pr.get('state', 'unknown')}")
-                lines.append("")
-                lines.extend(self._format_pr_with_dimensions(pr))
-                lines.append("")
-        
-        return "\n".join(lines)
+                yield f"### {pr['title']}{title_suffix} ({pr['repository']})"
+                yield ""
+                yield f"**Author**: {pr['author']} | **Created**: {pr['created_at']} | **State**: {pr.get('state', 'unknown')}"
+                yield ""
+                yield from self._format_pr_with_dimensions(pr)
+                yield ""
     
     def format_anomaly_report(self, report_data: Dict[str, Any]) -> str:
         """
@@ -964,61 +477,68 @@ class MarkdownFormatter:
         Returns:
             Markdown string
         """
+        return "\n".join(self.stream_anomaly_report(report_data))
+    
+    def stream_anomaly_report(self, report_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Stream anomaly report as Markdown lines.
+        
+        Args:
+            report_data: Report data dictionary
+        
+        Yields:
+            Markdown lines, without line terminators
+        """
         metadata = report_data["metadata"]
         summary = report_data["summary"]
         anomalies = report_data["anomalies"]
         by_severity = report_data.get("by_severity", {})
         
-        lines = []
-        
         # Header
-        lines.append("# Anomaly Detection Report")
-        lines.append("")
+        yield "# Anomaly Detection Report"
+        yield ""
         
         # Metadata
         period = metadata["period"]
-        lines.append(f"**Period**: {period['start_date']} to {period['end_date']}")
-        lines.append(f"**Generated**: {metadata['generated_at']}")
-        lines.append(f"**Tool Version**: {metadata['tool_version']}")
-        lines.append("")
+        yield f"**Period**: {period['start_date']} to {period['end_date']}"
+        yield f"**Generated**: {metadata['generated_at']}"
+        yield f"**Tool Version**: {metadata['tool_version']}"
+        yield ""
         
         # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- Total Anomalies: {summary['total_anomalies']}")
+        yield "## Summary"
+        yield ""
+        yield f"- Total Anomalies: {summary['total_anomalies']}"
         if "by_severity" in summary:
-            lines.append("")
-            lines.append("**By Severity:**")
+            yield ""
+            yield "**By Severity:**"
             for severity, count in sorted(summary["by_severity"].items()):
-                lines.append(f"- {severity.capitalize()}: {count}")
-        lines.append("")
+                yield f"- {severity.capitalize()}: {count}"
+        yield ""
         
         # Group by severity
         if by_severity:
             for severity in ["critical", "high", "medium", "low"]:
                 if severity in by_severity and by_severity[severity]:
-                    lines.append(f"## {severity.capitalize()} Severity Anomalies")
-                    lines.append("")
+                    yield f"## {severity.capitalize()} Severity Anomalies"
+                    yield ""
                     
                     for anomaly in by_severity[severity]:
-                        lines.append(f"### {anomaly['entity']} ({anomaly['entity_type']})")
-                        lines.append("")
-                        lines.append(f"**Type**: {anomaly['type']}")
-                        lines.append(f"**Description**: {anomaly['description']}")
-                        lines.append(f"**Change**: {anomaly['change_percent']:.1f}% ({anomaly['previous_value']} -> {anomaly['current_value']})")
-                        lines.append(f"**Detected**: {anomaly['detected_at']}")
-                        lines.append("")
+                        yield f"### {anomaly['entity']} ({anomaly['entity_type']})"
+                        yield ""
+                        yield f"**Type**: {anomaly['type']}"
+                        yield f"**Description**: {anomaly['description']}"
+                        yield f"**Change**: {anomaly['change_percent']:.1f}% ({anomaly['previous_value']} -> {anomaly['current_value']})"
+                        yield f"**Detected**: {anomaly['detected_at']}"
+                        yield ""
         else:
             # List all anomalies
-            lines.append("## Anomalies")
-            lines.append("")
+            yield "## Anomalies"
+            yield ""
             for anomaly in anomalies:
-                lines.append(f"### {anomaly['entity']} ({anomaly['entity_type']})")
-                lines.append("")
-                lines.append(f"**Type**: {anomaly['type']} | **Severity**: {anomaly['severity']}")
-                lines.append(f"**Description**: {anomaly['description']}")
-                lines.append(f"**Change**: {anomaly['change_percent']:.1f}% ({anomaly['previous_value']} -> {anomaly['current_value']})")
-                lines.append("")
-        
-        return "\n".join(lines)
-
+                yield f"### {anomaly['entity']} ({anomaly['entity_type']})"
+                yield ""
+                yield f"**Type**: {anomaly['type']} | **Severity**: {anomaly['severity']}"
+                yield f"**Description**: {anomaly['description']}"
+                yield f"**Change**: {anomaly['change_percent']:.1f}% ({anomaly['previous_value']} -> {anomaly['current_value']})"
+                yield ""
@@ -1,7 +1,8 @@
 """Report generation library for GitHub contribution analytics."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
 
 from github_tools import __version__
 from github_tools.analyzers.developer_analyzer import DeveloperMetrics
@@ -9,6 +10,7 @@ from github_tools.analyzers.repository_analyzer import RepositoryMetrics
 from github_tools.analyzers.team_analyzer import TeamMetrics, DepartmentMetrics
 from github_tools.analyzers.anomaly_detector import Anomaly
 from github_tools.models.time_period import TimePeriod
+from github_tools.reports.formatters.base import ReportFormatter
 from github_tools.reports.formatters.json import JSONFormatter
 from github_tools.reports.formatters.markdown import MarkdownFormatter
 from github_tools.reports.formatters.csv import CSVFormatter
@@ -29,6 +31,57 @@ class ReportGenerator:
         self.json_formatter = JSONFormatter()
         self.markdown_formatter = MarkdownFormatter()
         self.csv_formatter = CSVFormatter()
+        self._formatters: Dict[str, ReportFormatter] = {
+            "json": self.json_formatter,
+            "csv": self.csv_formatter,
+            "markdown": self.markdown_formatter,
+        }
+        self._generated_at: Optional[str] = None
+    
+    def _metadata(self, time_period: TimePeriod) -> Dict[str, Any]:
+        """
+        Build the metadata block shared by every report.
+        
+        The generation timestamp is taken once per generator, so all reports
+        produced in one run carry the same generated_at.
+        
+        Args:
+            time_period: Time period for the report
+        
+        Returns:
+            Metadata dictionary
+        """
+        if self._generated_at is None:
+            self._generated_at = datetime.now().isoformat()
+        return {
+            "generated_at": self._generated_at,
+            "tool_version": __version__,
+            "period": {
+                "start_date": time_period.iso_start,
+                "end_date": time_period.iso_end,
+            },
+        }
+    
+    def _formatters_for(self, formats: Iterable[str]) -> Dict[str, ReportFormatter]:
+        """
+        Resolve output formats to formatters.
+        
+        Args:
+            formats: Output formats (json, markdown, csv)
+        
+        Returns:
+            Mapping of format to formatter, in the order given
+        
+        Raises:
+            ValueError: If a format is not supported
+        """
+        formatters = {}
+        for format in formats:
+            try:
+                formatters[format] = self._formatters[format]
+            except KeyError:
+                raise ValueError(f"Unsupported format: {format}") from None
+        return formatters
     
     def generate_developer_report(
         self,
@@ -47,16 +100,77 @@ class ReportGenerator:
         Returns:
             Formatted report string
         """
+        return self.generate_developer_reports(metrics, time_period, [format])[format]
+    
+    def generate_developer_reports(
+        self,
+        metrics: List[DeveloperMetrics],
+        time_period: TimePeriod,
+        formats: Iterable[str],
+    ) -> Dict[str, str]:
+        """
+        Generate developer activity reports in several formats from one report data build.
+        
+        Args:
+            metrics: List of developer metrics
+            time_period: Time period for the report
+            formats: Output formats (json, markdown, csv)
+        
+        Returns:
+            Mapping of format to formatted report string
+        
+        Raises:
+            ValueError: If a format is not supported
+        """
+        formatters = self._formatters_for(formats)
         report_data = self._build_developer_report_data(metrics, time_period)
+        return {
+            fmt: formatter.format("developer", report_data)
+            for fmt, formatter in formatters.items()
+        }
+    
+    def write_developer_report(
+        self,
+        metrics: List[DeveloperMetrics],
+        time_period: TimePeriod,
+        fp: TextIO,
+        format: str = "json",
+    ) -> None:
+        """
+        Write developer activity report to a text file, one developer at a time.
+        
+        Developer rows are built lazily while they are written, so peak memory
+        no longer grows with the number of developers for JSON and CSV output
+        (Markdown still buffers the per-repository breakdown section). The
+        text written matches generate_developer_report.
+        
+        Args:
+            metrics: List of developer metrics
+            time_period: Time period for the report
+            fp: Text file to write to
+            format: Output format (json, markdown, csv)
+        
+        Raises:
+            ValueError: If the format is not supported
+        """
+        if format not in self._formatters:
+            raise ValueError(f"Unsupported format: {format}")
+        
+        report_data = {
+            **self._developer_report_header(metrics, time_period),
+            "developers": self._iter_developer_rows(metrics),
+        }
         
         if format == "json":
-            return self.json_formatter.format_developer_report(report_data)
+            self.json_formatter.write(report_data, fp)
         elif format == "csv":
-            return self.csv_formatter.format_developer_report(report_data)
-        elif format == "markdown":
-            return self.markdown_formatter.format_developer_report(report_data)
+            fp.writelines(self.csv_formatter.stream_developer_report(report_data))
         else:
-            raise ValueError(f"Unsupported format: {format}")
+            lines = self.markdown_formatter.stream_developer_report(report_data)
+            fp.write(next(lines))
+            for line in lines:
+                fp.write("\n")
+                fp.write(line)
     
     def _build_developer_report_data(
         self,
@@ -73,11 +187,49 @@ class ReportGenerator:
         Returns:
             Report data dictionary
         """
-        # Calculate summary
-        total_contributions = sum(m.total_contributions for m in metrics)
+        return {
+            **self._developer_report_header(metrics, time_period),
+            "developers": list(self._iter_developer_rows(metrics)),
+        }
+    
+    def _developer_report_header(
+        self,
+        metrics: List[DeveloperMetrics],
+        time_period: TimePeriod,
+    ) -> Dict[str, Any]:
+        """
+        Build the metadata and summary sections of the developer report.
+        
+        Args:
+            metrics: List of developer metrics
+            time_period: Time period for the report
+        
+        Returns:
+            Dictionary with metadata and summary keys
+        """
+        return {
+            "metadata": {
+                **self._metadata(time_period),
+                "has_per_repository_breakdown": any(
+                    metric.per_repository_breakdown for metric in metrics
+                ),
+            },
+            "summary": {
+                "total_developers": len(metrics),
+                "total_contributions": sum(map(attrgetter("total_contributions"), metrics)),
+            },
+        }
+    
+    def _iter_developer_rows(self, metrics: List[DeveloperMetrics]) -> Iterator[Dict[str, Any]]:
+        """
+        Build developer report rows lazily.
         
-        # Build developers array
-        developers = []
+        Args:
+            metrics: List of developer metrics
+        
+        Yields:
+            One developer dictionary per metric
+        """
         for metric in metrics:
             dev_data = {
                 "username": metric.developer,
@@ -88,37 +240,21 @@ class ReportGenerator:
                 "issues_created": metric.issues_created,
                 "issues_resolved": metric.issues_resolved,
                 "code_review_participation": metric.code_review_participation,
-                "repositories_contributed": sorted(set(metric.repositories_contributed)),
+                "repositories_contributed": list(metric.sorted_repositories),
             }
             
             # Add per-repository breakdown if available
             if metric.per_repository_breakdown:
                 dev_data["per_repository_breakdown"] = {
                     repo: {
-                        "commits": breakdown.get("commits", 0),
-                        "pull_requests_created": breakdown.get("pull_requests_created", 0),
-                        "pull_requests_reviewed": breakdown.get("pull_requests_reviewed", 0),
+                        "commits": breakdown.commits,
+                        "pull_requests_created": breakdown.pull_requests_created,
+                        "pull_requests_reviewed": breakdown.pull_requests_reviewed,
                     }
                     for repo, breakdown in metric.per_repository_breakdown.items()
                 }
             
-            developers.append(dev_data)
-        
-        return {
-            "metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "tool_version": __version__,
-                "period": {
-                    "start_date": time_period.start_date.isoformat(),
-                    "end_date": time_period.end_date.isoformat(),
-                },
-            },
-            "summary": {
-                "total_developers": len(metrics),
-                "total_contributions": total_contributions,
-            },
-            "developers": developers,
-        }
+            yield dev_data
     
     def generate_repository_report(
         self,
@@ -137,16 +273,34 @@ class ReportGenerator:
         Returns:
             Formatted report string
         """
-        report_data = self._build_repository_report_data(metrics, time_period)
+        return self.generate_repository_reports(metrics, time_period, [format])[format]
+    
+    def generate_repository_reports(
+        self,
+        metrics: List[RepositoryMetrics],
+        time_period: TimePeriod,
+        formats: Iterable[str],
+    ) -> Dict[str, str]:
+        """
+        Generate repository contribution reports in several formats from one report data build.
         
-        if format == "json":
-            return self.json_formatter.format_repository_report(report_data)
-        elif format == "csv":
-            return self.csv_formatter.format_repository_report(report_data)
-        elif format == "markdown":
-            return self.markdown_formatter.format_repository_report(report_data)
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        Args:
+            metrics: List of repository metrics
+            time_period: Time period for the report
+            formats: Output formats (json, markdown, csv)
+        
+        Returns:
+            Mapping of format to formatted report string
+        
+        Raises:
+            ValueError: If a format is not supported
+        """
+        formatters = self._formatters_for(formats)
+        report_data = self._build_repository_report_data(metrics, time_period)
+        return {
+            fmt: formatter.format("repository", report_data)
+            for fmt, formatter in formatters.items()
+        }
     
     def _build_repository_report_data(
         self,
@@ -164,12 +318,13 @@ class ReportGenerator:
             Report data dictionary
         """
         repositories = []
+        has_distribution = False
         for metric in metrics:
             repo_data = {
                 "repository": metric.repository,
                 "total_contributions": metric.total_contributions,
                 "active_contributors": metric.active_contributors,
-                "contributor_list": sorted(metric.contributor_list),
+                "contributor_list": list(metric.sorted_contributors),
                 "commits": metric.commits,
                 "pull_requests": metric.pull_requests,
                 "issues": metric.issues,
@@ -180,18 +335,15 @@ class ReportGenerator:
                 repo_data["trend"] = metric.trend
             
             if metric.contribution_distribution:
+                has_distribution = True
                 repo_data["contribution_distribution"] = metric.contribution_distribution
             
             repositories.append(repo_data)
         
         return {
             "metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "tool_version": __version__,
-                "period": {
-                    "start_date": time_period.start_date.isoformat(),
-                    "end_date": time_period.end_date.isoformat(),
-                },
+                **self._metadata(time_period),
+                "has_contribution_distribution": has_distribution,
             },
             "summary": {
                 "total_repositories": len(metrics),
@@ -216,16 +368,34 @@ class ReportGenerator:
         Returns:
             Formatted report string
         """
-        report_data = self._build_team_report_data(metrics, time_period)
+        return self.generate_team_reports(metrics, time_period, [format])[format]
+    
+    def generate_team_reports(
+        self,
+        metrics: List[TeamMetrics],
+        time_period: TimePeriod,
+        formats: Iterable[str],
+    ) -> Dict[str, str]:
+        """
+        Generate team contribution reports in several formats from one report data build.
         
-        if format == "json":
-            return self.json_formatter.format_team_report(report_data)
-        elif format == "csv":
-            return self.csv_formatter.format_team_report(report_data)
-        elif format == "markdown":
-            return self.markdown_formatter.format_team_report(report_data)
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        Args:
+            metrics: List of team metrics
+            time_period: Time period for the report
+            formats: Output formats (json, markdown, csv)
+        
+        Returns:
+            Mapping of format to formatted report string
+        
+        Raises:
+            ValueError: If a format is not supported
+        """
+        formatters = self._formatters_for(formats)
+        report_data = self._build_team_report_data(metrics, time_period)
+        return {
+            fmt: formatter.format("team", report_data)
+            for fmt, formatter in formatters.items()
+        }
     
     def _build_team_report_data(
         self,
@@ -248,24 +418,17 @@ class ReportGenerator:
                 "team_name": metric.team_name,
                 "total_contributions": metric.total_contributions,
                 "active_members": metric.active_members,
-                "member_list": sorted(metric.member_list),
+                "member_list": list(metric.sorted_members),
                 "commits": metric.commits,
                 "pull_requests": metric.pull_requests,
                 "issues": metric.issues,
                 "reviews": metric.reviews,
-                "repositories_contributed": sorted(set(metric.repositories_contributed)),
+                "repositories_contributed": list(metric.sorted_repositories),
             }
             teams.append(team_data)
         
         return {
-            "metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "tool_version": __version__,
-                "period": {
-                    "start_date": time_period.start_date.isoformat(),
-                    "end_date": time_period.end_date.isoformat(),
-                },
-            },
+            "metadata": self._metadata(time_period),
             "summary": {
                 "total_teams": len(metrics),
             },
@@ -289,16 +452,34 @@ class ReportGenerator:
         Returns:
             Formatted report string
         """
-        report_data = self._build_department_report_data(metrics, time_period)
+        return self.generate_department_reports(metrics, time_period, [format])[format]
+    
+    def generate_department_reports(
+        self,
+        metrics: List[DepartmentMetrics],
+        time_period: TimePeriod,
+        formats: Iterable[str],
+    ) -> Dict[str, str]:
+        """
+        Generate department contribution reports in several formats from one report data build.
         
-        if format == "json":
-            return self.json_formatter.format_department_report(report_data)
-        elif format == "csv":
-            return self.csv_formatter.format_department_report(report_data)
-        elif format == "markdown":
-            return self.markdown_formatter.format_department_report(report_data)
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        Args:
+            metrics: List of department metrics
+            time_period: Time period for the report
+            formats: Output formats (json, markdown, csv)
+        
+        Returns:
+            Mapping of format to formatted report string
+        
+        Raises:
+            ValueError: If a format is not supported
+        """
+        formatters = self._formatters_for(formats)
+        report_data = self._build_department_report_data(metrics, time_period)
+        return {
+            fmt: formatter.format("department", report_data)
+            for fmt, formatter in formatters.items()
+        }
     
     def _build_department_report_data(
         self,
@@ -321,20 +502,13 @@ class ReportGenerator:
                 "department_name": metric.department_name,
                 "total_contributions": metric.total_contributions,
                 "active_members": metric.active_members,
-                "member_list": sorted(metric.member_list),
-                "teams": sorted(metric.teams),
+                "member_list": list(metric.sorted_members),
+                "teams": list(metric.sorted_teams),
             }
             departments.append(dept_data)
         
         return {
-            "metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "tool_version": __version__,
-                "period": {
-                    "start_date": time_period.start_date.isoformat(),
-                    "end_date": time_period.end_date.isoformat(),
-                },
-            },
+            "metadata": self._metadata(time_period),
             "summary": {
                 "total_departments": len(metrics),
             },
@@ -358,16 +532,34 @@ class ReportGenerator:
         Returns:
             Formatted report string
         """
-        report_data = self._build_pr_summary_report_data(summaries, time_period)
+        return self.generate_pr_summary_reports(summaries, time_period, [format])[format]
+    
+    def generate_pr_summary_reports(
+        self,
+        summaries: List[dict],
+        time_period: TimePeriod,
+        formats: Iterable[str],
+    ) -> Dict[str, str]:
+        """
+        Generate PR summary reports in several formats from one report data build.
         
-        if format == "json":
-            return self.json_formatter.format_pr_summary_report(report_data)
-        elif format == "csv":
-            return self.csv_formatter.format_pr_summary_report(report_data)
-        elif format == "markdown":
-            return self.markdown_formatter.format_pr_summary_report(report_data)
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        Args:
+            summaries: List of PR summary dictionaries
+            time_period: Time period for the report
+            formats: Output formats (json, markdown, csv)
+        
+        Returns:
+            Mapping of format to formatted report string
+        
+        Raises:
+            ValueError: If a format is not supported
+        """
+        formatters = self._formatters_for(formats)
+        report_data = self._build_pr_summary_report_data(summaries, time_period)
+        return {
+            fmt: formatter.format("pr_summary", report_data)
+            for fmt, formatter in formatters.items()
+        }
     
     def _build_pr_summary_report_data(
         self,
@@ -393,14 +585,7 @@ class ReportGenerator:
             repos[repo].append(summary)
         
         return {
-            "metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "tool_version": __version__,
-                "period": {
-                    "start_date": time_period.start_date.isoformat(),
-                    "end_date": time_period.end_date.isoformat(),
-                },
-            },
+            "metadata": self._metadata(time_period),
             "summary": {
                 "total_prs": len(summaries),
                 "repositories": len(repos),
@@ -426,16 +611,34 @@ class ReportGenerator:
         Returns:
             Formatted report string
         """
-        report_data = self._build_anomaly_report_data(anomalies, time_period)
+        return self.generate_anomaly_reports(anomalies, time_period, [format])[format]
+    
+    def generate_anomaly_reports(
+        self,
+        anomalies: List[Anomaly],
+        time_period: TimePeriod,
+        formats: Iterable[str],
+    ) -> Dict[str, str]:
+        """
+        Generate anomaly detection reports in several formats from one report data build.
         
-        if format == "json":
-            return self.json_formatter.format_anomaly_report(report_data)
-        elif format == "csv":
-            return self.csv_formatter.format_anomaly_report(report_data)
-        elif format == "markdown":
-            return self.markdown_formatter.format_anomaly_report(report_data)
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        Args:
+            anomalies: List of detected anomalies
+            time_period: Time period for the report
+            formats: Output formats (json, markdown, csv)
+        
+        Returns:
+            Mapping of format to formatted report string
+        
+        Raises:
+            ValueError: If a format is not supported
+        """
+        formatters = self._formatters_for(formats)
+        report_data = self._build_anomaly_report_data(anomalies, time_period)
+        return {
+            fmt: formatter.format("anomaly", report_data)
+            for fmt, formatter in formatters.items()
+        }
     
     def _build_anomaly_report_data(
         self,
@@ -452,22 +655,18 @@ class ReportGenerator:
         Returns:
             Report data dictionary
         """
-        # Group by severity
+        # Serialize each anomaly once (datetimes become ISO strings here) and
+        # group the same dicts by severity
+        anomaly_dicts = [a.to_dict() for a in anomalies]
         by_severity = {}
-        for anomaly in anomalies:
-            if anomaly.severity not in by_severity:
-                by_severity[anomaly.severity] = []
-            by_severity[anomaly.severity].append(anomaly.to_dict())
+        for anomaly in anomaly_dicts:
+            severity = anomaly["severity"]
+            if severity not in by_severity:
+                by_severity[severity] = []
+            by_severity[severity].append(anomaly)
         
         return {
-            "metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "tool_version": __version__,
-                "period": {
-                    "start_date": time_period.start_date.isoformat(),
-                    "end_date": time_period.end_date.isoformat(),
-                },
-            },
+            "metadata": self._metadata(time_period),
             "summary": {
                 "total_anomalies": len(anomalies),
                 "by_severity": {
@@ -475,7 +674,7 @@ class ReportGenerator:
                     for severity, anomalies_list in by_severity.items()
                 },
             },
-            "anomalies": [a.to_dict() for a in anomalies],
+            "anomalies": anomaly_dicts,
             "by_severity": by_severity,
         }
 
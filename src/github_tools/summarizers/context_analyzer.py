@@ -1,13 +1,47 @@
 """Repository context analysis for PR summarization."""
 
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Dict, Iterable, List, Optional, Set
 
 from github_tools.api.client import GitHubClient
+from github_tools.api.rate_limiter import RateLimiter
 from github_tools.models.repository import Repository
+from github_tools.summarizers.keyword_scanner import KeywordScanner
 from github_tools.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Context tag implied by each keyword in the lowercased repository name
+_REPOSITORY_KEYWORD_TAGS = {
+    "api": "api",
+    "backend": "api",
+    "frontend": "frontend",
+    "ui": "frontend",
+    "web": "frontend",
+    "mobile": "mobile",
+    "ios": "mobile",
+    "android": "mobile",
+}
+
+# Context tag implied by each keyword in the lowercased PR title/body
+_TEXT_KEYWORD_TAGS = {
+    "bug": "bugfix",
+    "fix": "bugfix",
+    "feature": "feature",
+    "add": "feature",
+    "refactor": "refactor",
+    "test": "testing",
+    "doc": "documentation",
+    "readme": "documentation",
+}
+
+# Bytes of README read when looking for its first paragraph
+_README_PREFIX_BYTES = 2048
+
+_REPOSITORY_SCANNER = KeywordScanner(_REPOSITORY_KEYWORD_TAGS)
+_TEXT_SCANNER = KeywordScanner(_TEXT_KEYWORD_TAGS)
+
 
 class ContextAnalyzer:
     """
@@ -17,14 +51,22 @@ class ContextAnalyzer:
     that can help generate more accurate PR summaries.
     """
     
-    def __init__(self, github_client: GitHubClient):
+    def __init__(
+        self,
+        github_client: GitHubClient,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         """
         Initialize context analyzer.
         
         Args:
             github_client: GitHub API client
+            rate_limiter: Rate limiter whose request slots bound the GitHub
+                calls made per context (optional)
         """
         self.github_client = github_client
+        self.rate_limiter = rate_limiter
+        self._context_cache: Dict[str, Optional[str]] = {}
     
     def get_repository_context(
         self,
@@ -33,41 +75,108 @@ class ContextAnalyzer:
         """
         Get repository context for PR summarization.
         
+        Contexts are cached per repository for the life of the analyzer, so
+        summarizing many PRs from one repository fetches it only once.
+        
         Args:
             repository: Repository full name (owner/repo)
         
         Returns:
             Repository context string or None
         """
-        try:
-            repo = self.github_client.github.get_repo(repository)
-            
-            context_parts = []
-            
-            # Add repository description
-            if repo.description:
-                context_parts.append(f"Repository: {repo.description}")
-            
-            # Add primary language
-            if repo.language:
-                context_parts.append(f"Primary Language: {repo.language}")
-            
-            # Try to get README content
-            try:
-                readme = repo.get_readme()
-                readme_content = readme.decoded_content.decode("utf-8")
-                # Extract first paragraph or summary
-                first_paragraph = readme_content.split("\n\n")[0] if "\n\n" in readme_content else readme_content[:200]
-                if first_paragraph:
-                    context_parts.append(f"README: {first_paragraph}")
-            except Exception as e:
-                logger.debug(f"Could not fetch README for {repository}: {e}")
-            
-            return "\n".join(context_parts) if context_parts else None
+        if repository in self._context_cache:
+            return self._context_cache[repository]
         
+        slot = self.rate_limiter.slot() if self.rate_limiter else nullcontext()
+        try:
+            with slot:
+                context = self._fetch_repository_context(repository)
         except Exception as e:
+            # Not cached, so a transient API failure is retried on the next call
             logger.warning(f"Failed to get repository context for {repository}: {e}")
             return None
+        
+        self._context_cache[repository] = context
+        return context
+    
+    def _fetch_repository_context(self, repository: str) -> Optional[str]:
+        """
+        Fetch repository metadata and README opening from GitHub.
+        
+        Args:
+            repository: Repository full name (owner/repo)
+        
+        Returns:
+            Repository context string or None if there is nothing to report
+        """
+        repo = self.github_client.github.get_repo(repository)
+        
+        context_parts = []
+        
+        # Add repository description
+        if repo.description:
+            context_parts.append(f"Repository: {repo.description}")
+        
+        # Add primary language
+        if repo.language:
+            context_parts.append(f"Primary Language: {repo.language}")
+        
+        # Try to get README content
+        try:
+            readme = repo.get_readme()
+            # Only the opening of the README is used, so decode just that
+            # (a multi-byte character cut at the boundary is dropped)
+            readme_content = readme.decoded_content[:_README_PREFIX_BYTES].decode(
+                "utf-8", errors="ignore"
+            )
+            # Extract first paragraph or summary
+            first_paragraph = readme_content.split("\n\n", 1)[0] if "\n\n" in readme_content else readme_content[:200]
+            if first_paragraph:
+                context_parts.append(f"README: {first_paragraph}")
+        except Exception as e:
+            logger.debug(f"Could not fetch README for {repository}: {e}")
+        
+        return "\n".join(context_parts) if context_parts else None
+    
+    def prefetch_contexts(
+        self,
+        repositories: Iterable[str],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Optional[str]]:
+        """
+        Fetch repository contexts concurrently and cache them.
+        
+        Each context costs blocking GitHub round-trips (repository and README),
+        so uncached repositories are fetched on a thread pool before the
+        per-PR loop; later get_repository_context calls are cache hits.
+        
+        Args:
+            repositories: Repository full names (owner/repo); duplicates are ignored
+            max_workers: Maximum number of concurrent fetches; defaults to the
+                rate limiter's max_concurrent, or 1 without a rate limiter
+        
+        Returns:
+            Dictionary mapping each repository to its context (None if unavailable)
+        """
+        repositories = list(dict.fromkeys(repositories))
+        missing = [repo for repo in repositories if repo not in self._context_cache]
+        
+        if max_workers is None:
+            max_workers = self.rate_limiter.max_concurrent if self.rate_limiter else 1
+        
+        if missing:
+            workers = min(max_workers, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = dict(
+                    zip(missing, executor.map(self.get_repository_context, missing), strict=True)
+                )
+        else:
+            fetched = {}
+        
+        return {
+            repo: fetched[repo] if repo in fetched else self._context_cache[repo]
+            for repo in repositories
+        }
     
     def extract_context_tags(
         self,
@@ -84,31 +193,20 @@ class ContextAnalyzer:
             pr_body: Optional PR body
         
         Returns:
-            List of context tags
+            Sorted list of unique context tags
         """
-        tags = []
+        tags: Set[str] = set()
         
         # Extract from repository name
         repo_lower = repository.lower()
-        if "api" in repo_lower or "backend" in repo_lower:
-            tags.append("api")
-        if "frontend" in repo_lower or "ui" in repo_lower or "web" in repo_lower:
-            tags.append("frontend")
-        if "mobile" in repo_lower or "ios" in repo_lower or "android" in repo_lower:
-            tags.append("mobile")
+        tags.update(
+            _REPOSITORY_KEYWORD_TAGS[keyword]
+            for keyword in _REPOSITORY_SCANNER.scan(repo_lower)
+        )
         
         # Extract from PR title/body
         text = f"{pr_title} {pr_body or ''}".lower()
-        if "bug" in text or "fix" in text:
-            tags.append("bugfix")
-        if "feature" in text or "add" in text:
-            tags.append("feature")
-        if "refactor" in text:
-            tags.append("refactor")
-        if "test" in text:
-            tags.append("testing")
-        if "doc" in text or "readme" in text:
-            tags.append("documentation")
-        
-        return list(set(tags))  # Remove duplicates
+        tags.update(_TEXT_KEYWORD_TAGS[keyword] for keyword in _TEXT_SCANNER.scan(text))
+        
+        return sorted(tags)
 
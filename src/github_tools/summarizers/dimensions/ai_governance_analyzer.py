@@ -2,13 +2,30 @@
 
 from typing import Any, Dict, List
 
-from github_tools.summarizers.dimensions.base import DimensionAnalyzer, DimensionResult
+from github_tools.summarizers.dimensions.base import (
+    DimensionAnalyzer,
+    DimensionResult,
+    get_pr_stats,
+)
 from github_tools.summarizers.file_pattern_detector import PRFile
 
+# PR title/body keywords indicating AI/ML work
+_AI_KEYWORDS = frozenset({"llm", "model", "gpt", "claude", "gemini", "openai"})
+# Whole words indicating AI/ML work ("ai" as a substring hits "email", "ml" hits "html")
+_AI_TOKENS = frozenset({"ai", "ml"})
+# PR title/body keywords indicating an external LLM provider (SAIF supply chain concern)
+_EXTERNAL_LLM_KEYWORDS = frozenset({"openai", "anthropic", "external api", "third-party"})
+
+# Changed-file name fragments indicating model code
+_MODEL_FILENAME_KEYWORDS = frozenset({"model", "ai", "ml", "train", "predict"})
+
 
 class AIGovernanceAnalyzer(DimensionAnalyzer):
     """Analyzes AI governance impact using SAIF framework."""
     
+    TEXT_KEYWORDS = _AI_KEYWORDS | _EXTERNAL_LLM_KEYWORDS
+    FILENAME_KEYWORDS = _MODEL_FILENAME_KEYWORDS
+    
     def analyze(
         self,
         pr_context: Dict[str, Any],
@@ -28,30 +45,21 @@ class AIGovernanceAnalyzer(DimensionAnalyzer):
         has_ai_models = "ai_model" in file_patterns
         
         # Check for LLM/AI usage in code
-        title_lower = pr_context.get("title", "").lower()
-        body_lower = pr_context.get("body", "").lower()
-        text = f"{title_lower} {body_lower}"
+        stats = get_pr_stats(pr_context, file_analysis, self.TEXT_KEYWORDS, self.FILENAME_KEYWORDS)
+        text_keywords = stats.text_keywords
         
-        has_ai_keywords = any(
-            keyword in text
-            for keyword in ["llm", "ai", "ml", "model", "gpt", "claude", "gemini", "openai"]
-        )
-        
-        # Check for model-related files
-        has_model_code = any(
-            keyword in f.filename.lower()
-            for f in file_analysis
-            for keyword in ["model", "ai", "ml", "train", "predict"]
+        has_ai_keywords = (
+            not text_keywords.isdisjoint(_AI_KEYWORDS)
+            or not stats.text_tokens.isdisjoint(_AI_TOKENS)
         )
         
         # Check for external LLM provider usage (security concern per SAIF)
-        has_external_llm = any(
-            keyword in text
-            for keyword in ["openai", "anthropic", "external api", "third-party"]
-        )
+        has_external_llm = not text_keywords.isdisjoint(_EXTERNAL_LLM_KEYWORDS)
+        
+        has_model_filenames = not stats.filename_keywords.isdisjoint(_MODEL_FILENAME_KEYWORDS)
         
         # Determine impact
-        if has_ai_models or has_ai_keywords or has_model_code:
+        if has_ai_models or has_ai_keywords or has_model_filenames:
             if has_external_llm:
                 level = "Minor"
                 description = "Minor security risks for model exfiltration and supply chain issues from using external LLM providers"
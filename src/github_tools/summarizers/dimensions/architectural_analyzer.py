@@ -2,13 +2,24 @@
 
 from typing import Any, Dict, List
 
-from github_tools.summarizers.dimensions.base import DimensionAnalyzer, DimensionResult
+from github_tools.summarizers.dimensions.base import (
+    DimensionAnalyzer,
+    DimensionResult,
+    get_pr_stats,
+)
 from github_tools.summarizers.file_pattern_detector import PRFile
 
+# PR title/body keywords for the stateless/resilient services initiative
+_STATELESS_KEYWORDS = frozenset({"stateless", "microservice", "distributed", "resilient"})
+# PR title/body keywords referencing architectural initiatives in general
+_INITIATIVE_KEYWORDS = frozenset({"initiative", "pattern", "architecture", "design", "principle"})
+
 
 class ArchitecturalAnalyzer(DimensionAnalyzer):
     """Analyzes architectural integrity and alignment."""
     
+    TEXT_KEYWORDS = _STATELESS_KEYWORDS | _INITIATIVE_KEYWORDS
+    
     def analyze(
         self,
         pr_context: Dict[str, Any],
@@ -29,24 +40,15 @@ class ArchitecturalAnalyzer(DimensionAnalyzer):
         # Check for infrastructure patterns
         has_infrastructure = "infrastructure" in file_patterns
         
-        # Analyze PR description for architectural keywords
-        title_lower = pr_context.get("title", "").lower()
-        body_lower = pr_context.get("body", "").lower()
-        text = f"{title_lower} {body_lower}"
-        
-        # Check for architectural alignment keywords
-        has_stateless_patterns = any(
-            keyword in text
-            for keyword in ["stateless", "microservice", "distributed", "resilient"]
-        )
-        
-        has_architectural_initiatives = any(
-            keyword in text
-            for keyword in ["initiative", "pattern", "architecture", "design", "principle"]
-        )
+        stats = get_pr_stats(pr_context, file_analysis, self.TEXT_KEYWORDS)
         
         # Determine assessment
         if has_iac or has_infrastructure:
+            # Check PR description for architectural alignment keywords
+            text_keywords = stats.text_keywords
+            has_stateless_patterns = not text_keywords.isdisjoint(_STATELESS_KEYWORDS)
+            has_architectural_initiatives = not text_keywords.isdisjoint(_INITIATIVE_KEYWORDS)
+            
             if has_stateless_patterns or has_architectural_initiatives:
                 level = "Strong"
                 description = "Aligns with architectural initiatives and improves system resiliency"
@@ -57,7 +59,7 @@ class ArchitecturalAnalyzer(DimensionAnalyzer):
                 description = "Infrastructure changes detected; verify alignment with architectural principles"
         else:
             # Check for structural code changes
-            has_large_changes = sum(f.additions + f.deletions for f in file_analysis) > 200
+            has_large_changes = stats.total_churn > 200
             
             if has_large_changes:
                 level = "Moderate"
@@ -1,10 +1,16 @@
 """Base class for dimension analyzers."""
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Any, Tuple
 
 from github_tools.summarizers.file_pattern_detector import PRFile
+from github_tools.summarizers.keyword_scanner import KeywordScanner
+
+# Words of the PR text, for keywords that must match whole words
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
 
 
 @dataclass
@@ -16,9 +22,121 @@ class DimensionResult:
     metadata: Optional[Dict[str, Any]] = None  # Additional metadata
 
 
+@dataclass(frozen=True, slots=True)
+class PRStats:
+    """Per-PR values derived once and shared by every dimension analyzer."""
+    title_lower: str
+    body_lower: str
+    text_lower: str  # "{title} {body}", lowercased
+    filenames_lower: Tuple[str, ...]
+    filenames_text: str  # Lowercased filenames joined by newlines, for one-pass scans
+    total_churn: int  # Additions plus deletions across all changed files
+    text_keywords: FrozenSet[str] = frozenset()  # Scanned keywords found in text_lower
+    filename_keywords: FrozenSet[str] = frozenset()  # Scanned keywords found in filenames_text
+    text_tokens: FrozenSet[str] = frozenset()  # Alphanumeric words of text_lower
+    
+    @classmethod
+    def from_pr(
+        cls,
+        pr_context: Dict[str, Any],
+        file_analysis: List[PRFile],
+        text_scanner: Optional[KeywordScanner] = None,
+        filename_scanner: Optional[KeywordScanner] = None,
+    ) -> "PRStats":
+        """
+        Derive stats from PR context and changed files.
+        
+        Args:
+            pr_context: PR context (title, body, ...)
+            file_analysis: List of changed files in PR
+            text_scanner: Scanner run once over the lowercased title and body
+            filename_scanner: Scanner run once over the lowercased filenames
+        
+        Returns:
+            PRStats for the PR
+        """
+        title_lower = (pr_context.get("title") or "").lower()
+        body_lower = (pr_context.get("body") or "").lower()
+        text_lower = f"{title_lower} {body_lower}"
+        filenames_lower = tuple(f.filename.lower() for f in file_analysis)
+        filenames_text = "\n".join(filenames_lower)
+        return cls(
+            title_lower=title_lower,
+            body_lower=body_lower,
+            text_lower=text_lower,
+            filenames_lower=filenames_lower,
+            filenames_text=filenames_text,
+            total_churn=sum(f.additions + f.deletions for f in file_analysis),
+            text_keywords=text_scanner.scan(text_lower) if text_scanner else frozenset(),
+            filename_keywords=(
+                filename_scanner.scan(filenames_text) if filename_scanner else frozenset()
+            ),
+            text_tokens=frozenset(_TOKEN_RE.findall(text_lower)),
+        )
+
+
+@lru_cache(maxsize=None)
+def keyword_scanners(
+    text_keywords: FrozenSet[str],
+    filename_keywords: FrozenSet[str],
+) -> Tuple[Optional[KeywordScanner], Optional[KeywordScanner]]:
+    """
+    Get (cached) scanners for PR text and filename keywords.
+    
+    Args:
+        text_keywords: Keywords to find in the PR title/body
+        filename_keywords: Keywords to find in changed filenames
+    
+    Returns:
+        Tuple of (text scanner, filename scanner); None for an empty keyword set
+    """
+    return (
+        KeywordScanner(text_keywords) if text_keywords else None,
+        KeywordScanner(filename_keywords) if filename_keywords else None,
+    )
+
+
+# pr_context key under which MultiDimensionalAnalyzer shares PRStats
+PR_STATS_KEY = "pr_stats"
+
+
+def get_pr_stats(
+    pr_context: Dict[str, Any],
+    file_analysis: List[PRFile],
+    text_keywords: FrozenSet[str] = frozenset(),
+    filename_keywords: FrozenSet[str] = frozenset(),
+) -> PRStats:
+    """
+    Get the shared PRStats for a PR, deriving them if the caller did not.
+    
+    Shared stats are scanned for every analyzer's keywords, so they cover
+    the keywords passed here as well.
+    
+    Args:
+        pr_context: PR context, optionally carrying PRStats under PR_STATS_KEY
+        file_analysis: List of changed files in PR
+        text_keywords: Keywords to scan the PR title/body for when deriving stats
+        filename_keywords: Keywords to scan filenames for when deriving stats
+    
+    Returns:
+        PRStats for the PR
+    """
+    stats = pr_context.get(PR_STATS_KEY)
+    if stats is None:
+        stats = PRStats.from_pr(
+            pr_context, file_analysis, *keyword_scanners(text_keywords, filename_keywords)
+        )
+    return stats
+
+
 class DimensionAnalyzer(ABC):
     """Abstract base class for dimension analyzers."""
     
+    # Lowercase keywords the analyzer looks for in the PR title/body and in
+    # changed filenames; MultiDimensionalAnalyzer scans for all of them at once
+    TEXT_KEYWORDS: FrozenSet[str] = frozenset()
+    FILENAME_KEYWORDS: FrozenSet[str] = frozenset()
+    
     @abstractmethod
     def analyze(
         self,
@@ -2,13 +2,28 @@
 
 from typing import Any, Dict, List
 
-from github_tools.summarizers.dimensions.base import DimensionAnalyzer, DimensionResult
+from github_tools.summarizers.dimensions.base import (
+    DimensionAnalyzer,
+    DimensionResult,
+    get_pr_stats,
+)
 from github_tools.summarizers.file_pattern_detector import PRFile
 
+# PR title/body keywords suggesting more or fewer provisioned resources
+_COST_UP_KEYWORDS = frozenset({"scale up", "increase", "add instance", "new resource", "provision"})
+_COST_DOWN_KEYWORDS = frozenset({"optimize", "reduce", "downsize", "remove", "delete resource"})
+# PR title/body keywords for compute/storage changes outside IAC
+_COMPUTE_KEYWORDS = frozenset({"performance", "optimization", "cache", "memory", "cpu"})
+
+# File extensions whose resource definitions drive the cost heuristics
+_IAC_SUFFIXES = (".tf", ".yaml", ".yml", ".json")
+
 
 class CostAnalyzer(DimensionAnalyzer):
     """Analyzes cost/FinOps impact of PR changes."""
     
+    TEXT_KEYWORDS = _COST_UP_KEYWORDS | _COST_DOWN_KEYWORDS | _COMPUTE_KEYWORDS
+    
     def analyze(
         self,
         pr_context: Dict[str, Any],
@@ -26,52 +41,42 @@ class CostAnalyzer(DimensionAnalyzer):
         # Check for IAC files (infrastructure changes)
         has_iac = "iac" in file_patterns
         
-        # Analyze resource changes from IAC files
-        iac_files = [f for f in file_analysis if f.filename.endswith((".tf", ".yaml", ".yml", ".json"))]
-        
-        # Simple heuristics for cost impact
-        total_additions = sum(f.additions for f in iac_files)
-        total_deletions = sum(f.deletions for f in iac_files)
-        
         # Check for resource-related keywords
-        title_lower = pr_context.get("title", "").lower()
-        body_lower = pr_context.get("body", "").lower()
-        text = f"{title_lower} {body_lower}"
-        
-        has_cost_increase_keywords = any(
-            keyword in text
-            for keyword in ["scale up", "increase", "add instance", "new resource", "provision"]
-        )
+        stats = get_pr_stats(pr_context, file_analysis, self.TEXT_KEYWORDS)
+        text_keywords = stats.text_keywords
         
-        has_cost_decrease_keywords = any(
-            keyword in text
-            for keyword in ["optimize", "reduce", "downsize", "remove", "delete resource"]
-        )
+        has_cost_decrease_keywords = not text_keywords.isdisjoint(_COST_DOWN_KEYWORDS)
         
         # Determine impact level
-        if has_iac and (total_additions > total_deletions):
-            if has_cost_increase_keywords:
-                level = "Negative"
-                description = "Infrastructure changes likely increase costs; new resources detected"
-            else:
-                level = "Neutral"
-                description = "Infrastructure changes detected; review resource costs"
-        elif has_iac and (total_deletions > total_additions):
-            if has_cost_decrease_keywords:
-                level = "Positive"
-                description = "Infrastructure changes likely reduce costs; resources removed/optimized"
+        if has_iac:
+            # Analyze resource changes from IAC files (simple heuristics)
+            total_additions = 0
+            total_deletions = 0
+            for f in file_analysis:
+                if f.filename.endswith(_IAC_SUFFIXES):
+                    total_additions += f.additions
+                    total_deletions += f.deletions
+            
+            if total_additions > total_deletions:
+                if not text_keywords.isdisjoint(_COST_UP_KEYWORDS):
+                    level = "Negative"
+                    description = "Infrastructure changes likely increase costs; new resources detected"
+                else:
+                    level = "Neutral"
+                    description = "Infrastructure changes detected; review resource costs"
+            elif total_deletions > total_additions:
+                if has_cost_decrease_keywords:
+                    level = "Positive"
+                    description = "Infrastructure changes likely reduce costs; resources removed/optimized"
+                else:
+                    level = "Neutral"
+                    description = "Infrastructure changes detected; may reduce costs"
             else:
                 level = "Neutral"
-                description = "Infrastructure changes detected; may reduce costs"
-        elif has_iac:
-            level = "Neutral"
-            description = "Infrastructure changes detected; cost impact neutral"
+                description = "Infrastructure changes detected; cost impact neutral"
         else:
             # Check for compute/storage related changes in other files
-            has_compute_changes = any(
-                keyword in text
-                for keyword in ["performance", "optimization", "cache", "memory", "cpu"]
-            )
+            has_compute_changes = not text_keywords.isdisjoint(_COMPUTE_KEYWORDS)
             
             if has_compute_changes and has_cost_decrease_keywords:
                 level = "Positive"
@@ -2,13 +2,29 @@
 
 from typing import Any, Dict, List
 
-from github_tools.summarizers.dimensions.base import DimensionAnalyzer, DimensionResult
+from github_tools.summarizers.dimensions.base import (
+    DimensionAnalyzer,
+    DimensionResult,
+    get_pr_stats,
+)
 from github_tools.summarizers.file_pattern_detector import PRFile
 
+# File extensions holding database schemas or data
+_SCHEMA_SUFFIXES = (".sql", ".db", ".schema")
+# Changed-file name fragments indicating schema definitions
+_SCHEMA_FILENAME_KEYWORDS = frozenset({"schema"})
+# PR title/body keywords indicating data, schema or privacy changes
+_DATA_KEYWORDS = frozenset({"data", "database", "schema", "privacy", "gdpr", "ccpa", "pii"})
+# PR title/body keywords indicating data access changes
+_ACCESS_KEYWORDS = frozenset({"access", "permission", "role", "grant", "revoke"})
+
 
 class DataGovernanceAnalyzer(DimensionAnalyzer):
     """Analyzes data governance impact."""
     
+    TEXT_KEYWORDS = _DATA_KEYWORDS | _ACCESS_KEYWORDS
+    FILENAME_KEYWORDS = _SCHEMA_FILENAME_KEYWORDS
+    
     def analyze(
         self,
         pr_context: Dict[str, Any],
@@ -24,29 +40,22 @@ class DataGovernanceAnalyzer(DimensionAnalyzer):
         - Schema changes
         - Privacy/compliance implications
         """
+        stats = get_pr_stats(pr_context, file_analysis, self.TEXT_KEYWORDS, self.FILENAME_KEYWORDS)
+        
         # Check for data files
         has_data_files = "data_file" in file_patterns
         
         # Check for database/schema changes
-        has_schema_changes = any(
-            f.filename.endswith((".sql", ".db", ".schema")) or "schema" in f.filename.lower()
-            for f in file_analysis
+        has_schema_changes = (
+            not stats.filename_keywords.isdisjoint(_SCHEMA_FILENAME_KEYWORDS)
+            or any(f.filename.endswith(_SCHEMA_SUFFIXES) for f in file_analysis)
         )
         
         # Check for data access changes
-        title_lower = pr_context.get("title", "").lower()
-        body_lower = pr_context.get("body", "").lower()
-        text = f"{title_lower} {body_lower}"
+        text_keywords = stats.text_keywords
         
-        has_data_keywords = any(
-            keyword in text
-            for keyword in ["data", "database", "schema", "privacy", "gdpr", "ccpa", "pii"]
-        )
-        
-        has_access_changes = any(
-            keyword in text
-            for keyword in ["access", "permission", "role", "grant", "revoke"]
-        )
+        has_data_keywords = not text_keywords.isdisjoint(_DATA_KEYWORDS)
+        has_access_changes = not text_keywords.isdisjoint(_ACCESS_KEYWORDS)
         
         # Determine impact
         if has_data_files or has_schema_changes or has_data_keywords:
@@ -1,14 +1,30 @@
 """Mentorship insights analyzer."""
 
+import re
+from itertools import islice
 from typing import Any, Dict, List
 
-from github_tools.summarizers.dimensions.base import DimensionAnalyzer, DimensionResult
+from github_tools.summarizers.dimensions.base import (
+    DimensionAnalyzer,
+    DimensionResult,
+    get_pr_stats,
+)
 from github_tools.summarizers.file_pattern_detector import PRFile
 
+# PR title/body keywords indicating explanatory, educational content
+_EDUCATIONAL_KEYWORDS = frozenset({"explain", "why", "rationale", "decision", "pattern", "design"})
+
+# PR descriptions longer than this many words count as detailed
+_DETAILED_DESCRIPTION_WORDS = 100
+# A word as str.split() sees it
+_WORD_RE = re.compile(r"\S+")
+
 
 class MentorshipAnalyzer(DimensionAnalyzer):
     """Analyzes mentorship value and knowledge sharing opportunities."""
     
+    TEXT_KEYWORDS = _EDUCATIONAL_KEYWORDS
+    
     def analyze(
         self,
         pr_context: Dict[str, Any],
@@ -24,25 +40,24 @@ class MentorshipAnalyzer(DimensionAnalyzer):
         - Educational value
         - Knowledge sharing indicators
         """
+        stats = get_pr_stats(pr_context, file_analysis, self.TEXT_KEYWORDS)
+        
         # Check for documentation changes
         has_documentation = "documentation" in file_patterns
         
-        # Analyze PR description quality
-        body = pr_context.get("body", "")
-        body_word_count = len(body.split()) if body else 0
-        
-        # Check for explanatory content
-        has_detailed_description = body_word_count > 100
+        # Check for explanatory content; words are only counted up to the
+        # threshold, so long descriptions are never split into a full word list.
+        # Lowercasing keeps word boundaries, so the shared lowered body serves
+        words = _WORD_RE.finditer(stats.body_lower)
+        has_detailed_description = (
+            sum(1 for _ in islice(words, _DETAILED_DESCRIPTION_WORDS + 1))
+            > _DETAILED_DESCRIPTION_WORDS
+        )
         
         # Check for educational keywords
-        title_lower = pr_context.get("title", "").lower()
-        body_lower = body.lower()
-        text = f"{title_lower} {body_lower}"
+        text_keywords = stats.text_keywords
         
-        has_educational_keywords = any(
-            keyword in text
-            for keyword in ["explain", "why", "rationale", "decision", "pattern", "design"]
-        )
+        has_educational_keywords = not text_keywords.isdisjoint(_EDUCATIONAL_KEYWORDS)
         
         # Build description
         insights = []
@@ -2,13 +2,30 @@
 
 from typing import Any, Dict, List
 
-from github_tools.summarizers.dimensions.base import DimensionAnalyzer, DimensionResult
+from github_tools.summarizers.dimensions.base import (
+    DimensionAnalyzer,
+    DimensionResult,
+    get_pr_stats,
+)
 from github_tools.summarizers.file_pattern_detector import PRFile
 
+# PR title/body keywords indicating deployment or infrastructure changes
+_DEPLOYMENT_KEYWORDS = frozenset({"deploy", "rollout", "release", "infrastructure", "infra"})
+# PR title/body keywords indicating monitoring/SLO configuration
+_MONITORING_KEYWORDS = frozenset({"monitor", "alert", "metric", "observability"})
+# Whole words indicating SLO/SLA definitions ("slo" as a substring hits "slow")
+_MONITORING_TOKENS = frozenset({"slo", "slos", "sla", "slas"})
+
+# Changed-file name fragments indicating monitoring/alerting configuration
+_MONITORING_FILENAME_KEYWORDS = frozenset({"monitor", "alert", "metric"})
+
 
 class OperationalAnalyzer(DimensionAnalyzer):
     """Analyzes operational impact of PR changes."""
     
+    TEXT_KEYWORDS = _DEPLOYMENT_KEYWORDS | _MONITORING_KEYWORDS
+    FILENAME_KEYWORDS = _MONITORING_FILENAME_KEYWORDS
+    
     def analyze(
         self,
         pr_context: Dict[str, Any],
@@ -24,28 +41,21 @@ class OperationalAnalyzer(DimensionAnalyzer):
         - SLO/SLA implications
         - Alert configuration
         """
+        stats = get_pr_stats(pr_context, file_analysis, self.TEXT_KEYWORDS, self.FILENAME_KEYWORDS)
+        
         # Check for infrastructure/deployment changes
         has_infrastructure = "infrastructure" in file_patterns or "iac" in file_patterns
         
         # Check for monitoring/alerts configuration
-        has_monitoring = any(
-            "monitor" in f.filename.lower() or "alert" in f.filename.lower() or "metric" in f.filename.lower()
-            for f in file_analysis
-        )
+        has_monitoring = not stats.filename_keywords.isdisjoint(_MONITORING_FILENAME_KEYWORDS)
         
         # Check deployment-related keywords
-        title_lower = pr_context.get("title", "").lower()
-        body_lower = pr_context.get("body", "").lower()
-        text = f"{title_lower} {body_lower}"
-        
-        has_deployment_changes = any(
-            keyword in text
-            for keyword in ["deploy", "rollout", "release", "infrastructure", "infra"]
-        )
+        text_keywords = stats.text_keywords
         
-        has_monitoring_keywords = any(
-            keyword in text
-            for keyword in ["monitor", "alert", "metric", "slo", "sla", "observability"]
+        has_deployment_changes = not text_keywords.isdisjoint(_DEPLOYMENT_KEYWORDS)
+        has_monitoring_keywords = (
+            not text_keywords.isdisjoint(_MONITORING_KEYWORDS)
+            or not stats.text_tokens.isdisjoint(_MONITORING_TOKENS)
         )
         
         # Build description
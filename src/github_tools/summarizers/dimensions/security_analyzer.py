@@ -2,13 +2,31 @@
 
 from typing import Any, Dict, List
 
-from github_tools.summarizers.dimensions.base import DimensionAnalyzer, DimensionResult
+from github_tools.summarizers.dimensions.base import (
+    DimensionAnalyzer,
+    DimensionResult,
+    get_pr_stats,
+)
 from github_tools.summarizers.file_pattern_detector import PRFile
 
+# PR title/body keywords indicating new external exposure
+_EXPOSURE_KEYWORDS = frozenset({"expose", "public", "external", "endpoint"})
+# Whole words indicating new external exposure ("api" as a substring hits "rapid")
+_EXPOSURE_TOKENS = frozenset({"api", "apis"})
+# PR title/body keywords indicating authentication/authorization changes
+_AUTH_KEYWORDS = frozenset({"auth", "authentication", "authorization", "login", "token"})
+# Source extensions checked for routing changes
+_ROUTE_SUFFIXES = (".py", ".js", ".java")
+# Changed-file name fragments indicating routing code
+_ROUTE_FILENAME_KEYWORDS = frozenset({"route"})
+
 
 class SecurityAnalyzer(DimensionAnalyzer):
     """Analyzes security impact of PR changes."""
     
+    TEXT_KEYWORDS = _EXPOSURE_KEYWORDS | _AUTH_KEYWORDS
+    FILENAME_KEYWORDS = _ROUTE_FILENAME_KEYWORDS
+    
     def analyze(
         self,
         pr_context: Dict[str, Any],
@@ -29,18 +47,17 @@ class SecurityAnalyzer(DimensionAnalyzer):
         has_security_config = "security_config" in file_patterns
         
         # Check for network/external exposure indicators
-        title_lower = pr_context.get("title", "").lower()
-        body_lower = pr_context.get("body", "").lower()
-        has_external_exposure = any(
-            keyword in title_lower or keyword in body_lower
-            for keyword in ["expose", "public", "external", "endpoint", "api"]
+        # None of these keywords contains a space, so none can span the
+        # title/body join in the shared text scan
+        stats = get_pr_stats(pr_context, file_analysis, self.TEXT_KEYWORDS, self.FILENAME_KEYWORDS)
+        text_keywords = stats.text_keywords
+        has_external_exposure = (
+            not text_keywords.isdisjoint(_EXPOSURE_KEYWORDS)
+            or not stats.text_tokens.isdisjoint(_EXPOSURE_TOKENS)
         )
         
         # Check for authentication changes
-        has_auth_changes = any(
-            keyword in title_lower or keyword in body_lower
-            for keyword in ["auth", "authentication", "authorization", "login", "token"]
-        )
+        has_auth_changes = not text_keywords.isdisjoint(_AUTH_KEYWORDS)
         
         # Determine impact level
         if has_security_config or has_auth_changes:
@@ -54,10 +71,14 @@ class SecurityAnalyzer(DimensionAnalyzer):
             level = "Medium"
             description = "New external exposure detected; validate network perimeter and access controls"
         else:
-            # Analyze file patterns for potential security concerns
-            has_network_files = any(
-                f.filename.endswith((".py", ".js", ".java")) and "route" in f.filename.lower()
-                for f in file_analysis
+            # Analyze file patterns for potential security concerns; files are
+            # only walked when some changed filename mentions routing at all
+            has_network_files = (
+                not stats.filename_keywords.isdisjoint(_ROUTE_FILENAME_KEYWORDS)
+                and any(
+                    f.filename.endswith(_ROUTE_SUFFIXES) and "route" in filename
+                    for f, filename in zip(file_analysis, stats.filenames_lower, strict=True)
+                )
             )
             
             if has_network_files:
@@ -1,10 +1,15 @@
 """File pattern detector for identifying file types and categories."""
 
+import fnmatch
+import os
+import re
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
 from functools import lru_cache
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple
 
+from github_tools.summarizers.keyword_scanner import KeywordScanner
 from github_tools.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -44,6 +49,124 @@ class PRFile:
     sha: Optional[str] = None
 
 
+def _required_literal(glob: str) -> Optional[str]:
+    """
+    Get the longest literal run every name matching a glob must contain.
+    
+    Args:
+        glob: fnmatch-style pattern
+    
+    Returns:
+        Literal substring (normcased like fnmatch does), or None if the
+        glob has no literal run or uses character classes
+    """
+    if "[" in glob:
+        return None
+    literal = max(re.split(r"[*?]", glob), key=len)
+    return os.path.normcase(literal) or None
+
+
+def _compile_globs(globs: Iterable[str]) -> Pattern[str]:
+    """
+    Compile fnmatch globs into one regex matching any of them.
+    
+    Args:
+        globs: fnmatch-style patterns
+    
+    Returns:
+        Compiled regex; ``regex.match(os.path.normcase(name))`` succeeds
+        exactly when ``fnmatch.fnmatch(name, glob)`` does for some glob
+    """
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(os.path.normcase(glob))})" for glob in globs)
+    )
+
+
+def _glob_suffix(glob: str) -> Optional[str]:
+    """
+    Get the suffix a ``*<suffix>`` glob (e.g. ``*.pkl``) stands for.
+    
+    Args:
+        glob: fnmatch-style pattern
+    
+    Returns:
+        Normcased suffix such that the glob matches exactly the names ending
+        with it, or None for any other glob
+    """
+    if glob.startswith("*") and not any(c in glob[1:] for c in "*?["):
+        return os.path.normcase(glob[1:])
+    return None
+
+
+def _path_globs(path_patterns: List[str]) -> List[str]:
+    """
+    Expand path patterns to the globs they match with, at any depth.
+    
+    Args:
+        path_patterns: Path patterns of a FilePattern
+    
+    Returns:
+        Each pattern followed by its ``**/`` variant; patterns already
+        starting with ``**/`` get none, since fnmatch's ``**`` is a plain
+        ``*`` and the variant could only match a subset of what they match
+    """
+    return [
+        glob
+        for pp in path_patterns
+        for glob in ((pp,) if pp.startswith("**/") else (pp, f"**/{pp}"))
+    ]
+
+
+class _LiteralPrefilter:
+    """
+    Narrows an ordered list of glob rules to the ones a filename can match.
+    
+    A glob can only match names containing its longest literal run, so one
+    KeywordScanner pass over the filename (Aho-Corasick when available)
+    finds the candidate rules; checking just those, in rule order, gives
+    the same first match as trying every rule.
+    """
+    
+    def __init__(self, rules: List[List[str]]):
+        """
+        Initialize prefilter.
+        
+        Args:
+            rules: Globs of each rule, in priority order; a rule is a
+                candidate when any of its globs' literals occurs
+        """
+        self._by_literal: Dict[str, List[int]] = defaultdict(list)
+        self._always: Set[int] = set()
+        for index, globs in enumerate(rules):
+            for glob in globs:
+                literal = _required_literal(glob)
+                if literal is None:
+                    self._always.add(index)
+                else:
+                    self._by_literal[literal].append(index)
+        self._scanner = KeywordScanner(self._by_literal) if self._by_literal else None
+    
+    def candidates(self, name: str) -> List[int]:
+        """
+        Get the indices of rules that may match a filename.
+        
+        Args:
+            name: File path/name, normcased
+        
+        Returns:
+            Rule indices in priority order
+        """
+        found = set(self._always)
+        if self._scanner is not None:
+            for literal in self._scanner.scan(name):
+                found.update(self._by_literal[literal])
+        return sorted(found)
+
+
+# Filenames whose category each detector remembers
+_CATEGORY_CACHE_SIZE = 8192
+
+
 class FilePatternDetector:
     """
     Detects file patterns and categorizes files for dimensional analysis.
@@ -149,7 +272,7 @@ class FilePatternDetector:
         FilePattern("spec/**", FileCategory.TEST, path_patterns=["spec/**", "**/spec/**"]),
     ]
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize file pattern detector with all patterns."""
         self.all_patterns: List[FilePattern] = (
             self.IAC_PATTERNS +
@@ -161,13 +284,59 @@ class FilePatternDetector:
             self.DOCUMENTATION_PATTERNS +
             self.TEST_PATTERNS
         )
+        
+        # Globs are translated to regexes once here rather than by fnmatch on
+        # every lookup (its own compile cache is small and keyed per call)
+        path_regexes = [
+            _compile_globs(_path_globs(p.path_patterns)) if p.path_patterns else None
+            for p in self.all_patterns
+        ]
+        
+        # Extension pass: lowercased extension -> (pattern, path regex) for
+        # the patterns declaring it, in priority order and cut after the first
+        # one without path patterns (later ones can never be reached)
+        self._extension_patterns: Dict[str, List[Tuple[FilePattern, Optional[Pattern[str]]]]] = {}
+        for pattern, path_regex in zip(self.all_patterns, path_regexes, strict=True):
+            for ext in dict.fromkeys(e.lower() for e in pattern.extensions or ()):
+                candidates = self._extension_patterns.setdefault(ext, [])
+                if not candidates or candidates[-1][1] is not None:
+                    candidates.append((pattern, path_regex))
+        
+        # Path and glob passes: only patterns whose literal text occurs in the
+        # filename are tried against their regex. Several pattern lists repeat
+        # the same globs (e.g. "*.yaml"); a repeat can only match when the
+        # first occurrence already did, so each glob is kept once, in its
+        # first (winning) position
+        path_rules: Dict[Tuple[str, ...], Tuple[FileCategory, Pattern[str]]] = {}
+        for pattern, path_regex in zip(self.all_patterns, path_regexes, strict=True):
+            if path_regex is not None:
+                path_rules.setdefault(tuple(pattern.path_patterns or ()), (pattern.category, path_regex))
+        self._path_rules = list(path_rules.values())
+        self._path_prefilter = _LiteralPrefilter([list(globs) for globs in path_rules])
+        # Most globs are plain "*.<ext>" suffixes: those are checked with
+        # str.endswith and never compiled
+        glob_categories: Dict[str, FileCategory] = {}
+        for pattern in self.all_patterns:
+            glob_categories.setdefault(pattern.pattern, pattern.category)
+        self._glob_rules: List[Tuple[FileCategory, Optional[str], Optional[Pattern[str]]]] = []
+        for glob, category in glob_categories.items():
+            suffix = _glob_suffix(glob)
+            glob_regex = None if suffix is not None else _compile_globs([glob])
+            self._glob_rules.append((category, suffix, glob_regex))
+        self._glob_prefilter = _LiteralPrefilter([[glob] for glob in glob_categories])
+        
+        # Per-instance memo (a cache on the method itself would be shared by
+        # every detector and keep them alive)
+        self._cached_detect_category = lru_cache(maxsize=_CATEGORY_CACHE_SIZE)(
+            self._detect_category_uncached
+        )
     
-    @lru_cache(maxsize=1000)
     def detect_category(self, filename: str) -> FileCategory:
         """
         Detect file category from filename.
         
-        Cached for performance (same filename patterns repeat frequently).
+        Results are memoized per detector, so the same file classified by
+        detect_patterns and the get_*_files helpers is only matched once.
         
         Args:
             filename: File path/name
@@ -175,44 +344,65 @@ class FilePatternDetector:
         Returns:
             FileCategory enum value
         """
-        import os
+        return self._cached_detect_category(filename)
+    
+    def _detect_category_uncached(self, filename: str) -> FileCategory:
+        """
+        Match filename against the pattern indexes.
+        
+        Args:
+            filename: File path/name
         
+        Returns:
+            FileCategory enum value
+        """
         # Get file extension
         _, ext = os.path.splitext(filename)
         ext_lower = ext.lower()
         
+        # Globs match like fnmatch: against the normcased name
+        name = os.path.normcase(filename)
+        
         # Check extension-based patterns first (fastest)
-        for pattern in self.all_patterns:
-            if pattern.extensions and ext_lower in [e.lower() for e in pattern.extensions]:
-                # Double-check path patterns if specified
-                if pattern.path_patterns:
-                    if any(self._match_path_pattern(filename, pp) for pp in pattern.path_patterns):
-                        return pattern.category
-                else:
-                    return pattern.category
+        for pattern, path_regex in self._extension_patterns.get(ext_lower, ()):
+            # Double-check path patterns if specified
+            if path_regex is None or path_regex.match(name):
+                return pattern.category
         
         # Check path-based patterns
-        for pattern in self.all_patterns:
-            if pattern.path_patterns:
-                if any(self._match_path_pattern(filename, pp) for pp in pattern.path_patterns):
-                    return pattern.category
+        for index in self._path_prefilter.candidates(name):
+            category, path_regex = self._path_rules[index]
+            if path_regex.match(name):
+                return category
         
         # Check glob-like patterns
-        for pattern in self.all_patterns:
-            if self._match_pattern(filename, pattern.pattern):
-                return pattern.category
+        for index in self._glob_prefilter.candidates(name):
+            category, suffix, glob_regex = self._glob_rules[index]
+            if suffix is not None:
+                matched = name.endswith(suffix)
+            else:
+                matched = glob_regex is not None and glob_regex.match(name) is not None
+            if matched:
+                return category
         
         return FileCategory.UNKNOWN
     
-    def _match_path_pattern(self, filename: str, pattern: str) -> bool:
-        """Match filename against path pattern."""
-        import fnmatch
-        return fnmatch.fnmatch(filename, pattern) or fnmatch.fnmatch(filename, f"**/{pattern}")
-    
-    def _match_pattern(self, filename: str, pattern: str) -> bool:
-        """Match filename against glob pattern."""
-        import fnmatch
-        return fnmatch.fnmatch(filename, pattern)
+    def categorize(self, files: List[PRFile]) -> Dict[FileCategory, List[PRFile]]:
+        """
+        Group files by category in a single pass.
+        
+        Args:
+            files: List of PRFile objects
+        
+        Returns:
+            Dictionary mapping each category present to its files, in input order
+        """
+        categorized: Dict[FileCategory, List[PRFile]] = defaultdict(list)
+        detect_category = self.detect_category
+        for file in files:
+            categorized[detect_category(file.filename)].append(file)
+        # Plain dict so lookups of absent categories don't insert empty lists
+        return dict(categorized)
     
     def detect_patterns(self, files: List[PRFile]) -> Dict[str, List[str]]:
         """
@@ -224,38 +414,73 @@ class FilePatternDetector:
         Returns:
             Dictionary mapping category names to lists of filenames
         """
-        categorized: Dict[str, List[str]] = {}
+        categorized = {
+            category.value: [f.filename for f in category_files]
+            for category, category_files in self.categorize(files).items()
+        }
         
-        for file in files:
-            category = self.detect_category(file.filename)
-            category_key = category.value
-            
-            if category_key not in categorized:
-                categorized[category_key] = []
-            
-            categorized[category_key].append(file.filename)
-        
-        logger.debug(f"Detected patterns: {len(categorized)} categories, {sum(len(files) for files in categorized.values())} files")
+        logger.debug(f"Detected patterns: {len(categorized)} categories, {len(files)} files")
         
         return categorized
     
-    def get_iac_files(self, files: List[PRFile]) -> List[PRFile]:
+    # The get_*_files helpers accept the result of categorize() so a caller
+    # that needs several of them classifies the files only once
+    def get_iac_files(
+        self,
+        files: List[PRFile],
+        categorized: Optional[Dict[FileCategory, List[PRFile]]] = None,
+    ) -> List[PRFile]:
         """Get all IAC files from file list."""
-        return [f for f in files if self.detect_category(f.filename) == FileCategory.IAC]
+        return self._files_in(FileCategory.IAC, files, categorized)
     
-    def get_ai_model_files(self, files: List[PRFile]) -> List[PRFile]:
+    def get_ai_model_files(
+        self,
+        files: List[PRFile],
+        categorized: Optional[Dict[FileCategory, List[PRFile]]] = None,
+    ) -> List[PRFile]:
         """Get all AI/ML model files from file list."""
-        return [f for f in files if self.detect_category(f.filename) == FileCategory.AI_MODEL]
+        return self._files_in(FileCategory.AI_MODEL, files, categorized)
     
-    def get_data_files(self, files: List[PRFile]) -> List[PRFile]:
+    def get_data_files(
+        self,
+        files: List[PRFile],
+        categorized: Optional[Dict[FileCategory, List[PRFile]]] = None,
+    ) -> List[PRFile]:
         """Get all data files from file list."""
-        return [f for f in files if self.detect_category(f.filename) == FileCategory.DATA_FILE]
+        return self._files_in(FileCategory.DATA_FILE, files, categorized)
     
-    def get_config_files(self, files: List[PRFile]) -> List[PRFile]:
+    def get_config_files(
+        self,
+        files: List[PRFile],
+        categorized: Optional[Dict[FileCategory, List[PRFile]]] = None,
+    ) -> List[PRFile]:
         """Get all configuration files from file list."""
-        return [f for f in files if self.detect_category(f.filename) in [FileCategory.CONFIG, FileCategory.SECURITY_CONFIG]]
+        if categorized is None:
+            categorized = self.categorize(files)
+        config = categorized.get(FileCategory.CONFIG, [])
+        security = categorized.get(FileCategory.SECURITY_CONFIG, [])
+        if not (config and security):
+            return list(config or security)
+        # Interleave both buckets back into input order
+        selected = {id(f) for f in config}
+        selected.update(id(f) for f in security)
+        return [f for f in files if id(f) in selected]
     
-    def get_security_config_files(self, files: List[PRFile]) -> List[PRFile]:
+    def get_security_config_files(
+        self,
+        files: List[PRFile],
+        categorized: Optional[Dict[FileCategory, List[PRFile]]] = None,
+    ) -> List[PRFile]:
         """Get all security configuration files from file list."""
-        return [f for f in files if self.detect_category(f.filename) == FileCategory.SECURITY_CONFIG]
-
+        return self._files_in(FileCategory.SECURITY_CONFIG, files, categorized)
+    
+    def _files_in(
+        self,
+        category: FileCategory,
+        files: List[PRFile],
+        categorized: Optional[Dict[FileCategory, List[PRFile]]],
+    ) -> List[PRFile]:
+        """Get the files of one category, categorizing them if the caller did not."""
+        if categorized is None:
+            categorized = self.categorize(files)
+        return list(categorized.get(category, []))
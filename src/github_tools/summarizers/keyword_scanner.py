@@ -0,0 +1,109 @@
+"""Single-pass keyword matching for PR text analysis."""
+
+import threading
+from typing import FrozenSet, Iterable, Set
+
+# hyperscan support - optional, SIMD literal matching of every keyword at once
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None  # type: ignore
+
+# pyahocorasick support - optional, matches every keyword in one pass over the text
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # type: ignore
+
+__all__ = ["KeywordScanner"]
+
+
+class KeywordScanner:
+    """
+    Finds which of a fixed set of keywords occur in a text.
+    
+    Keywords match as plain substrings, exactly like ``keyword in text``.
+    The keywords are compiled once into the fastest available matcher: a
+    Hyperscan literal database when hyperscan is installed, else an
+    Aho-Corasick automaton when pyahocorasick is, so a text is scanned in a
+    single pass no matter how many keywords there are; otherwise each
+    keyword is checked with the C substring search.
+    """
+    
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Initialize keyword scanner.
+        
+        Args:
+            keywords: Keywords to look for (matched case-sensitively)
+        
+        Raises:
+            ValueError: If no keywords are given
+        """
+        self.keywords: FrozenSet[str] = frozenset(keywords)
+        if not self.keywords:
+            raise ValueError("KeywordScanner needs at least one keyword")
+        
+        self._database = None
+        self._automaton = None
+        if hyperscan is not None:
+            # Scan results are reported by expression id
+            self._ordered_keywords = sorted(self.keywords)
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[keyword.encode("utf-8") for keyword in self._ordered_keywords],
+                ids=list(range(len(self._ordered_keywords))),
+                elements=len(self._ordered_keywords),
+                flags=hyperscan.HS_FLAG_SINGLEMATCH,
+                literal=True,
+            )
+            self._database = database
+            # Scratch space can't be shared by concurrent scans, so each
+            # thread gets its own
+            self._scratch = threading.local()
+        elif ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+    
+    def scan(self, text: str) -> FrozenSet[str]:
+        """
+        Find the keywords that occur in text.
+        
+        Args:
+            text: Text to scan (callers lowercase it for case-insensitive matching)
+        
+        Returns:
+            Set of keywords found in text
+        """
+        if self._database is not None:
+            return self._scan_hyperscan(text)
+        if self._automaton is not None:
+            return frozenset(keyword for _, keyword in self._automaton.iter(text))
+        return frozenset(keyword for keyword in self.keywords if keyword in text)
+    
+    def _scan_hyperscan(self, text: str) -> FrozenSet[str]:
+        """
+        Find the keywords that occur in text with the Hyperscan database.
+        
+        Args:
+            text: Text to scan
+        
+        Returns:
+            Set of keywords found in text
+        """
+        database = self._database
+        assert database is not None
+        scratch = getattr(self._scratch, "scratch", None)
+        if scratch is None:
+            scratch = self._scratch.scratch = hyperscan.Scratch(database)
+        
+        found: Set[int] = set()
+        database.scan(
+            text.encode("utf-8"),
+            match_event_handler=lambda keyword_id, start, end, flags, context: found.add(keyword_id),
+            scratch=scratch,
+        )
+        return frozenset(self._ordered_keywords[keyword_id] for keyword_id in found)
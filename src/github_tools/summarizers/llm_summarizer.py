@@ -1,6 +1,9 @@
 """LLM-based PR summarization using provider abstraction."""
 
-from typing import Any, Dict, List, Optional
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from github_tools.models.contribution import Contribution
 from github_tools.summarizers.providers import (
@@ -14,10 +17,29 @@ from github_tools.summarizers.file_pattern_detector import PRFile
 from github_tools.summarizers.multi_dimensional_analyzer import MultiDimensionalAnalyzer
 from github_tools.summarizers.prompts.dimensional_prompts import create_dimensional_prompt
 from github_tools.summarizers.parsers.dimensional_parser import DimensionalParser
+from github_tools.utils.cache import FileCache
 from github_tools.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Cached responses are keyed by a hash of the full prompt and provider settings,
+# so an entry only goes stale when the provider's model itself changes
+SUMMARY_CACHE_TTL_HOURS = 24 * 30
+
+
+@lru_cache(maxsize=None)
+def _shared_dimensional_analyzer() -> MultiDimensionalAnalyzer:
+    """
+    Get the dimensional analyzer shared by every summarizer in the process.
+    
+    The analyzer keeps no per-PR state, so one instance (and its filename
+    category memo) serves all summarizers and threads.
+    
+    Returns:
+        Shared MultiDimensionalAnalyzer instance
+    """
+    return MultiDimensionalAnalyzer()
+
 
 class LLMSummarizer:
     """
@@ -28,6 +50,9 @@ class LLMSummarizer:
     (OpenAI, Claude Desktop, Cursor, Gemini, etc.) through provider abstraction.
     """
     
+    # Provider requests summarize_many keeps in flight by default
+    DEFAULT_MAX_CONCURRENCY = 4
+    
     def __init__(
         self,
         provider: Optional[LLMProvider] = None,
@@ -39,6 +64,7 @@ class LLMSummarizer:
         # Provider configuration
         provider_config: Optional[dict] = None,
         auto_detect: bool = True,
+        cache: Optional[FileCache] = None,
     ):
         """
         Initialize LLM summarizer.
@@ -51,12 +77,19 @@ class LLMSummarizer:
             max_tokens: Maximum tokens for summary (legacy, for backward compatibility)
             provider_config: Provider-specific configuration dictionary
             auto_detect: If True and provider_name not specified, auto-detect available provider
+            cache: Optional cache for generated summaries and dimensional
+                analyses, keyed by prompt hash
         """
         self.provider = provider
         self.provider_name = provider_name
         self.max_tokens = max_tokens
         self.provider_config = provider_config or {}
         self.auto_detect = auto_detect
+        self.cache = cache
+        # Providers created by summarize_with_fallback, by name
+        self._fallback_providers: Dict[str, Optional[LLMProvider]] = {}
+        # Set to the shared analyzer on first dimensional analysis
+        self._dimensional_analyzer: Optional[MultiDimensionalAnalyzer] = None
         
         # Initialize provider if not provided directly
         if self.provider is None:
@@ -107,7 +140,19 @@ class LLMSummarizer:
                 f"Check configuration and ensure the provider is running/configured."
             )
         
-        logger.debug(f"Using LLM provider: {self.provider.get_metadata().get('name')}")
+        provider_name = self.provider.get_metadata().get("name")
+        logger.debug(f"Using LLM provider: {provider_name}")
+        
+        # Everything besides the prompt that determines what the provider returns
+        self._cache_namespace = "|".join(
+            str(part) for part in (
+                provider_name,
+                getattr(self.provider, "model", ""),
+                getattr(self.provider, "max_tokens", ""),
+                getattr(self.provider, "temperature", ""),
+                getattr(self.provider, "stream_max_sentences", None),
+            )
+        )
     
     def _get_provider_config(self, provider_name: str) -> dict:
         """Get provider-specific configuration."""
@@ -125,6 +170,24 @@ class LLMSummarizer:
         
         return config
     
+    def _get_fallback_provider(self, provider_name: str) -> Optional[LLMProvider]:
+        """
+        Get a fallback provider instance, creating it on first use.
+        
+        Instances (and the HTTP clients they hold) are kept for the
+        summarizer's lifetime, since provider configuration doesn't change.
+        
+        Args:
+            provider_name: Provider name
+        
+        Returns:
+            Provider instance, or None if it could not be created
+        """
+        if provider_name not in self._fallback_providers:
+            config = self._get_provider_config(provider_name)
+            self._fallback_providers[provider_name] = get_provider(provider_name, **config)
+        return self._fallback_providers[provider_name]
+    
     def summarize(
         self,
         contribution: Contribution,
@@ -159,14 +222,134 @@ class LLMSummarizer:
             repository_context=repository_context,
         )
         
+        cache = self.cache
+        if cache is not None:
+            cache_key = self._prompt_cache_key(cache, "pr_summary", prompt)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Using cached summary for {contribution.id}")
+                return str(cached)
+        
         try:
             # Use provider to generate summary
             summary = self.provider.summarize(prompt)
-            return summary
         except Exception as e:
             logger.error(f"Failed to generate PR summary: {e}")
             # Fallback to simple summary
             return self._fallback_summary(title, body)
+        
+        if cache is not None:
+            cache.set(cache_key, summary, ttl_hours=SUMMARY_CACHE_TTL_HOURS)
+        return summary
+    
+    def _prompt_cache_key(self, cache: FileCache, prefix: str, *request_parts: Any) -> str:
+        """
+        Build the cache key for a provider request.
+        
+        Args:
+            cache: Cache the key is built for
+            prefix: Cache key prefix for the kind of response (e.g. "pr_summary")
+            *request_parts: Prompts and per-request settings sent to the provider
+        
+        Returns:
+            Cache key derived from the provider settings and the request
+        """
+        request = "|".join(str(part) for part in (self._cache_namespace, *request_parts))
+        digest = hashlib.blake2b(request.encode("utf-8"), digest_size=20).hexdigest()
+        return cache._get_cache_key(prefix, digest=digest)
+    
+    def summarize_many(
+        self,
+        contributions: Iterable[Contribution],
+        repository_context: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Iterator[Union[str, Exception]]:
+        """
+        Summarize several pull requests with concurrent provider requests.
+        
+        Provider calls are network-bound, so up to max_concurrency of them run
+        on worker threads at once. Results are yielded in input order as soon
+        as each one (and every one before it) is ready.
+        
+        Args:
+            contributions: PR contributions to summarize
+            repository_context: Optional repository context/description
+            max_concurrency: Maximum requests in flight; 1 summarizes sequentially
+        
+        Yields:
+            Summary string per contribution, or the exception summarize raised for it
+        """
+        return self._map_concurrently(
+            lambda contribution: self.summarize(contribution, repository_context),
+            contributions,
+            max_concurrency,
+        )
+    
+    def summarize_dimensional_many(
+        self,
+        contributions: Iterable[Tuple[Contribution, List[PRFile]]],
+        repository_context: Optional[str] = None,
+        use_llm: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Iterator[Union[Dict[str, Any], Exception]]:
+        """
+        Run dimensional analysis on several pull requests concurrently.
+        
+        Works like summarize_many, calling summarize_dimensional for each PR.
+        
+        Args:
+            contributions: Pairs of PR contribution and its changed files
+            repository_context: Optional repository context/description
+            use_llm: If True, use LLM for enhanced analysis; otherwise use rule-based only
+            max_concurrency: Maximum requests in flight; 1 analyzes sequentially
+        
+        Yields:
+            Analysis dictionary per contribution, or the exception raised for it
+        """
+        return self._map_concurrently(
+            lambda item: self.summarize_dimensional(
+                item[0], item[1], repository_context, use_llm=use_llm
+            ),
+            contributions,
+            max_concurrency,
+        )
+    
+    @staticmethod
+    def _map_concurrently(
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        max_concurrency: int,
+    ) -> Iterator[Any]:
+        """
+        Apply func to each item on worker threads, yielding results in input order.
+        
+        Args:
+            func: Function to call per item
+            items: Items to process
+            max_concurrency: Maximum calls in flight; 1 runs them sequentially
+        
+        Yields:
+            func's result per item, or the exception it raised
+        """
+        if max_concurrency <= 1:
+            for item in items:
+                try:
+                    yield func(item)
+                except Exception as e:
+                    yield e
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            futures = [executor.submit(func, item) for item in items]
+            for future in futures:
+                try:
+                    yield future.result()
+                except Exception as e:
+                    yield e
+        finally:
+            # Drop queued requests if the caller stops consuming early
+            executor.shutdown(wait=True, cancel_futures=True)
     
     def summarize_dimensional(
         self,
@@ -192,7 +375,7 @@ class LLMSummarizer:
         
         # Initialize dimensional analyzer if needed
         if self._dimensional_analyzer is None:
-            self._dimensional_analyzer = MultiDimensionalAnalyzer()
+            self._dimensional_analyzer = _shared_dimensional_analyzer()
         
         # Extract PR context
         title = contribution.title or ""
@@ -204,24 +387,28 @@ class LLMSummarizer:
             "repository": contribution.repository,
         }
         
+        # Detected once for both the LLM prompt and the rule-based fallback
+        file_patterns = self._dimensional_analyzer.pattern_detector.detect_patterns(files)
+        
         if use_llm:
             try:
                 # Use LLM for enhanced dimensional analysis
                 return self._llm_dimensional_analysis(
-                    pr_context, files, repository_context
+                    pr_context, files, repository_context, file_patterns
                 )
             except Exception as e:
                 logger.warning(f"LLM dimensional analysis failed, falling back to rule-based: {e}")
                 # Fall through to rule-based analysis
         
         # Rule-based dimensional analysis (fallback)
-        dimensional_results = self._dimensional_analyzer.analyze(pr_context, files)
+        dimensional_results = self._dimensional_analyzer.analyze(pr_context, files, file_patterns)
         
         # Generate base summary
         base_summary = title
         if body:
             # Use first sentence of body as summary
-            first_sentence = body.split('.')[0] if '.' in body else body[:100]
+            end = body.find('.')
+            first_sentence = body[:end] if end >= 0 else body[:100]
             base_summary = f"{title}: {first_sentence}"
         
         # Format summary using orchestrator
@@ -247,6 +434,7 @@ class LLMSummarizer:
         pr_context: Dict[str, str],
         files: List[PRFile],
         repository_context: Optional[str] = None,
+        file_patterns: Optional[Dict[str, List[str]]] = None,
     ) -> Dict[str, Any]:
         """
         Perform LLM-based dimensional analysis.
@@ -255,15 +443,17 @@ class LLMSummarizer:
             pr_context: PR context dictionary
             files: List of changed files
             repository_context: Optional repository context
+            file_patterns: Categorized file patterns (detected from files if None)
         
         Returns:
             Parsed dimensional analysis results
         """
         # Get file patterns
         if self._dimensional_analyzer is None:
-            self._dimensional_analyzer = MultiDimensionalAnalyzer()
+            self._dimensional_analyzer = _shared_dimensional_analyzer()
         
-        file_patterns = self._dimensional_analyzer.pattern_detector.detect_patterns(files)
+        if file_patterns is None:
+            file_patterns = self._dimensional_analyzer.pattern_detector.detect_patterns(files)
         
         # Create prompt
         system_prompt, user_prompt = create_dimensional_prompt(
@@ -275,17 +465,31 @@ class LLMSummarizer:
         )
         
         # Call LLM with optimized settings
-        try:
-            response = self.provider.summarize(
-                user_prompt,
-                system_prompt=system_prompt,
-                max_tokens=800,  # More tokens for structured analysis (covers all 7 dimensions)
-                temperature=0.3,  # Lower temperature for consistent structured output
+        max_tokens = 500  # Covers all 7 dimensions at the prompt's 120-character descriptions
+        temperature = 0.3  # Lower temperature for consistent structured output
+        cache = self.cache
+        if cache is not None:
+            cache_key = self._prompt_cache_key(
+                cache, "pr_dimensional", system_prompt, user_prompt, max_tokens, temperature
             )
+        try:
+            cached = cache.get(cache_key) if cache is not None else None
+            if cached is not None:
+                response = cached
+            else:
+                response = self.provider.summarize(
+                    user_prompt,
+                    system_prompt=system_prompt,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                )
             
             # Parse response
             parser = DimensionalParser()
             parsed = parser.parse_response(response)
+            # Only responses that parsed are worth replaying
+            if cache is not None and cached is None:
+                cache.set(cache_key, response, ttl_hours=SUMMARY_CACHE_TTL_HOURS)
             
             # Convert to dimension results for consistency
             dimension_results = parser.to_dimension_results(parsed)
@@ -336,21 +540,21 @@ class LLMSummarizer:
         """
         providers_to_try = fallback_providers or detect_available_providers(self.provider_config)
         
+        prompt = self._build_prompt(
+            title=contribution.title or "",
+            body=contribution.metadata.get("body", "") if contribution.metadata else "",
+            repository=contribution.repository,
+            base_branch=contribution.metadata.get("base_branch", "") if contribution.metadata else "",
+            head_branch=contribution.metadata.get("head_branch", "") if contribution.metadata else "",
+            repository_context=repository_context,
+        )
+        
         last_exception = None
         for provider_name in providers_to_try:
             try:
-                config = self._get_provider_config(provider_name)
-                provider = get_provider(provider_name, **config)
+                provider = self._get_fallback_provider(provider_name)
                 if provider and provider.is_available():
                     # Try this provider
-                    prompt = self._build_prompt(
-                        title=contribution.title or "",
-                        body=contribution.metadata.get("body", "") if contribution.metadata else "",
-                        repository=contribution.repository,
-                        base_branch=contribution.metadata.get("base_branch", "") if contribution.metadata else "",
-                        head_branch=contribution.metadata.get("head_branch", "") if contribution.metadata else "",
-                        repository_context=repository_context,
-                    )
                     return provider.summarize(prompt)
             except Exception as e:
                 logger.warning(f"Provider {provider_name} failed: {e}")
@@ -386,25 +590,25 @@ class LLMSummarizer:
             repository_context: Optional repository context
         
         Returns:
-            Prompt string
+            Prompt string, ordered from the parts shared by every PR in a
+            repository to the PR-specific ones so providers with prefix
+            caching can reuse the shared start
         """
         prompt_parts = [
+            "Generate a concise 1-2 sentence summary of the pull request below.\n",
             f"Repository: {repository}",
-            f"PR Title: {title}",
         ]
         
         if repository_context:
             prompt_parts.append(f"Repository Context: {repository_context}")
         
-        if body:
-            prompt_parts.append(f"PR Description:\n{body}")
+        prompt_parts.append(f"PR Title: {title}")
         
         if base_branch and head_branch:
             prompt_parts.append(f"Branch: {head_branch} -> {base_branch}")
         
-        prompt_parts.append(
-            "\nGenerate a concise 1-2 sentence summary of this pull request."
-        )
+        if body:
+            prompt_parts.append(f"PR Description:\n{body}")
         
         return "\n".join(prompt_parts)
     
@@ -421,7 +625,8 @@ class LLMSummarizer:
         """
         if body and len(body) > 50:
             # Use first sentence of body if available
-            first_sentence = body.split(".")[0]
+            end = body.find(".")
+            first_sentence = body[:end] if end >= 0 else body
             if len(first_sentence) > 20:
                 return f"{title}. {first_sentence}."
         
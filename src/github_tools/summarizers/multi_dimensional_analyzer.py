@@ -1,9 +1,14 @@
 """Multi-dimensional analyzer orchestrator."""
 
 from functools import lru_cache
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
-from github_tools.summarizers.dimensions.base import DimensionResult
+from github_tools.summarizers.dimensions.base import (
+    PR_STATS_KEY,
+    DimensionResult,
+    PRStats,
+    keyword_scanners,
+)
 from github_tools.summarizers.dimensions.security_analyzer import SecurityAnalyzer
 from github_tools.summarizers.dimensions.cost_analyzer import CostAnalyzer
 from github_tools.summarizers.dimensions.operational_analyzer import OperationalAnalyzer
@@ -16,6 +21,40 @@ from github_tools.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Order, emoji and label of each dimension in a formatted summary
+_DIMENSION_ORDER = (
+    "security",
+    "cost",
+    "operational",
+    "architectural",
+    "mentorship",
+    "data_governance",
+    "ai_governance",
+)
+_EMOJI_MAP = {
+    "security": "⚠️",
+    "cost": "💰",
+    "operational": "📈",
+    "architectural": "🏗️",
+    "mentorship": "🤝",
+    "data_governance": "🏛️",
+    "ai_governance": "🤖",
+}
+_LABEL_MAP = {
+    "security": "Security Impact",
+    "cost": "Cost/FinOps Impact",
+    "operational": "Operational Impact",
+    "architectural": "Architectural Integrity",
+    "mentorship": "Mentorship Insight",
+    "data_governance": "Data Governance",
+    "ai_governance": "AI Governance",
+}
+# Line prefixes in dimension order, with and without emoji
+_EMOJI_PREFIXES = tuple(
+    (dim, f"* {_EMOJI_MAP[dim]} {_LABEL_MAP[dim]}") for dim in _DIMENSION_ORDER
+)
+_PLAIN_PREFIXES = tuple((dim, f"* [{_LABEL_MAP[dim]}]") for dim in _DIMENSION_ORDER)
+
 
 class MultiDimensionalAnalyzer:
     """
@@ -50,6 +89,7 @@ class MultiDimensionalAnalyzer:
         self,
         pr_context: Dict[str, Any],
         files: List[PRFile],
+        file_patterns: Optional[Dict[str, List[str]]] = None,
     ) -> Dict[str, DimensionResult]:
         """
         Analyze PR across all dimensions.
@@ -57,15 +97,27 @@ class MultiDimensionalAnalyzer:
         Args:
             pr_context: PR context dictionary (title, body, metadata, repository_context)
             files: List of PRFile objects representing changed files
+            file_patterns: Result of detect_patterns(files), if the caller
+                already has it
         
         Returns:
             Dictionary mapping dimension names to DimensionResult objects
         """
         # Detect file patterns
-        file_patterns = self.pattern_detector.detect_patterns(files)
+        if file_patterns is None:
+            file_patterns = self.pattern_detector.detect_patterns(files)
         
         logger.debug(f"Analyzing PR across 7 dimensions with {len(files)} files")
         
+        # Lowercase the PR text and filenames once for all analyzers, and scan
+        # them once for every analyzer's keywords
+        text_scanner, filename_scanner = keyword_scanners(
+            frozenset().union(*(a.TEXT_KEYWORDS for a in self.analyzers.values())),
+            frozenset().union(*(a.FILENAME_KEYWORDS for a in self.analyzers.values())),
+        )
+        stats = PRStats.from_pr(pr_context, files, text_scanner, filename_scanner)
+        pr_context = {**pr_context, PR_STATS_KEY: stats}
+        
         # Analyze each dimension
         results = {}
         
@@ -104,49 +156,14 @@ class MultiDimensionalAnalyzer:
         Returns:
             Formatted summary string
         """
-        emoji_map = {
-            "security": "⚠️",
-            "cost": "💰",
-            "operational": "📈",
-            "architectural": "🏗️",
-            "mentorship": "🤝",
-            "data_governance": "🏛️",
-            "ai_governance": "🤖",
-        }
-        
-        label_map = {
-            "security": "Security Impact",
-            "cost": "Cost/FinOps Impact",
-            "operational": "Operational Impact",
-            "architectural": "Architectural Integrity",
-            "mentorship": "Mentorship Insight",
-            "data_governance": "Data Governance",
-            "ai_governance": "AI Governance",
-        }
-        
+        prefixes = _EMOJI_PREFIXES if use_emoji else _PLAIN_PREFIXES
         lines = [f"PR: {pr_title}", f"* Summary: {summary}"]
         
         # Format each dimension
-        dimension_order = [
-            "security",
-            "cost",
-            "operational",
-            "architectural",
-            "mentorship",
-            "data_governance",
-            "ai_governance",
-        ]
-        
-        for dim in dimension_order:
-            if dim in dimensional_results:
-                result = dimensional_results[dim]
-                emoji = emoji_map.get(dim, "") if use_emoji else ""
-                label = label_map.get(dim, dim.replace("_", " ").title())
-                
-                if use_emoji:
-                    lines.append(f"* {emoji} {label}: {result.level}. {result.description}")
-                else:
-                    lines.append(f"* [{label}]: {result.level}. {result.description}")
+        for dim, prefix in prefixes:
+            result = dimensional_results.get(dim)
+            if result is not None:
+                lines.append(f"{prefix}: {result.level}. {result.description}")
         
         return "\n".join(lines)
 
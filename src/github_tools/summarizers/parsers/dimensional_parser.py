@@ -7,8 +7,35 @@ from typing import Dict, Optional, Any
 from github_tools.summarizers.dimensions.base import DimensionResult
 from github_tools.utils.logging import get_logger
 
+# orjson support - optional, faster decoding of the extracted JSON object
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 logger = get_logger(__name__)
 
+# Characters that matter when finding JSON objects in text; escape sequences
+# are consumed whole so an escaped quote never ends a string
+_JSON_STRUCTURE_RE = re.compile(r'\\.|["{}]', re.DOTALL)
+
+# Text-format fallback patterns, compiled once
+_SUMMARY_RE = re.compile(r'(?:summary|Summary):\s*(.+?)(?:\n|$)', re.IGNORECASE)
+_DIMENSION_FLAGS = re.IGNORECASE | re.MULTILINE
+_DIMENSION_RES = {
+    "security": re.compile(r'(?:Security|⚠️)[\s\S]*?(?:level|impact)[\s\S]*?:\s*([^\n]+)', _DIMENSION_FLAGS),
+    "cost": re.compile(r'(?:Cost|💰)[\s\S]*?(?:level|impact)[\s\S]*?:\s*([^\n]+)', _DIMENSION_FLAGS),
+    "operational": re.compile(r'(?:Operational|📈)[\s\S]*?:\s*([^\n]+)', _DIMENSION_FLAGS),
+    "architectural": re.compile(r'(?:Architectural|🏗️)[\s\S]*?:\s*([^\n]+)', _DIMENSION_FLAGS),
+    "mentorship": re.compile(r'(?:Mentorship|🤝)[\s\S]*?:\s*([^\n]+)', _DIMENSION_FLAGS),
+    "data_governance": re.compile(r'(?:Data Governance|🏛️)[\s\S]*?:\s*([^\n]+)', _DIMENSION_FLAGS),
+    "ai_governance": re.compile(r'(?:AI Governance|🤖)[\s\S]*?:\s*([^\n]+)', _DIMENSION_FLAGS),
+}
+_LEVEL_RE = re.compile(
+    r'\b(High|Medium|Low|Positive|Negative|Neutral|Strong|Moderate|Weak|Impact|No Impact|N/A)\b',
+    re.IGNORECASE,
+)
+
 
 class DimensionalParser:
     """
@@ -40,21 +67,52 @@ class DimensionalParser:
     
     @staticmethod
     def _extract_json(text: str) -> Optional[Dict[str, Any]]:
-        """Extract JSON object from response text."""
-        # Try to find JSON block
-        json_match = re.search(r'\{[\s\S]*\}', text)
-        if json_match:
-            try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError:
-                pass
-        
-        # Try parsing entire text as JSON
+        """
+        Extract the first JSON object from response text.
+        
+        A well-formed response is one object spanning the first ``{`` to the
+        last ``}`` and is decoded directly. Otherwise the text is scanned once,
+        tracking brace depth outside of JSON strings, and each top-level
+        ``{...}`` span is decoded until one is valid JSON. Prose and code
+        fences around the object are ignored.
+        
+        Args:
+            text: Response text
+        
+        Returns:
+            Decoded object, or None if the text holds no complete JSON object
+        """
+        loads = orjson.loads if orjson is not None else json.loads
+        first, last = text.find("{"), text.rfind("}")
+        if first == -1 or last < first:
+            return None
         try:
-            return json.loads(text.strip())
-        except json.JSONDecodeError:
+            return loads(text[first:last + 1])
+        except ValueError:
             pass
         
+        depth = 0
+        start = 0
+        in_string = False
+        for match in _JSON_STRUCTURE_RE.finditer(text):
+            token = match.group()
+            if in_string:
+                in_string = token != '"'
+            elif token == '"':
+                # Quotes in the prose around an object don't start strings
+                in_string = depth > 0
+            elif token == "{":
+                if depth == 0:
+                    start = match.start()
+                depth += 1
+            elif token == "}" and depth > 0:
+                depth -= 1
+                if depth == 0:
+                    try:
+                        return loads(text[start:match.end()])
+                    except ValueError:
+                        continue
+        
         return None
     
     @staticmethod
@@ -124,27 +182,16 @@ class DimensionalParser:
         }
         
         # Extract summary
-        summary_match = re.search(r'(?:summary|Summary):\s*(.+?)(?:\n|$)', text, re.IGNORECASE)
+        summary_match = _SUMMARY_RE.search(text)
         if summary_match:
             result["summary"] = summary_match.group(1).strip()
         
-        # Dimension mapping for text parsing
-        dimension_patterns = {
-            "security": r'(?:Security|⚠️)[\s\S]*?(?:level|impact)[\s\S]*?:\s*([^\n]+)',
-            "cost": r'(?:Cost|💰)[\s\S]*?(?:level|impact)[\s\S]*?:\s*([^\n]+)',
-            "operational": r'(?:Operational|📈)[\s\S]*?:\s*([^\n]+)',
-            "architectural": r'(?:Architectural|🏗️)[\s\S]*?:\s*([^\n]+)',
-            "mentorship": r'(?:Mentorship|🤝)[\s\S]*?:\s*([^\n]+)',
-            "data_governance": r'(?:Data Governance|🏛️)[\s\S]*?:\s*([^\n]+)',
-            "ai_governance": r'(?:AI Governance|🤖)[\s\S]*?:\s*([^\n]+)',
-        }
-        
-        for dim_name, pattern in dimension_patterns.items():
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for dim_name, pattern in _DIMENSION_RES.items():
+            match = pattern.search(text)
             if match:
                 description = match.group(1).strip()
                 # Try to extract level from description
-                level_match = re.search(r'\b(High|Medium|Low|Positive|Negative|Neutral|Strong|Moderate|Weak|Impact|No Impact|N/A)\b', description, re.IGNORECASE)
+                level_match = _LEVEL_RE.search(description)
                 level = level_match.group(1) if level_match else "N/A"
                 result["dimensions"][dim_name] = {
                     "level": level,
@@ -1,9 +1,16 @@
 """Structured prompt templates for dimensional analysis."""
 
+import re
 from typing import Dict, List, Optional, Tuple
 
 from github_tools.summarizers.file_pattern_detector import PRFile
 
+# Categories listed first in the file summary, most relevant to dimensional analysis first
+_PRIORITY_CATEGORIES = ("iac", "ai_model", "security_config", "data_file", "infrastructure")
+
+# Lowercased filename fragments marking files listed before the rest
+_PRIORITY_FILE_RE = re.compile(r"\.tf|\.yaml|\.yml|\.pkl|\.h5|\.key|\.pem|security|model")
+
 
 class DimensionalPrompts:
     """
@@ -25,10 +32,12 @@ Your task is to provide structured, concise analysis of PR impacts across:
 
 For each dimension, provide:
 - Impact level (High/Medium/Low/Positive/Negative/Neutral/Strong/Moderate/Weak/Impact/No Impact/N/A)
-- Concise description (1-2 sentences)
+- Concise description (one sentence, under 120 characters)
 
 Use N/A when a dimension is not applicable to the PR."""
 
+    RESPONSE_FORMAT_HEADER = "Provide analysis in this exact JSON format:"
+    
     @staticmethod
     def create_analysis_prompt(
         pr_title: str,
@@ -36,16 +45,22 @@ Use N/A when a dimension is not applicable to the PR."""
         files: List[PRFile],
         file_patterns: Dict[str, List[str]],
         repository_context: Optional[str] = None,
+        include_response_format: bool = True,
     ) -> str:
         """
         Create structured prompt for dimensional analysis.
         
+        Content shared by many PRs (instructions, repository context) comes
+        before the PR itself, so providers with prefix caching can reuse it.
+        
         Args:
             pr_title: PR title
             pr_body: PR description/body
             files: List of changed files
             file_patterns: Categorized file patterns
             repository_context: Optional repository context
+            include_response_format: Whether to append the JSON response
+                format (omit it when the system prompt already carries it)
         
         Returns:
             Formatted prompt string
@@ -54,42 +69,39 @@ Use N/A when a dimension is not applicable to the PR."""
         file_summary = DimensionalPrompts._summarize_files(files, file_patterns)
         
         # Build prompt efficiently
-        prompt_parts = [
-            "Analyze this pull request across all 7 dimensions:",
-            "",
-            f"PR Title: {pr_title}",
-        ]
+        prompt_parts = ["Analyze this pull request across all 7 dimensions:", ""]
+        
+        if repository_context:
+            context_text = repository_context[:300] if len(repository_context) > 300 else repository_context
+            prompt_parts.append(f"Repository Context: {context_text}")
+        
+        prompt_parts.append(f"PR Title: {pr_title}")
         
+        body_index = None
         if pr_body:
             # Truncate body if too long (token optimization)
             body_text = pr_body[:500] if len(pr_body) > 500 else pr_body
+            body_index = len(prompt_parts)
             prompt_parts.append(f"PR Description: {body_text}")
         
-        if repository_context:
-            context_text = repository_context[:300] if len(repository_context) > 300 else repository_context
-            prompt_parts.append(f"Repository Context: {context_text}")
-        
         prompt_parts.append("")
         prompt_parts.append("Changed Files:")
         prompt_parts.append(file_summary)
         
-        prompt_parts.append("")
-        prompt_parts.append("Provide analysis in this exact JSON format:")
-        prompt_parts.append(DimensionalPrompts._get_response_format())
-        
-        prompt_text = "\n".join(prompt_parts)
+        if include_response_format:
+            prompt_parts.append("")
+            prompt_parts.append(DimensionalPrompts.RESPONSE_FORMAT_HEADER)
+            prompt_parts.append(DimensionalPrompts._get_response_format())
         
         # Token optimization: Limit total prompt length
-        # If prompt is too long, truncate body/context
+        # If the joined prompt would be too long, shorten the body first
         max_prompt_length = 4000  # Approximate token limit
-        if len(prompt_text) > max_prompt_length:
-            # Shorten by truncating body and context if present
-            if pr_body and len(pr_body) > 200:
-                # Replace with truncated version
-                truncated_body = pr_body[:200] + "..."
-                prompt_text = prompt_text.replace(f"PR Description: {body_text}", f"PR Description: {truncated_body}")
-        
-        return prompt_text
+        if pr_body and body_index is not None and len(pr_body) > 200:
+            prompt_length = sum(map(len, prompt_parts)) + len(prompt_parts) - 1
+            if prompt_length > max_prompt_length:
+                prompt_parts[body_index] = f"PR Description: {pr_body[:200]}..."
+        
+        return "\n".join(prompt_parts)
     
     @staticmethod
     def _summarize_files(files: List[PRFile], file_patterns: Dict[str, List[str]]) -> str:
@@ -120,13 +132,12 @@ Use N/A when a dimension is not applicable to the PR."""
         if file_patterns:
             summary_parts.append("File categories:")
             # Prioritize important categories for dimensional analysis
-            priority_categories = ["iac", "ai_model", "security_config", "data_file", "infrastructure"]
-            for category in priority_categories:
+            for category in _PRIORITY_CATEGORIES:
                 if category in file_patterns and file_patterns[category]:
                     summary_parts.append(f"  - {category}: {len(file_patterns[category])} files")
             # Add other categories
             for category, file_list in file_patterns.items():
-                if category not in priority_categories and file_list:
+                if category not in _PRIORITY_CATEGORIES and file_list:
                     summary_parts.append(f"  - {category}: {len(file_list)} files")
         
         # List top files (focus on IAC, security, AI models first)
@@ -135,10 +146,7 @@ Use N/A when a dimension is not applicable to the PR."""
         
         for file in top_files[:15]:  # Top 15 files
             # Prioritize files relevant to dimensional analysis
-            if any(
-                pattern in file.filename.lower()
-                for pattern in [".tf", ".yaml", ".yml", ".pkl", ".h5", ".key", ".pem", "security", "model"]
-            ):
+            if _PRIORITY_FILE_RE.search(file.filename.lower()):
                 priority_files.append(file)
             else:
                 other_files.append(file)
@@ -166,6 +174,17 @@ Use N/A when a dimension is not applicable to the PR."""
         
         return "\n".join(summary_parts)
     
+    @classmethod
+    def create_system_prompt(cls) -> str:
+        """
+        Create the system prompt for dimensional analysis.
+        
+        Returns:
+            System prompt followed by the JSON response format, identical for
+            every PR so it forms a cacheable prompt prefix
+        """
+        return f"{cls.SYSTEM_PROMPT}\n\n{cls.RESPONSE_FORMAT_HEADER}\n{cls._get_response_format()}"
+    
     @staticmethod
     def _get_response_format() -> str:
         """Get JSON response format specification."""
@@ -202,6 +221,10 @@ Use N/A when a dimension is not applicable to the PR."""
 }"""
 
 
+# The system prompt is identical for every PR, so it is built once
+_SYSTEM_PROMPT = DimensionalPrompts.create_system_prompt()
+
+
 def create_dimensional_prompt(
     pr_title: str,
     pr_body: Optional[str],
@@ -220,12 +243,17 @@ def create_dimensional_prompt(
         repository_context: Optional repository context
     
     Returns:
-        Tuple of (system_prompt, user_prompt)
+        Tuple of (system_prompt, user_prompt); the static rubric and response
+        format are all in the system prompt, so it is the same for every PR
     """
-    system_prompt = DimensionalPrompts.SYSTEM_PROMPT
     user_prompt = DimensionalPrompts.create_analysis_prompt(
-        pr_title, pr_body, files, file_patterns, repository_context
+        pr_title,
+        pr_body,
+        files,
+        file_patterns,
+        repository_context,
+        include_response_format=False,
     )
     
-    return system_prompt, user_prompt
+    return _SYSTEM_PROMPT, user_prompt
 
@@ -13,18 +13,24 @@ except ImportError:
         httpx = None
         requests = None
 
+# h2 support - optional, lets httpx multiplex concurrent requests over one HTTP/2 connection
+try:
+    import h2
+except ImportError:
+    h2 = None  # type: ignore
+
 from github_tools.summarizers.providers.base import LLMProvider
+from github_tools.summarizers.providers.detector import check_http_endpoint
 from github_tools.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-DEFAULT_TIMEOUT = 30  # Local default
-
 
 class GenericHTTPProvider(LLMProvider):
     """Generic HTTP provider for OpenAI-compatible APIs (Ollama, LocalAI, etc.)."""
     
     DEFAULT_MODEL = "llama2"
+    DEFAULT_TIMEOUT = 30  # Local default
     
     def __init__(
         self,
@@ -77,7 +83,11 @@ class GenericHTTPProvider(LLMProvider):
         """Get HTTP client instance."""
         if self._client is None:
             if httpx:
-                self._client = httpx.Client(timeout=self.timeout, headers=self.headers)
+                self._client = httpx.Client(
+                    timeout=self.timeout,
+                    headers=self.headers,
+                    http2=h2 is not None,
+                )
             else:
                 self._client = requests.Session()
                 self._client.headers.update(self.headers)
@@ -172,7 +182,6 @@ class GenericHTTPProvider(LLMProvider):
             True if endpoint is reachable
         """
         try:
-            from github_tools.summarizers.providers.detector import check_http_endpoint
             return check_http_endpoint(self.endpoint)
         except Exception:
             return False
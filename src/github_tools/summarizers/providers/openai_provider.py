@@ -1,6 +1,7 @@
 """OpenAI provider implementation."""
 
 import os
+import re
 from typing import Any, Dict, Optional
 
 try:
@@ -13,6 +14,11 @@ from github_tools.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Sentence terminator followed by whitespace and a capital letter, i.e. a
+# finished sentence; "e.g. for" and similar abbreviations are not counted
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s+[A-Z])")
+_SENTENCE_TERMINATORS = ".!?"
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI API provider for PR summarization."""
@@ -29,6 +35,7 @@ class OpenAIProvider(LLMProvider):
         temperature: float = LLMProvider.DEFAULT_TEMPERATURE,
         timeout: Optional[int] = None,
         max_retries: int = 3,
+        stream_max_sentences: Optional[int] = None,
     ):
         """
         Initialize OpenAI provider.
@@ -41,6 +48,8 @@ class OpenAIProvider(LLMProvider):
             temperature: Temperature for generation
             timeout: Request timeout in seconds (default: 60)
             max_retries: Maximum number of retries
+            stream_max_sentences: If set, stream default-prompt summaries and stop
+                reading once this many sentences are complete
         """
         super().__init__(
             max_tokens=max_tokens,
@@ -58,6 +67,7 @@ class OpenAIProvider(LLMProvider):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.model = model
         self.base_url = base_url
+        self.stream_max_sentences = stream_max_sentences
         
         if self.api_key:
             openai.api_key = self.api_key
@@ -94,20 +104,26 @@ class OpenAIProvider(LLMProvider):
         if not self.api_key:
             raise RuntimeError("OpenAI API key not configured")
         
+        # The default system prompt asks for 1-2 sentences, so only those
+        # summaries may be cut short; custom prompts get the full completion
+        max_sentences = self.stream_max_sentences if system_prompt is None else None
         system_prompt = system_prompt or self.DEFAULT_SYSTEM_PROMPT
         max_tokens = max_tokens or self.max_tokens
         temperature = temperature if temperature is not None else self.temperature
+        request = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
         
         def _call_api():
-            response = openai.ChatCompletion.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=max_tokens,
-                temperature=temperature,
-            )
+            if max_sentences:
+                return self._stream_sentences(request, max_sentences)
+            response = openai.ChatCompletion.create(**request)
             return response.choices[0].message.content.strip()
         
         # Use retry logic for transient errors
@@ -120,6 +136,47 @@ class OpenAIProvider(LLMProvider):
             logger.error(f"OpenAI API call failed: {e}")
             raise RuntimeError(f"Failed to generate summary: {e}") from e
     
+    @staticmethod
+    def _stream_sentences(request: Dict[str, Any], max_sentences: int) -> str:
+        """
+        Stream a completion and stop once max_sentences sentences are complete.
+        
+        Args:
+            request: ChatCompletion.create keyword arguments
+            max_sentences: Number of sentences to keep
+        
+        Returns:
+            Completion text, cut after the last kept sentence
+        """
+        stream = openai.ChatCompletion.create(**request, stream=True)
+        text: str = ""
+        count = 0
+        scan_from = 0
+        try:
+            for chunk in stream:
+                content = chunk["choices"][0]["delta"].get("content")
+                if not content:
+                    continue
+                # A terminator at the end of the previous text is only confirmed
+                # by what follows it, so step back over it before scanning
+                pos = len(text)
+                while pos > scan_from and text[pos - 1].isspace():
+                    pos -= 1
+                if pos > scan_from and text[pos - 1] in _SENTENCE_TERMINATORS:
+                    pos -= 1
+                text += content
+                for match in _SENTENCE_END_RE.finditer(text, pos):
+                    count += 1
+                    if count == max_sentences:
+                        return text[:match.end()].strip()
+                    scan_from = match.end()
+            return text.strip()
+        finally:
+            # Closing the stream drops the connection instead of reading the rest
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+    
     def is_available(self) -> bool:
         """
         Check if OpenAI provider is available.
@@ -74,6 +74,28 @@ class TestGenericHTTPProvider:
         call_args = mock_client.post.call_args
         assert "v1/chat/completions" in call_args[0][0] or "api/v1/chat/completions" in call_args[0][0]
     
+    def test_client_reused_across_requests(self, provider, mock_httpx):
+        """Test that one pooled client serves every request."""
+        mock_client = MagicMock()
+        mock_client.post.return_value.json.return_value = {
+            "choices": [{"message": {"content": "Summary"}}]
+        }
+        mock_httpx.Client.return_value = mock_client
+        
+        provider.summarize("First prompt")
+        provider.summarize("Second prompt")
+        
+        mock_httpx.Client.assert_called_once()
+        assert mock_client.post.call_count == 2
+    
+    @pytest.mark.parametrize("h2_module, http2", [(Mock(), True), (None, False)])
+    def test_client_negotiates_http2_when_h2_installed(self, provider, mock_httpx, h2_module, http2):
+        """Test that HTTP/2 is requested only when the h2 package is available."""
+        with patch("github_tools.summarizers.providers.generic_http_provider.h2", h2_module):
+            provider._get_client()
+        
+        assert mock_httpx.Client.call_args.kwargs["http2"] is http2
+    
     def test_summarize_empty_prompt(self, provider):
         """Test summarize raises error for empty prompt."""
         with pytest.raises(ValueError, match="Prompt cannot be empty"):
@@ -176,3 +176,57 @@ class TestOpenAIProvider:
         assert call_args[1]["max_tokens"] == 100
         assert call_args[1]["temperature"] == 0.7
 
+    
+    def test_stream_stops_after_max_sentences(self, mock_openai):
+        """Test that streaming stops reading once enough sentences are complete."""
+        provider = OpenAIProvider(api_key="test-key", stream_max_sentences=2)
+        pieces = ["Adds caching", ". Cuts API", " calls by half.", " Also renames", " a helper."]
+        consumed = []
+        
+        def chunks():
+            for piece in pieces:
+                consumed.append(piece)
+                yield {"choices": [{"delta": {"content": piece}}]}
+        
+        stream = chunks()
+        mock_openai.ChatCompletion.create.return_value = stream
+        
+        result = provider.summarize("test prompt")
+        
+        assert result == "Adds caching. Cuts API calls by half."
+        assert consumed == pieces[:4]
+        assert mock_openai.ChatCompletion.create.call_args[1]["stream"] is True
+        assert stream.gi_frame is None  # closed
+    
+    def test_stream_returns_short_completion(self, mock_openai):
+        """Test that a completion with fewer sentences is returned whole."""
+        provider = OpenAIProvider(api_key="test-key", stream_max_sentences=2)
+        mock_openai.ChatCompletion.create.return_value = iter([
+            {"choices": [{"delta": {"role": "assistant"}}]},
+            {"choices": [{"delta": {"content": "Fixes a typo."}}]},
+        ])
+        
+        assert provider.summarize("test prompt") == "Fixes a typo."
+    
+    def test_stream_does_not_cut_at_abbreviation(self, mock_openai):
+        """Test that abbreviations such as "e.g." do not end a sentence."""
+        provider = OpenAIProvider(api_key="test-key", stream_max_sentences=1)
+        pieces = ["Adds retries (e.g.", " for 502s) to the client.", " ", "Also logs them."]
+        mock_openai.ChatCompletion.create.return_value = iter(
+            {"choices": [{"delta": {"content": piece}}]} for piece in pieces
+        )
+        
+        assert provider.summarize("test prompt") == "Adds retries (e.g. for 502s) to the client."
+    
+    def test_custom_system_prompt_not_streamed(self, mock_openai):
+        """Test that structured prompts always get the full completion."""
+        provider = OpenAIProvider(api_key="test-key", stream_max_sentences=2)
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "One. Two. Three."
+        mock_openai.ChatCompletion.create.return_value = mock_response
+        
+        result = provider.summarize("test prompt", system_prompt="Return JSON")
+        
+        assert result == "One. Two. Three."
+        assert "stream" not in mock_openai.ChatCompletion.create.call_args[1]
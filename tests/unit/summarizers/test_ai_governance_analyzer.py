@@ -44,3 +44,15 @@ class TestAIGovernanceAnalyzer:
         assert result.is_applicable is True
         assert "external" in result.description.lower() or "exfiltration" in result.description.lower() or "supply chain" in result.description.lower()
 
+    
+    def test_short_acronyms_match_whole_words(self):
+        """Test that "ai"/"ml" inside other words do not mark a PR as AI work."""
+        analyzer = AIGovernanceAnalyzer()
+        
+        unrelated = analyzer.analyze(
+            {"title": "Fix email template", "body": "Maintain the HTML layout"}, [], {}
+        )
+        related = analyzer.analyze({"title": "Tune AI prompts", "body": ""}, [], {})
+        
+        assert unrelated.is_applicable is False
+        assert related.is_applicable is True
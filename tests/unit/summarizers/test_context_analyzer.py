@@ -0,0 +1,101 @@
+"""Unit tests for repository context analyzer."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, Mock, patch
+
+from github_tools.summarizers.context_analyzer import ContextAnalyzer
+
+
+def _make_client() -> Mock:
+    """Create a mock GitHub client with a described repository."""
+    client = Mock()
+    repo = client.github.get_repo.return_value
+    repo.description = "Payments API"
+    repo.language = "Python"
+    repo.get_readme.return_value.decoded_content = b"# Payments\n\nMore details"
+    return client
+
+
+class TestContextAnalyzer:
+    """Tests for ContextAnalyzer."""
+    
+    def test_repository_context_is_cached(self):
+        """Test that repository context is fetched once per repository."""
+        client = _make_client()
+        analyzer = ContextAnalyzer(client)
+        
+        first = analyzer.get_repository_context("org/payments")
+        second = analyzer.get_repository_context("org/payments")
+        
+        assert first == second == (
+            "Repository: Payments API\nPrimary Language: Python\nREADME: # Payments"
+        )
+        client.github.get_repo.assert_called_once_with("org/payments")
+    
+    def test_failed_lookup_is_not_cached(self):
+        """Test that a failed repository lookup is retried on the next call."""
+        client = _make_client()
+        repo = client.github.get_repo.return_value
+        client.github.get_repo.side_effect = [RuntimeError("rate limited"), repo]
+        analyzer = ContextAnalyzer(client)
+        
+        assert analyzer.get_repository_context("org/payments") is None
+        assert analyzer.get_repository_context("org/payments") is not None
+    
+    def test_readme_read_is_bounded(self):
+        """Test that a README without an early paragraph break is truncated."""
+        client = _make_client()
+        repo = client.github.get_repo.return_value
+        repo.description = None
+        repo.language = None
+        repo.get_readme.return_value.decoded_content = b"x" * 5000 + b"\n\nRest"
+        analyzer = ContextAnalyzer(client)
+        
+        context = analyzer.get_repository_context("org/payments")
+        
+        assert context == "README: " + "x" * 200
+    
+    def test_prefetch_contexts_fills_cache(self):
+        """Test that prefetched contexts are fetched once and then served from cache."""
+        client = _make_client()
+        analyzer = ContextAnalyzer(client)
+        
+        contexts = analyzer.prefetch_contexts(["org/a", "org/b", "org/a"], max_workers=2)
+        analyzer.get_repository_context("org/b")
+        
+        assert list(contexts) == ["org/a", "org/b"]
+        assert contexts["org/a"].startswith("Repository: Payments API")
+        assert client.github.get_repo.call_count == 2
+    
+    def test_prefetch_contexts_uses_rate_limiter_slots(self):
+        """Test that prefetches take rate limiter slots and default to its concurrency."""
+        client = _make_client()
+        rate_limiter = MagicMock()
+        rate_limiter.max_concurrent = 2
+        analyzer = ContextAnalyzer(client, rate_limiter)
+    
+        with patch(
+            "github_tools.summarizers.context_analyzer.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        ) as executor:
+            analyzer.prefetch_contexts(["org/a", "org/b", "org/c"])
+    
+        executor.assert_called_once_with(max_workers=2)
+        assert rate_limiter.slot.call_count == 3
+    
+    def test_prefetch_contexts_reports_failures_as_none(self):
+        """Test that a failed prefetch maps to None and is not cached."""
+        client = _make_client()
+        client.github.get_repo.side_effect = RuntimeError("rate limited")
+        analyzer = ContextAnalyzer(client)
+        
+        assert analyzer.prefetch_contexts(["org/a"]) == {"org/a": None}
+        assert "org/a" not in analyzer._context_cache
+    
+    def test_extract_context_tags(self):
+        """Test unique, sorted tags from the repository name and PR text."""
+        analyzer = ContextAnalyzer(Mock())
+        
+        tags = analyzer.extract_context_tags("org/web-frontend", "Fix login bug", "Adds a test")
+        
+        assert tags == ["bugfix", "feature", "frontend", "testing"]
@@ -0,0 +1,59 @@
+"""Unit tests for dimensional response parser."""
+
+import pytest
+
+from github_tools.summarizers.parsers import dimensional_parser
+from github_tools.summarizers.parsers.dimensional_parser import DimensionalParser
+
+
+class TestDimensionalParser:
+    """Tests for DimensionalParser."""
+    
+    def test_parse_text_format(self):
+        """Test that a plain-text response is parsed dimension by dimension."""
+        text = (
+            "Summary: Moves session storage to Redis\n"
+            "Security impact level: High - touches token handling\n"
+            "Cost impact: Negative, adds a cache cluster\n"
+            "Mentorship: Clear description of trade-offs\n"
+        )
+        
+        parsed = DimensionalParser.parse_response(text)
+        
+        assert parsed["summary"] == "Moves session storage to Redis"
+        assert parsed["dimensions"]["security"] == {
+            "level": "High",
+            "description": "High - touches token handling",
+        }
+        assert parsed["dimensions"]["cost"]["level"] == "Negative"
+        assert parsed["dimensions"]["ai_governance"] == {
+            "level": "N/A",
+            "description": "Analysis unavailable",
+        }
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_extract_json_from_fenced_block(self, monkeypatch, use_orjson):
+        """Test that JSON wrapped in prose and a code fence is extracted."""
+        if not use_orjson:
+            monkeypatch.setattr(dimensional_parser, "orjson", None)
+        text = 'Here is the analysis:\n```json\n{"summary": "Adds {x} support", "dimensions": {}}\n```\nDone.'
+        
+        assert DimensionalParser._extract_json(text) == {
+            "summary": "Adds {x} support",
+            "dimensions": {},
+        }
+    
+    def test_extract_json_skips_invalid_spans(self):
+        """Test that a braced span that isn't JSON doesn't hide a later object."""
+        text = 'Uses the {placeholder} syntax. {"summary": "Escaped \\" and } inside", "dimensions": {}}'
+        
+        assert DimensionalParser._extract_json(text) == {
+            "summary": 'Escaped " and } inside',
+            "dimensions": {},
+        }
+    
+    def test_extract_json_truncated_response(self):
+        """Test that a response cut off mid-object yields no JSON."""
+        text = '{"summary": "Adds caching", "dimensions": {"security": {"level": "Low"}, "cost": {'
+        
+        assert DimensionalParser._extract_json(text) is None
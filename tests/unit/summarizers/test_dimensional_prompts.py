@@ -0,0 +1,49 @@
+"""Unit tests for dimensional analysis prompts."""
+
+from github_tools.summarizers.file_pattern_detector import PRFile
+from github_tools.summarizers.prompts.dimensional_prompts import (
+    DimensionalPrompts,
+    create_dimensional_prompt,
+)
+
+
+class TestDimensionalPrompts:
+    """Tests for dimensional prompt construction."""
+    
+    def test_system_prompt_carries_static_rubric(self):
+        """Test that the response format is in the system prompt, shared by every PR."""
+        first_system, first_user = create_dimensional_prompt(
+            "Add login endpoint", "Adds token auth", [PRFile("api/auth.py", "added", 30, 0)], {}
+        )
+        second_system, second_user = create_dimensional_prompt(
+            "Bump terraform", None, [PRFile("infra/main.tf", "modified", 2, 2)], {"iac": ["infra/main.tf"]}
+        )
+        
+        assert first_system is second_system
+        assert first_system == DimensionalPrompts.create_system_prompt()
+        assert DimensionalPrompts.RESPONSE_FORMAT_HEADER in first_system
+        assert DimensionalPrompts.RESPONSE_FORMAT_HEADER not in first_user
+        assert DimensionalPrompts.RESPONSE_FORMAT_HEADER not in second_user
+    
+    def test_repository_context_precedes_pr_details(self):
+        """Test that shared repository context comes before the PR-specific text."""
+        _, user_prompt = create_dimensional_prompt(
+            "Add login endpoint", "Adds token auth", [], {}, repository_context="Payments service"
+        )
+        
+        assert user_prompt.index("Repository Context:") < user_prompt.index("PR Title:")
+    
+    def test_standalone_analysis_prompt_keeps_response_format(self):
+        """Test that the analysis prompt alone still asks for the JSON format."""
+        prompt = DimensionalPrompts.create_analysis_prompt("Add login endpoint", None, [], {})
+        
+        assert prompt.endswith(DimensionalPrompts._get_response_format())
+    
+    def test_long_prompt_truncates_body(self):
+        """Test that an over-long prompt keeps only the start of the PR body."""
+        files = [PRFile(f"src/{'x' * 300}{i}.py", "modified", i, 0) for i in range(12)]
+        
+        prompt = DimensionalPrompts.create_analysis_prompt("Refactor", "b" * 600, files, {})
+        
+        assert f"PR Description: {'b' * 200}...\n" in prompt
+        assert "b" * 201 not in prompt
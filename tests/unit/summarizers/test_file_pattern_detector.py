@@ -1,7 +1,11 @@
 """Unit tests for file pattern detector."""
 
+import fnmatch
+import os
+
 import pytest
 
+from github_tools.summarizers import keyword_scanner
 from github_tools.summarizers.file_pattern_detector import (
     FilePatternDetector,
     FileCategory,
@@ -9,6 +13,55 @@ from github_tools.summarizers.file_pattern_detector import (
 )
 
 
+def _scan_all_patterns(detector: FilePatternDetector, filename: str) -> FileCategory:
+    """Classify by trying every pattern in order with fnmatch (no indexes)."""
+    def match_path(pp):
+        return fnmatch.fnmatch(filename, pp) or fnmatch.fnmatch(filename, f"**/{pp}")
+    
+    ext = os.path.splitext(filename)[1].lower()
+    for pattern in detector.all_patterns:
+        if pattern.extensions and ext in [e.lower() for e in pattern.extensions]:
+            if not pattern.path_patterns or any(map(match_path, pattern.path_patterns)):
+                return pattern.category
+    for pattern in detector.all_patterns:
+        if pattern.path_patterns and any(map(match_path, pattern.path_patterns)):
+            return pattern.category
+    for pattern in detector.all_patterns:
+        if fnmatch.fnmatch(filename, pattern.pattern):
+            return pattern.category
+    return FileCategory.UNKNOWN
+
+
+# Filenames exercising every pass and the precedence between them
+_EDGE_CASE_FILENAMES = [
+    "main.tf", "x.TF", ".tf", "state.tfstate", "state.tfstate.backup", "a/b/c.tf.json",
+    "infra/terraform/vars.txt", "terraformx/main.py", "Pulumi.dev.yaml", "stack/Pulumi.prod",
+    "a.pulumi.yaml", "models/bert.bin", "src/models/x/y.py", "MODELS/x.py", "data/raw.txt",
+    ".env", "svc/.env.local", "x.env", "config/app.py", "secrets/token", "deploy/Dockerfile.dev",
+    "ops/docker-compose.prod.yml", "docker-compose/x.yml", "k8s/svc.txt", "a/k8s/svc.txt",
+    "helm/chart.tpl", "docs/guide.txt", "pkg/README", "test_api.py", "pkg/api_test.py",
+    "tests/helpers.js", "spec/a.rb", "Makefile", "src/app.py", "weird[1].txt", "",
+]
+
+
+class TestPatternIndexes:
+    """Tests that the extension table and literal prefilters preserve results."""
+    
+    @pytest.fixture(params=["automaton", "substring"])
+    def detector(self, request, monkeypatch):
+        """Detector built with and without pyahocorasick."""
+        if request.param == "automaton":
+            pytest.importorskip("ahocorasick")
+        else:
+            monkeypatch.setattr(keyword_scanner, "ahocorasick", None)
+        return FilePatternDetector()
+    
+    @pytest.mark.parametrize("filename", _EDGE_CASE_FILENAMES)
+    def test_matches_full_pattern_scan(self, detector, filename):
+        """Test that indexed detection equals trying every pattern in order."""
+        assert detector.detect_category(filename) == _scan_all_patterns(detector, filename)
+
+
 class TestFilePatternDetector:
     """Tests for FilePatternDetector."""
     
@@ -164,4 +217,54 @@ class TestFilePatternDetector:
         assert len(security_files) == 2
         assert any(f.filename == "cert.pem" for f in security_files)
         assert any(f.filename == "private.key" for f in security_files)
-
+    
+    def test_categories_memoized_per_detector(self):
+        """Test that each filename is matched once per detector, not per helper call."""
+        detector = FilePatternDetector()
+        files = [PRFile("main.tf", "modified", 10, 5), PRFile("app.py", "modified", 20, 10)]
+        
+        detector.detect_patterns(files)
+        detector.get_iac_files(files)
+        detector.get_config_files(files)
+        
+        info = detector._cached_detect_category.cache_info()
+        assert info.misses == 2
+        assert info.hits == 4
+        assert FilePatternDetector()._cached_detect_category.cache_info().currsize == 0
+    
+    def test_getters_reuse_categorized_files(self):
+        """Test that a precomputed categorize() result needs no further matching."""
+        detector = FilePatternDetector()
+        files = [
+            PRFile("main.tf", "modified", 10, 5),
+            PRFile("cert.pem", "added", 10, 0),
+            PRFile("app.py", "modified", 20, 10),
+            PRFile("variables.tfvars", "added", 5, 0),
+        ]
+        
+        categorized = detector.categorize(files)
+        before = detector._cached_detect_category.cache_info()
+        
+        assert detector.get_iac_files(files, categorized) == [files[0], files[3]]
+        assert detector.get_security_config_files(files, categorized) == [files[1]]
+        assert detector.get_data_files(files, categorized) == []
+        assert detector._cached_detect_category.cache_info() == before
+    
+    def test_config_files_keep_input_order(self):
+        """Test that config and security config files come back in input order."""
+        detector = FilePatternDetector()
+        files = [
+            PRFile(".env", "modified", 2, 1),
+            PRFile("cert.pem", "added", 10, 0),
+            PRFile("app.py", "modified", 20, 10),
+            PRFile("settings.ini", "modified", 2, 1),
+        ]
+        
+        expected = [
+            f for f in files
+            if detector.detect_category(f.filename)
+            in (FileCategory.CONFIG, FileCategory.SECURITY_CONFIG)
+        ]
+        
+        assert detector.get_config_files(files) == expected
+        assert detector.get_config_files(files, detector.categorize(files)) == expected
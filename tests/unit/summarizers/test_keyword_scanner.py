@@ -0,0 +1,51 @@
+"""Unit tests for keyword scanner."""
+
+import pytest
+
+from github_tools.summarizers import keyword_scanner
+from github_tools.summarizers.keyword_scanner import KeywordScanner
+
+
+@pytest.fixture(params=["hyperscan", "automaton", "substring"])
+def scanner_backend(request, monkeypatch):
+    """Run each test with hyperscan, with pyahocorasick, and with neither."""
+    if request.param == "hyperscan":
+        pytest.importorskip("hyperscan")
+    else:
+        monkeypatch.setattr(keyword_scanner, "hyperscan", None)
+    if request.param == "automaton":
+        pytest.importorskip("ahocorasick")
+    elif request.param == "substring":
+        monkeypatch.setattr(keyword_scanner, "ahocorasick", None)
+    return request.param
+
+
+class TestKeywordScanner:
+    """Tests for KeywordScanner."""
+    
+    def test_scan_matches_substring_semantics(self, scanner_backend):
+        """Test that scan finds exactly the keywords for which `keyword in text`."""
+        keywords = ["openai", "ai", "ml", "external api", "third-party", "model"]
+        scanner = KeywordScanner(keywords)
+        text = "use the openai sdk via an external api for html models"
+        
+        assert scanner.scan(text) == {k for k in keywords if k in text}
+    
+    def test_scan_no_matches(self, scanner_backend):
+        """Test that an unrelated text yields no keywords."""
+        scanner = KeywordScanner(["llm", "gpt"])
+        
+        assert scanner.scan("update readme") == frozenset()
+        assert scanner.scan("") == frozenset()
+    
+    def test_scan_non_ascii(self, scanner_backend):
+        """Test that keywords and texts outside ASCII match like str containment."""
+        scanner = KeywordScanner(["données", "ü"])
+        
+        assert scanner.scan("exporte les données") == {"données"}
+        assert scanner.scan("uber") == frozenset()
+    
+    def test_empty_keywords_rejected(self):
+        """Test that a scanner needs at least one keyword."""
+        with pytest.raises(ValueError):
+            KeywordScanner([])
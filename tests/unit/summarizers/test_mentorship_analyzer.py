@@ -43,3 +43,13 @@ class TestMentorshipAnalyzer:
         assert result.is_applicable is True
         assert "educational" in result.description.lower() or "explanation" in result.description.lower() or "collaborative" in result.description.lower()
 
+    
+    @pytest.mark.parametrize("word_count, quality", [(100, "medium"), (101, "high")])
+    def test_detailed_description_threshold(self, word_count, quality):
+        """Test that a description needs more than 100 words to count as detailed."""
+        analyzer = MentorshipAnalyzer()
+        body = " \n".join(["word"] * word_count) + "\n\n"
+        
+        result = analyzer.analyze({"title": "Update", "body": body}, [], {})
+        
+        assert result.metadata["description_quality"] == quality
@@ -32,6 +32,47 @@ class TestMultiDimensionalAnalyzer:
         assert "data_governance" in results
         assert "ai_governance" in results
     
+    def test_analyze_does_not_mutate_context(self):
+        """Test that shared PR stats are added to a copy of the context."""
+        analyzer = MultiDimensionalAnalyzer()
+        pr_context = {"title": "Add login endpoint", "body": "Adds token auth"}
+        
+        results = analyzer.analyze(pr_context, [PRFile("api/routes.py", "modified", 10, 2)])
+        
+        assert pr_context == {"title": "Add login endpoint", "body": "Adds token auth"}
+        assert results["security"].level == "High"
+    
+    def test_analyze_with_missing_body(self):
+        """Test that a PR without a description is analyzed, not failed."""
+        analyzer = MultiDimensionalAnalyzer()
+        
+        results = analyzer.analyze({"title": "Add model", "body": None}, [])
+        
+        assert all(
+            not result.description.startswith("Analysis unavailable")
+            for result in results.values()
+        )
+        assert results["ai_governance"].is_applicable is True
+    
+    def test_shared_keyword_scan_matches_standalone_analyzers(self):
+        """Test that the combined keyword scan gives each analyzer its own result."""
+        analyzer = MultiDimensionalAnalyzer()
+        pr_context = {
+            "title": "Scale up the model endpoint",
+            "body": "Explains why we grant access and add alert metrics after the rollout",
+        }
+        files = [
+            PRFile("infra/main.tf", "modified", 40, 5),
+            PRFile("monitoring/alerts.yaml", "added", 12, 0),
+            PRFile("ml/train.py", "modified", 8, 3),
+        ]
+        file_patterns = analyzer.pattern_detector.detect_patterns(files)
+        
+        results = analyzer.analyze(pr_context, files)
+        
+        for name, dimension in analyzer.analyzers.items():
+            assert results[name] == dimension.analyze(pr_context, files, file_patterns), name
+    
     def test_format_summary(self):
         """Test summary formatting."""
         from github_tools.summarizers.dimensions.base import DimensionResult
@@ -43,3 +43,13 @@ class TestOperationalAnalyzer:
         assert result.is_applicable is True
         assert "monitor" in result.description.lower() or "slo" in result.description.lower()
 
+    
+    def test_slo_matches_whole_words(self):
+        """Test that "slo" inside "slow" is not taken as an SLO definition."""
+        analyzer = OperationalAnalyzer()
+        
+        slow = analyzer.analyze({"title": "Fix slow query", "body": ""}, [], {})
+        slo = analyzer.analyze({"title": "Define SLOs for checkout", "body": ""}, [], {})
+        
+        assert "Ensure SLOs" in slow.description
+        assert "alerts are configured as required" in slo.description
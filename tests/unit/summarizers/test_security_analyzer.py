@@ -70,3 +70,13 @@ class TestSecurityAnalyzer:
         analyzer = SecurityAnalyzer()
         assert analyzer.get_dimension_name() == "security"
 
+    
+    def test_api_matches_whole_words(self):
+        """Test that "api" inside another word is not taken as external exposure."""
+        analyzer = SecurityAnalyzer()
+        
+        rapid = analyzer.analyze({"title": "Rapid prototyping helpers", "body": ""}, [], {})
+        api = analyzer.analyze({"title": "Document the APIs", "body": ""}, [], {})
+        
+        assert rapid.level == "Low"
+        assert api.level == "Medium"
@@ -1,9 +1,11 @@
 """Unit tests for developer metric aggregation logic."""
 
+import sys
 from datetime import datetime, timedelta
 
 import pytest
 
+from github_tools.analyzers.developer_analyzer import DeveloperAnalyzer, RepositoryBreakdown
 from github_tools.models.contribution import Contribution
 from github_tools.models.developer import Developer
 from github_tools.models.time_period import TimePeriod
@@ -169,3 +171,47 @@ class TestDeveloperMetricAggregation:
         assert len(alice_repo1) == 5  # 2 commits, 2 PRs, 1 issue
         assert len(alice_repo2) == 1  # 1 commit
 
+
+class TestDeveloperAnalyzerRepositories:
+    """Tests for repository tracking in DeveloperAnalyzer."""
+    
+    def test_repositories_unique_in_first_seen_order(self, sample_contributions):
+        """Test that each repository is recorded once, in first-seen order."""
+        metrics = DeveloperAnalyzer().analyze(sample_contributions)
+        
+        alice = next(m for m in metrics if m.developer == "alice")
+        assert alice.repositories_contributed == ["myorg/repo1", "myorg/repo2"]
+    
+    def test_sorted_repositories_computed_once(self, sample_contributions):
+        """Test that the sorted repository tuple is cached and feeds to_dict."""
+        metrics = DeveloperAnalyzer().analyze(list(reversed(sample_contributions)))
+        
+        alice = next(m for m in metrics if m.developer == "alice")
+        assert alice.sorted_repositories == ("myorg/repo1", "myorg/repo2")
+        assert alice.sorted_repositories is alice.sorted_repositories
+        assert alice.to_dict()["repositories_contributed"] == ["myorg/repo1", "myorg/repo2"]
+    
+    def test_names_are_interned(self, sample_contributions):
+        """Test that usernames and repository names are interned at analysis time."""
+        metrics = DeveloperAnalyzer().analyze(sample_contributions)
+        
+        alice = next(m for m in metrics if m.developer == "alice")
+        assert alice.developer is sys.intern("alice")
+        for repo in alice.repositories_contributed:
+            assert repo is sys.intern(repo)
+        for repo in alice.per_repository_breakdown:
+            assert repo is sys.intern(repo)
+    
+    def test_repository_breakdown_counts(self, sample_contributions):
+        """Test that per-repository counts are kept on RepositoryBreakdown."""
+        metrics = DeveloperAnalyzer().analyze(sample_contributions)
+        
+        alice = next(m for m in metrics if m.developer == "alice")
+        assert alice.per_repository_breakdown["myorg/repo2"] == RepositoryBreakdown(commits=1)
+        assert alice.to_dict()["per_repository_breakdown"]["myorg/repo2"] == {
+            "commits": 1,
+            "pull_requests_created": 0,
+            "pull_requests_reviewed": 0,
+            "issues_created": 0,
+            "issues_resolved": 0,
+        }
@@ -0,0 +1,111 @@
+"""Unit tests for PR file collection."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from github_tools.api.rate_limiter import RateLimiter
+from github_tools.collectors.pr_file_collector import PRFileCollector
+from github_tools.utils.cache import FileCache
+from github_tools.utils.config import CacheConfig
+
+
+def _make_file(name: str) -> Mock:
+    """Create a mock PyGithub File."""
+    return Mock(
+        filename=name,
+        status="modified",
+        additions=3,
+        deletions=1,
+        patch="@@ -1 +1 @@",
+        sha="abc123",
+    )
+
+
+@pytest.fixture
+def github_client():
+    """Mock GitHub client whose PRs each have three files."""
+    client = Mock()
+    repo = Mock()
+    repo.get_pull.return_value.get_files.return_value = [
+        _make_file(f"src/file{i}.py") for i in range(3)
+    ]
+    client.github.get_repo.return_value = repo
+    return client
+
+
+@pytest.fixture
+def rate_limiter(tmp_path):
+    """Rate limiter without request spacing."""
+    return RateLimiter(checkpoint_dir=tmp_path / "checkpoints", min_time=0)
+
+
+class TestPRFileCollector:
+    """Tests for PRFileCollector."""
+
+    def test_collect_pr_files(self, github_client, rate_limiter):
+        """Test that PyGithub files are converted to PRFile objects."""
+        collector = PRFileCollector(github_client, rate_limiter)
+
+        files = collector.collect_pr_files("org/repo", 1)
+
+        assert [f.filename for f in files] == [
+            "src/file0.py",
+            "src/file1.py",
+            "src/file2.py",
+        ]
+        assert files[0].patch == "@@ -1 +1 @@"
+        assert files[0].sha == "abc123"
+
+    def test_repository_handle_is_reused(self, github_client, rate_limiter):
+        """Test that get_repo is called once per repository, not once per PR."""
+        collector = PRFileCollector(github_client, rate_limiter)
+
+        for pr_number in (1, 2, 3):
+            collector.collect_pr_files("org/repo", pr_number)
+
+        github_client.github.get_repo.assert_called_once_with("org/repo")
+
+    def test_stops_reading_files_past_max_files(self, github_client, rate_limiter):
+        """Test that only max_files + 1 files are pulled from the paginated list."""
+        consumed = []
+
+        def paginated_files():
+            for i in range(1000):
+                consumed.append(i)
+                yield _make_file(f"src/file{i}.py")
+
+        repo = github_client.github.get_repo.return_value
+        repo.get_pull.return_value.get_files.return_value = paginated_files()
+        collector = PRFileCollector(github_client, rate_limiter, max_files=5)
+
+        files = collector.collect_pr_files("org/repo", 1)
+
+        assert len(files) == 5
+        assert len(consumed) == 6
+
+    def test_cached_files_skip_file_listing(self, github_client, rate_limiter, tmp_path):
+        """Test that files cached for a head SHA are not re-fetched."""
+        cache = FileCache(CacheConfig(cache_dir=tmp_path / "cache"))
+        pull = github_client.github.get_repo.return_value.get_pull.return_value
+        pull.head.sha = "deadbeef"
+        collector = PRFileCollector(github_client, rate_limiter, cache)
+
+        first = collector.collect_pr_files("org/repo", 1)
+        second = collector.collect_pr_files("org/repo", 1)
+
+        assert second == first
+        pull.get_files.assert_called_once()
+
+    def test_new_head_sha_invalidates_cache(self, github_client, rate_limiter, tmp_path):
+        """Test that a new head SHA triggers a fresh file listing."""
+        cache = FileCache(CacheConfig(cache_dir=tmp_path / "cache"))
+        pull = github_client.github.get_repo.return_value.get_pull.return_value
+        pull.head.sha = "deadbeef"
+        collector = PRFileCollector(github_client, rate_limiter, cache)
+
+        collector.collect_pr_files("org/repo", 1)
+        pull.head.sha = "cafef00d"
+        collector.collect_pr_files("org/repo", 1)
+
+        assert pull.get_files.call_count == 2
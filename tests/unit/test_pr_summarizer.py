@@ -1,11 +1,19 @@
 """Unit tests for PR summarization logic."""
 
+import json
+import threading
 from datetime import datetime
 from unittest.mock import Mock, patch
 
 import pytest
 
+from github_tools.collectors.pr_summary_collector import PRSummaryCollector
 from github_tools.models.contribution import Contribution
+from github_tools.models.time_period import TimePeriod
+from github_tools.summarizers.file_pattern_detector import PRFile
+from github_tools.summarizers.llm_summarizer import LLMSummarizer
+from github_tools.utils.cache import FileCache
+from github_tools.utils.config import CacheConfig
 
 
 @pytest.fixture
@@ -29,6 +37,20 @@ def sample_pr():
     )
 
 
+def _barrier_summarizer(parties: int) -> LLMSummarizer:
+    """Summarizer whose provider only returns once `parties` calls are in flight."""
+    barrier = threading.Barrier(parties, timeout=5)
+    
+    def summarize(prompt, **kwargs):
+        barrier.wait()
+        return next(line for line in prompt.split("\n") if line.startswith("PR Title:"))
+    
+    provider = Mock()
+    provider.summarize.side_effect = summarize
+    provider.get_metadata.return_value = {"name": "mock"}
+    return LLMSummarizer(provider=provider, auto_detect=False)
+
+
 class TestPRSummarization:
     """Tests for PR summarization logic."""
     
@@ -76,6 +98,54 @@ class TestPRSummarization:
         # Actual implementation will call OpenAI API
         assert sample_pr.metadata is not None
     
+    def test_fallback_summary_uses_first_sentence(self):
+        """Test that the fallback summary keeps only the body's first sentence."""
+        summarizer = _barrier_summarizer(1)
+        body = "Moves retries into the HTTP client layer. Also renames two helpers."
+        
+        assert summarizer._fallback_summary("Refactor retries", body) == (
+            "Refactor retries. Moves retries into the HTTP client layer."
+        )
+        assert summarizer._fallback_summary("Bump deps", "") == "Bump deps"
+    
+    def test_dimensional_analyzer_shared_across_summarizers(self, sample_pr):
+        """Test that summarizers reuse one process-wide dimensional analyzer."""
+        first, second = _barrier_summarizer(1), _barrier_summarizer(1)
+        
+        first.summarize_dimensional(sample_pr, [], use_llm=False)
+        second.summarize_dimensional(sample_pr, [], use_llm=False)
+        
+        assert first._dimensional_analyzer is second._dimensional_analyzer
+    
+    def test_dimensional_fallback_reuses_file_patterns(self, sample_pr):
+        """Test that the rule-based fallback doesn't re-detect file patterns."""
+        summarizer = _barrier_summarizer(1)
+        summarizer.provider.summarize.side_effect = RuntimeError("timeout")
+        files = [PRFile("infra/main.tf", "added", 5, 0)]
+        summarizer.summarize_dimensional(sample_pr, files, use_llm=False)
+        detector = summarizer._dimensional_analyzer.pattern_detector
+        
+        with patch.object(detector, "detect_patterns", wraps=detector.detect_patterns) as detect:
+            result = summarizer.summarize_dimensional(sample_pr, files)
+        
+        detect.assert_called_once_with(files)
+        assert result["dimensions"]["cost"]["is_applicable"] is True
+    
+    def test_fallback_provider_created_once(self, sample_pr):
+        """Test that fallback providers are reused across summaries."""
+        summarizer = _barrier_summarizer(1)
+        fallback = Mock()
+        fallback.is_available.return_value = True
+        fallback.summarize.return_value = "Fallback summary"
+        
+        with patch("github_tools.summarizers.llm_summarizer.get_provider", return_value=fallback) as get:
+            for _ in range(3):
+                result = summarizer.summarize_with_fallback(sample_pr, fallback_providers=["local"])
+        
+        assert result == "Fallback summary"
+        get.assert_called_once()
+        assert fallback.summarize.call_count == 3
+    
     def test_summary_length_validation(self):
         """Test that summaries meet length requirements."""
         # Summaries should be concise (e.g., max 200 characters)
@@ -84,3 +154,208 @@ class TestPRSummarization:
         
         assert len(test_summary) <= max_length
 
+
+
+class TestPRSummaryCollector:
+    """Tests for PR summary collection."""
+    
+    def test_iter_summaries_yields_incrementally(self, sample_pr):
+        """Test that summaries are yielded as each PR is summarized."""
+        summarizer = Mock()
+        summarizer.summarize.return_value = "Adds a new feature."
+        summarizer.provider.get_metadata.return_value = {"name": "openai"}
+        collector = PRSummaryCollector(summarizer, auto_retry=False)
+        time_period = TimePeriod(
+            start_date=datetime(2024, 12, 1),
+            end_date=datetime(2024, 12, 31),
+            period_type="custom",
+        )
+        
+        summaries = collector.iter_summaries([sample_pr, sample_pr], time_period)
+        first = next(summaries)
+        
+        assert summarizer.summarize.call_count == 1
+        assert first["summary"] == "Adds a new feature."
+        assert first["number"] == 42
+        assert len(list(summaries)) == 1
+    
+    def test_presorted_contributions_filtered_by_window(self, sample_pr):
+        """Test that presorted input is sliced to the time period window."""
+        summarizer = Mock()
+        summarizer.summarize.return_value = "Summary."
+        summarizer.provider.get_metadata.return_value = {"name": "openai"}
+        contributions = [
+            sample_pr.model_copy(update={"id": f"pr-{day}", "timestamp": datetime(2024, 12, day)})
+            for day in range(1, 29)
+        ]
+        time_period = TimePeriod(
+            start_date=datetime(2024, 12, 10),
+            end_date=datetime(2024, 12, 12),
+            period_type="custom",
+        )
+        
+        presorted = PRSummaryCollector(summarizer, auto_retry=False, presorted=True)
+        unsorted = PRSummaryCollector(summarizer, auto_retry=False)
+        
+        expected = ["pr-10", "pr-11", "pr-12"]
+        assert [s["id"] for s in presorted.collect_summaries(contributions, time_period)] == expected
+        assert [s["id"] for s in unsorted.collect_summaries(contributions, time_period)] == expected
+    
+    def test_concurrent_first_pass(self, sample_pr):
+        """Test that max_concurrency overlaps provider calls and keeps PR order."""
+        prs = [
+            sample_pr.model_copy(update={"id": f"pr-{i}", "title": f"Change {i}"})
+            for i in range(3)
+        ]
+        time_period = TimePeriod(
+            start_date=datetime(2024, 12, 1),
+            end_date=datetime(2024, 12, 31),
+            period_type="custom",
+        )
+        collector = PRSummaryCollector(_barrier_summarizer(3), auto_retry=False, max_concurrency=3)
+        
+        summaries = collector.collect_summaries(prs, time_period)
+        
+        assert [s["id"] for s in summaries] == ["pr-0", "pr-1", "pr-2"]
+        assert [s["summary"] for s in summaries] == [
+            "PR Title: Change 0", "PR Title: Change 1", "PR Title: Change 2",
+        ]
+
+
+class TestSummarizeMany:
+    """Tests for LLMSummarizer.summarize_many."""
+    
+    def test_results_in_input_order(self, sample_pr):
+        """Test that concurrent results are yielded in input order."""
+        prs = [sample_pr.model_copy(update={"title": f"Change {i}"}) for i in range(4)]
+        summarizer = _barrier_summarizer(4)
+        
+        results = list(summarizer.summarize_many(prs, max_concurrency=4))
+        
+        assert results == [f"PR Title: Change {i}" for i in range(4)]
+    
+    @pytest.mark.parametrize("max_concurrency", [1, 2])
+    def test_errors_are_yielded(self, sample_pr, max_concurrency):
+        """Test that a failing contribution yields its exception in place."""
+        issue = sample_pr.model_copy(update={"type": "issue"})
+        summarizer = _barrier_summarizer(1)
+        
+        results = list(
+            summarizer.summarize_many([sample_pr, issue], max_concurrency=max_concurrency)
+        )
+        
+        assert results[0] == "PR Title: Add new feature"
+        assert isinstance(results[1], ValueError)
+
+
+class TestSummaryCache:
+    """Tests for caching generated summaries."""
+    
+    @staticmethod
+    def _summarizer(cache, model="gpt-4o-mini", stream_max_sentences=None):
+        provider = Mock(
+            model=model,
+            max_tokens=150,
+            temperature=0.3,
+            stream_max_sentences=stream_max_sentences,
+        )
+        provider.summarize.return_value = "Adds a new feature."
+        provider.get_metadata.return_value = {"name": "openai"}
+        return LLMSummarizer(provider=provider, auto_detect=False, cache=cache)
+    
+    def test_repeated_prompt_skips_provider(self, sample_pr, tmp_path):
+        """Test that an identical prompt is answered from the cache."""
+        cache = FileCache(CacheConfig(cache_dir=tmp_path / "cache"))
+        summarizer = self._summarizer(cache)
+        
+        first = summarizer.summarize(sample_pr)
+        second = self._summarizer(cache).summarize(sample_pr)
+        
+        assert first == second == "Adds a new feature."
+        summarizer.provider.summarize.assert_called_once()
+    
+    def test_changed_prompt_or_model_misses(self, sample_pr, tmp_path):
+        """Test that a different prompt or model is sent to the provider."""
+        cache = FileCache(CacheConfig(cache_dir=tmp_path / "cache"))
+        self._summarizer(cache).summarize(sample_pr)
+        
+        other_model = self._summarizer(cache, model="gpt-4o")
+        other_model.summarize(sample_pr)
+        other_prompt = self._summarizer(cache)
+        other_prompt.summarize(sample_pr, repository_context="Payments service")
+        
+        other_model.provider.summarize.assert_called_once()
+        other_prompt.provider.summarize.assert_called_once()
+    
+    def test_changed_sentence_limit_misses(self, sample_pr, tmp_path):
+        """Test that a different streaming sentence limit is sent to the provider."""
+        cache = FileCache(CacheConfig(cache_dir=tmp_path / "cache"))
+        self._summarizer(cache).summarize(sample_pr)
+        
+        limited = self._summarizer(cache, stream_max_sentences=1)
+        limited.summarize(sample_pr)
+        
+        limited.provider.summarize.assert_called_once()
+    
+    def test_fallback_summary_not_cached(self, sample_pr, tmp_path):
+        """Test that a provider failure is retried instead of served from cache."""
+        cache = FileCache(CacheConfig(cache_dir=tmp_path / "cache"))
+        summarizer = self._summarizer(cache)
+        summarizer.provider.summarize.side_effect = [RuntimeError("timeout"), "Adds a new feature."]
+        
+        summarizer.summarize(sample_pr)
+        
+        assert summarizer.summarize(sample_pr) == "Adds a new feature."
+    
+    def test_repeated_dimensional_analysis_skips_provider(self, sample_pr, tmp_path):
+        """Test that an identical dimensional analysis request is answered from the cache."""
+        cache = FileCache(CacheConfig(cache_dir=tmp_path / "cache"))
+        summarizer = self._summarizer(cache)
+        summarizer.provider.summarize.return_value = (
+            '{"summary": "Adds a new feature.", "dimensions": {}}'
+        )
+        files = [PRFile("src/feature.py", "added", 40, 0)]
+        
+        first = summarizer.summarize_dimensional(sample_pr, files)
+        second = summarizer.summarize_dimensional(sample_pr, files)
+        summarizer.summarize_dimensional(sample_pr, files + [PRFile("infra/main.tf", "added", 5, 0)])
+        
+        assert first == second
+        assert summarizer.provider.summarize.call_count == 2
+
+
+class TestSummarizeDimensionalMany:
+    """Tests for LLMSummarizer.summarize_dimensional_many."""
+    
+    def test_results_in_input_order(self, sample_pr):
+        """Test that concurrent analyses are yielded in input order."""
+        prs = [sample_pr.model_copy(update={"title": f"Change {i}"}) for i in range(3)]
+        summarizer = _barrier_summarizer(3)
+        title_line = summarizer.provider.summarize.side_effect
+        summarizer.provider.summarize.side_effect = lambda prompt, **kwargs: json.dumps(
+            {"summary": title_line(prompt), "dimensions": {}}
+        )
+        
+        results = list(
+            summarizer.summarize_dimensional_many(
+                [(pr, []) for pr in prs], max_concurrency=3
+            )
+        )
+        
+        assert [result["summary"] for result in results] == [
+            f"PR Title: Change {i}" for i in range(3)
+        ]
+    
+    def test_errors_are_yielded(self, sample_pr):
+        """Test that a failing contribution yields its exception in place."""
+        issue = sample_pr.model_copy(update={"type": "issue"})
+        summarizer = _barrier_summarizer(1)
+        
+        results = list(
+            summarizer.summarize_dimensional_many(
+                [(sample_pr, []), (issue, [])], use_llm=False, max_concurrency=2
+            )
+        )
+        
+        assert results[0]["summary"].startswith("Add new feature")
+        assert isinstance(results[1], ValueError)
@@ -0,0 +1,62 @@
+"""Unit tests for rate limiter request throttling."""
+
+import threading
+import time
+from itertools import pairwise
+
+import pytest
+
+from github_tools.api.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def checkpoint_dir(tmp_path):
+    """Temporary checkpoint directory."""
+    return tmp_path / "checkpoints"
+
+
+class TestRateLimiterSlot:
+    """Tests for min_time / max_concurrent request throttling."""
+
+    def test_slot_spaces_request_starts(self, checkpoint_dir):
+        """Test that consecutive slots are at least min_time apart."""
+        limiter = RateLimiter(checkpoint_dir=checkpoint_dir, min_time=0.05)
+
+        starts = []
+        for _ in range(3):
+            with limiter.slot():
+                starts.append(time.monotonic())
+
+        gaps = [b - a for a, b in pairwise(starts)]
+        assert all(gap >= 0.045 for gap in gaps)
+
+    def test_slot_caps_concurrent_requests(self, checkpoint_dir):
+        """Test that no more than max_concurrent slots are held at once."""
+        limiter = RateLimiter(checkpoint_dir=checkpoint_dir, min_time=0, max_concurrent=2)
+
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def worker():
+            nonlocal in_flight, peak
+            with limiter.slot():
+                with lock:
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                time.sleep(0.02)
+                with lock:
+                    in_flight -= 1
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak <= 2
+
+    def test_invalid_max_concurrent(self, checkpoint_dir):
+        """Test that max_concurrent must be positive."""
+        with pytest.raises(ValueError):
+            RateLimiter(checkpoint_dir=checkpoint_dir, max_concurrent=0)
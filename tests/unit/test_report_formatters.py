@@ -0,0 +1,326 @@
+"""Unit tests for report formatters."""
+
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from github_tools.reports.formatters import json as json_formatter
+from github_tools.reports.formatters.csv import CSVFormatter
+from github_tools.reports.formatters.json import JSONFormatter
+from github_tools.reports.formatters.markdown import MarkdownFormatter
+
+
+@pytest.fixture
+def developer_report_data():
+    """Sample developer report data."""
+    return {
+        "metadata": {
+            "generated_at": "2024-12-31T00:00:00",
+            "tool_version": "0.1.0",
+            "period": {
+                "start_date": "2024-12-01T00:00:00",
+                "end_date": "2024-12-31T00:00:00",
+            },
+        },
+        "summary": {"total_developers": 2, "total_contributions": 15},
+        "developers": [
+            {
+                "username": "alice",
+                "total_commits": 5,
+                "pull_requests_created": 2,
+                "pull_requests_reviewed": 3,
+                "pull_requests_merged": 1,
+                "issues_created": 0,
+                "issues_resolved": 1,
+                "code_review_participation": 0.5,
+                "repositories_contributed": ["myorg/repo1", "myorg/repo2"],
+                "per_repository_breakdown": {
+                    "myorg/repo1": {
+                        "commits": 4,
+                        "pull_requests_created": 2,
+                        "pull_requests_reviewed": 1,
+                    },
+                },
+            },
+            {
+                "username": "bob",
+                "total_commits": 3,
+                "pull_requests_created": 1,
+                "pull_requests_reviewed": 0,
+                "pull_requests_merged": 1,
+                "issues_created": 2,
+                "issues_resolved": 0,
+                "code_review_participation": 0.0,
+                "repositories_contributed": ["myorg/repo1"],
+            },
+        ],
+    }
+
+
+@pytest.fixture
+def pr_summary_report_data():
+    """Sample PR summary report data."""
+    pr = {
+        "id": "pr-42",
+        "title": "Add new feature",
+        "repository": "myorg/repo1",
+        "author": "alice",
+        "created_at": datetime(2024, 12, 15, 10, 0, 0),
+        "state": "merged",
+        "summary": "Adds a new feature.",
+    }
+    return {
+        "metadata": {
+            "generated_at": "2024-12-31T00:00:00",
+            "tool_version": "0.1.0",
+            "period": {
+                "start_date": "2024-12-01T00:00:00",
+                "end_date": "2024-12-31T00:00:00",
+            },
+        },
+        "summary": {"total_prs": 1, "repositories": 1},
+        "pull_requests": [pr],
+        "by_repository": {"myorg/repo1": [pr]},
+    }
+
+
+class TestJSONFormatter:
+    """Tests for JSONFormatter."""
+
+    def test_datetimes_serialized_as_iso(self, pr_summary_report_data):
+        """Test that datetimes are written in ISO 8601 format."""
+        output = JSONFormatter().format_pr_summary_report(pr_summary_report_data)
+
+        parsed = json.loads(output)
+        assert parsed["pull_requests"][0]["created_at"] == "2024-12-15T10:00:00"
+
+    def test_stdlib_fallback_matches_orjson(self, pr_summary_report_data, monkeypatch):
+        """Test that the stdlib fallback produces the same document."""
+        fast = json.loads(json_formatter.dumps(pr_summary_report_data))
+
+        monkeypatch.setattr(json_formatter, "orjson", None)
+        fallback = json.loads(json_formatter.dumps(pr_summary_report_data))
+
+        assert fast == fallback
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_unsupported_types_raise(self, monkeypatch, use_orjson):
+        """Test that non-JSON values are rejected instead of stringified."""
+        if not use_orjson:
+            monkeypatch.setattr(json_formatter, "orjson", None)
+
+        with pytest.raises(TypeError):
+            json_formatter.dumps({"value": object()})
+
+    def test_compact_by_default(self, developer_report_data):
+        """Test that output is compact unless pretty printing is requested."""
+        compact = JSONFormatter().format_developer_report(developer_report_data)
+        pretty = JSONFormatter(pretty=True).format_developer_report(developer_report_data)
+
+        assert "\n" not in compact
+        assert pretty.startswith('{\n  "metadata": {')
+        assert json.loads(compact) == json.loads(pretty)
+
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_stdlib_fallback_matches_orjson_text(self, developer_report_data, monkeypatch, pretty):
+        """Test that both encoders emit identical text for ASCII data."""
+        fast = json_formatter.dumps(developer_report_data, pretty=pretty)
+
+        monkeypatch.setattr(json_formatter, "orjson", None)
+        fallback = json_formatter.dumps(developer_report_data, pretty=pretty)
+
+        assert fast == fallback
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_write_streams_iterators(self, developer_report_data, monkeypatch, pretty, use_orjson):
+        """Test that write() with lazy rows matches formatting the full report."""
+        if not use_orjson:
+            monkeypatch.setattr(json_formatter, "orjson", None)
+        formatter = JSONFormatter(pretty=pretty)
+        expected = formatter.format_developer_report(developer_report_data)
+
+        out = io.StringIO()
+        formatter.write(
+            {**developer_report_data, "developers": iter(developer_report_data["developers"])},
+            out,
+        )
+
+        assert out.getvalue() == expected
+
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_write_empty_iterator(self, developer_report_data, pretty):
+        """Test that an exhausted iterator is written as an empty array."""
+        developer_report_data["developers"] = []
+        formatter = JSONFormatter(pretty=pretty)
+
+        out = io.StringIO()
+        formatter.write({**developer_report_data, "developers": iter([])}, out)
+
+        assert out.getvalue() == formatter.format_developer_report(developer_report_data)
+
+
+class TestCSVFormatter:
+    """Tests for CSVFormatter."""
+
+    def test_quoting_matches_csv_module(self, pr_summary_report_data):
+        """Test that fields needing quotes are escaped like csv.writer does."""
+        pr = pr_summary_report_data["pull_requests"][0]
+        pr["title"] = 'Fix "quoted", comma'
+        pr["summary"] = "Line one\nLine two\r\nLine three"
+        pr["created_at"] = "2024-12-15T10:00:00"
+
+        output = CSVFormatter().format_pr_summary_report(pr_summary_report_data)
+
+        expected = io.StringIO()
+        writer = csv.writer(expected)
+        writer.writerow(["id", "title", "repository", "author", "created_at", "state", "summary"])
+        writer.writerow([
+            pr["id"], pr["title"], pr["repository"], pr["author"],
+            pr["created_at"], pr["state"], pr["summary"],
+        ])
+        assert output == expected.getvalue()
+
+    def test_developer_report_rows(self, developer_report_data):
+        """Test developer rows round-trip through the csv reader."""
+        output = CSVFormatter().format_developer_report(developer_report_data)
+
+        rows = list(csv.reader(io.StringIO(output)))
+        assert rows[0][0] == "username"
+        assert rows[1] == [
+            "alice", "5", "2", "3", "1", "0", "1", "0.5", "myorg/repo1,myorg/repo2",
+        ]
+        assert rows[2][-1] == "myorg/repo1"
+
+    def test_stream_yields_one_line_per_row(self, developer_report_data):
+        """Test that streaming yields the header then one line per developer."""
+        formatter = CSVFormatter()
+
+        lines = list(formatter.stream_developer_report(developer_report_data))
+
+        assert len(lines) == 3
+        assert all(line.endswith("\r\n") for line in lines)
+        assert "".join(lines) == formatter.format_developer_report(developer_report_data)
+
+    def test_bytes_variant_is_utf8_of_str(self, pr_summary_report_data):
+        """Test that the bytes variant is the UTF-8 encoding of the str output."""
+        pr_summary_report_data["pull_requests"][0]["title"] = "Añadir función ⚠️"
+        formatter = CSVFormatter()
+
+        output = formatter.format_pr_summary_report_bytes(pr_summary_report_data)
+
+        assert output == formatter.format_pr_summary_report(pr_summary_report_data).encode("utf-8")
+
+
+class TestMarkdownFormatter:
+    """Tests for MarkdownFormatter."""
+
+    def test_developer_table(self, developer_report_data):
+        """Test that the developer table has a header and one row per developer."""
+        output = MarkdownFormatter().format_developer_report(developer_report_data)
+
+        lines = output.split("\n")
+        header_index = lines.index("## Developers") + 2
+        assert lines[header_index].startswith("| Username | Commits |")
+        assert lines[header_index + 1].startswith("|----------|")
+        assert lines[header_index + 2] == (
+            "| alice | 5 | 2 | 3 | 1 | 0 | 1 | myorg/repo1, myorg/repo2 |"
+        )
+        assert lines[header_index + 3] == "| bob | 3 | 1 | 0 | 1 | 2 | 0 | myorg/repo1 |"
+
+    def test_per_repository_breakdown(self, developer_report_data):
+        """Test that only developers with a breakdown get a breakdown section."""
+        output = MarkdownFormatter().format_developer_report(developer_report_data)
+
+        assert "## Per-Repository Breakdown" in output
+        assert "### alice" in output
+        assert "### bob" not in output
+        assert "- Commits: 4" in output
+
+    def test_breakdown_flag_skips_probe(self, developer_report_data):
+        """Test that a false has_per_repository_breakdown flag is trusted."""
+        developer_report_data["metadata"]["has_per_repository_breakdown"] = False
+
+        output = MarkdownFormatter().format_developer_report(developer_report_data)
+
+        assert "## Per-Repository Breakdown" not in output
+
+    def test_stream_matches_format(self, pr_summary_report_data):
+        """Test that joining the streamed lines reproduces the formatted report."""
+        formatter = MarkdownFormatter()
+
+        lines = list(formatter.stream_pr_summary_report(pr_summary_report_data))
+
+        assert lines[0] == "# Pull Request Summary Report"
+        assert "\n".join(lines) == formatter.format_pr_summary_report(pr_summary_report_data)
+
+    def test_contribution_distribution_top_ten(self):
+        """Test that only the ten largest contributors are listed, largest first."""
+        report_data = {
+            "metadata": {
+                "generated_at": "2024-12-31T00:00:00",
+                "tool_version": "0.1.0",
+                "period": {"start_date": "2024-12-01", "end_date": "2024-12-31"},
+            },
+            "summary": {"total_repositories": 1},
+            "repositories": [
+                {
+                    "repository": "myorg/repo1",
+                    "total_contributions": 78,
+                    "active_contributors": 12,
+                    "commits": 78,
+                    "pull_requests": 0,
+                    "issues": 0,
+                    "reviews": 0,
+                    "contribution_distribution": {f"dev{i}": i for i in range(13)},
+                },
+            ],
+        }
+
+        output = MarkdownFormatter().format_repository_report(report_data)
+
+        listed = [line for line in output.split("\n") if line.startswith("- dev")]
+        assert listed == [f"- dev{i}: {i} contributions" for i in range(12, 2, -1)]
+
+
+class TestFormatDispatch:
+    """Tests for ReportFormatter.format and format_all."""
+
+    @pytest.mark.parametrize("formatter_cls", [CSVFormatter, JSONFormatter, MarkdownFormatter])
+    def test_format_dispatches_by_type(self, formatter_cls, developer_report_data):
+        """Test that format() routes to the matching format_*_report method."""
+        formatter = formatter_cls()
+
+        output = formatter.format("developer", developer_report_data)
+
+        assert output == formatter.format_developer_report(developer_report_data)
+
+    def test_format_unknown_type(self, developer_report_data):
+        """Test that format() rejects an unsupported report type."""
+        with pytest.raises(ValueError, match="velocity"):
+            CSVFormatter().format("velocity", developer_report_data)
+
+    @pytest.mark.parametrize("formatter_cls", [CSVFormatter, JSONFormatter, MarkdownFormatter])
+    def test_matches_individual_formatting(
+        self, formatter_cls, developer_report_data, pr_summary_report_data
+    ):
+        """Test that batch formatting matches formatting each report on its own."""
+        formatter = formatter_cls()
+
+        outputs = formatter.format_all({
+            "developer": developer_report_data,
+            "pr_summary": pr_summary_report_data,
+        })
+
+        assert outputs == {
+            "developer": formatter.format_developer_report(developer_report_data),
+            "pr_summary": formatter.format_pr_summary_report(pr_summary_report_data),
+        }
+
+    def test_unknown_report_type(self, developer_report_data):
+        """Test that an unsupported report type is rejected."""
+        with pytest.raises(ValueError, match="velocity"):
+            JSONFormatter().format_all({"velocity": developer_report_data})
@@ -0,0 +1,99 @@
+"""Unit tests for report generator."""
+
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from github_tools.analyzers.developer_analyzer import DeveloperMetrics
+from github_tools.models.time_period import TimePeriod
+from github_tools.reports.generator import ReportGenerator
+
+
+def _time_period() -> TimePeriod:
+    """Create a December 2024 time period."""
+    return TimePeriod(
+        start_date=datetime(2024, 12, 1),
+        end_date=datetime(2024, 12, 31),
+        period_type="monthly",
+    )
+
+
+
+def _developer_metrics(time_period: TimePeriod) -> list:
+    """Create two developers, one with a per-repository breakdown."""
+    alice = DeveloperMetrics("alice", time_period)
+    alice.total_commits = 4
+    alice.repositories_contributed = ["myorg/repo2", "myorg/repo1"]
+    alice.per_repository_breakdown["myorg/repo1"].commits = 4
+    bob = DeveloperMetrics("bob", time_period)
+    bob.pull_requests_created = 1
+    bob.repositories_contributed = ["myorg/repo1"]
+    return [alice, bob]
+
+
+class TestReportGenerator:
+    """Tests for ReportGenerator."""
+
+    def test_period_dates_are_iso(self):
+        """Test that report periods use the TimePeriod ISO strings."""
+        report = json.loads(
+            ReportGenerator().generate_developer_report([], _time_period(), format="json")
+        )
+
+        assert report["metadata"]["period"] == {
+            "start_date": "2024-12-01T00:00:00",
+            "end_date": "2024-12-31T00:00:00",
+        }
+
+    def test_generated_at_shared_across_reports(self):
+        """Test that reports from one generator carry the same generated_at."""
+        generator = ReportGenerator()
+        time_period = _time_period()
+
+        developer = json.loads(generator.generate_developer_report([], time_period, format="json"))
+        team = json.loads(generator.generate_team_report([], time_period, format="json"))
+
+        assert developer["metadata"]["generated_at"] == team["metadata"]["generated_at"]
+
+    def test_multi_format_builds_data_once(self, monkeypatch):
+        """Test that several formats share a single report data build."""
+        generator = ReportGenerator()
+        time_period = _time_period()
+        build = generator._build_team_report_data
+        calls = []
+
+        def counting_build(*args):
+            calls.append(args)
+            return build(*args)
+
+        monkeypatch.setattr(generator, "_build_team_report_data", counting_build)
+
+        outputs = generator.generate_team_reports([], time_period, ["json", "markdown", "csv"])
+
+        assert len(calls) == 1
+        assert list(outputs) == ["json", "markdown", "csv"]
+        assert outputs["csv"] == generator.generate_team_report([], time_period, format="csv")
+
+    def test_unsupported_format_rejected_before_build(self, monkeypatch):
+        """Test that an unknown format fails before any report data is built."""
+        generator = ReportGenerator()
+        monkeypatch.setattr(generator, "_build_developer_report_data", None)
+
+        with pytest.raises(ValueError, match="xml"):
+            generator.generate_developer_reports([], _time_period(), ["json", "xml"])
+
+    @pytest.mark.parametrize("format", ["json", "csv", "markdown"])
+    def test_write_developer_report_matches_generate(self, format):
+        """Test that the streaming writer produces the same text as generate."""
+        generator = ReportGenerator()
+        time_period = _time_period()
+        metrics = _developer_metrics(time_period)
+
+        out = io.StringIO()
+        generator.write_developer_report(metrics, time_period, out, format=format)
+
+        assert out.getvalue() == generator.generate_developer_report(
+            metrics, time_period, format=format
+        )